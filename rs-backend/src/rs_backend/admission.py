@@ -0,0 +1,133 @@
+"""Admission control: bounded concurrency per route class, with load shedding.
+
+When Sheets slows down, every request holds a worker thread on a blocked API
+call. Without a bound they pile up until memory and latency run away. Each
+route class (writes, reports, stories) therefore admits a fixed number of
+concurrent requests, queues a few more for a short time, and answers the rest
+at once with ``503`` and ``Retry-After``, so clients (the PWA retries queued
+submissions) back off instead of hanging.
+
+Queue depth, in-flight requests and shed counts are exported via /metrics.
+"""
+
+import asyncio
+from collections import deque
+
+from fastapi import Request
+from fastapi.responses import JSONResponse
+from loguru import logger
+
+from rs_backend.metrics import ADMISSION_SHED
+from rs_backend.settings import Settings
+
+WRITE_PATHS = frozenset(
+    {"/ministering/", "/missionary-experience/", "/stories/", "/ingest/batch"}
+)
+REPORT_PATHS = frozenset(
+    {"/ministering/reports", "/missionary-experience/reports", "/history/cfm-survey"}
+)
+STORY_READ_PATHS = frozenset({"/stories/", "/stories/search"})
+
+
+def route_class(method: str, path: str) -> str | None:
+    """Return the admission class of a request, or None if it is not limited."""
+    if method == "POST" and path in WRITE_PATHS:
+        return "writes"
+    if method == "GET" and path in REPORT_PATHS:
+        return "reports"
+    if method == "GET" and path in STORY_READ_PATHS:
+        return "stories"
+    return None
+
+
+class AdmissionLimiter:
+    """Concurrency limit with a bounded FIFO wait queue and a queueing deadline."""
+
+    def __init__(
+        self, max_concurrent: int, max_queue: int, queue_timeout_seconds: float
+    ) -> None:
+        """Admit ``max_concurrent`` requests; queue up to ``max_queue`` more for a while."""
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.queue_timeout_seconds = queue_timeout_seconds
+        self.in_flight = 0
+        self._waiters: deque[asyncio.Future] = deque()
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self._waiters)
+
+    async def acquire(self) -> str | None:
+        """Wait for a slot; return None once admitted, or the reason the request is shed."""
+        if self.in_flight < self.max_concurrent and not self._waiters:
+            self.in_flight += 1
+            return None
+        if self.queue_depth >= self.max_queue:
+            return "queue_full"
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            # release() hands its slot straight to the waiter, so in_flight is unchanged
+            await asyncio.wait_for(waiter, self.queue_timeout_seconds)
+            return None
+        except TimeoutError:
+            return "queue_timeout"
+        except asyncio.CancelledError:
+            # Client went away; give back a slot handed over at the last moment
+            if waiter.done() and not waiter.cancelled():
+                self.release()
+            raise
+        finally:
+            if waiter in self._waiters and waiter.cancelled():
+                self._waiters.remove(waiter)
+
+    def release(self) -> None:
+        """Free a slot, handing it to the oldest live waiter if there is one."""
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self.in_flight -= 1
+
+
+def build_limiters(settings: Settings) -> dict[str, AdmissionLimiter]:
+    """Create one limiter per route class from settings."""
+    concurrency = {
+        "writes": settings.admission_writes_concurrency,
+        "reports": settings.admission_reports_concurrency,
+        "stories": settings.admission_stories_concurrency,
+    }
+    return {
+        name: AdmissionLimiter(
+            max_concurrent=limit,
+            max_queue=settings.admission_queue_size,
+            queue_timeout_seconds=settings.admission_queue_timeout_seconds,
+        )
+        for name, limit in concurrency.items()
+    }
+
+
+async def admission_middleware(request: Request, call_next):
+    """Admit, queue or shed the request according to its route class."""
+    name = route_class(request.method, request.url.path)
+    limiters: dict[str, AdmissionLimiter] = request.app.state.admission_limiters
+    if name is None or name not in limiters:
+        return await call_next(request)
+
+    limiter = limiters[name]
+    shed_reason = await limiter.acquire()
+    if shed_reason is not None:
+        ADMISSION_SHED.inc(name, shed_reason)
+        logger.warning("Request shed", route_class=name, reason=shed_reason)
+        settings: Settings = request.app.state.settings
+        return JSONResponse(
+            status_code=503,
+            content={"detail": "Server is busy; retry later."},
+            headers={"Retry-After": str(settings.admission_retry_after_seconds)},
+        )
+    try:
+        return await call_next(request)
+    finally:
+        limiter.release()
@@ -0,0 +1,248 @@
+"""Microbenchmarks for ``SurveyDataService`` implementations.
+
+Seeds a backend with synthetic rows at increasing sizes (e.g. 10k, 100k, 1M
+per dataset) and times every service method at each size: latency
+percentiles, throughput and peak traced allocation. Results are written as
+JSON so runs before and after a storage change can be compared. Run through
+``rs-backend bench``.
+"""
+
+import collections
+import math
+import platform
+import random
+import resource
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable, Iterator
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+
+from rs_backend.questions import QUESTIONS, persisted_question_text
+from rs_backend.schemas.enums import Dataset, Organization
+from rs_backend.services.base import SurveyDataService
+from rs_backend.timestamps import now_epoch
+
+DEFAULT_ROW_COUNTS = (10_000, 100_000, 1_000_000)
+SEED_CHUNK_SIZE = 5_000
+
+# Every benchmarked operation, one per SurveyDataService method (plus the sort
+# GET /stories/ applies to get_stories)
+METHODS = (
+    "save_ministering_event",
+    "save_missionary_experience_answer",
+    "save_story",
+    "append_dataset_rows",
+    "get_ministering_reports",
+    "get_missionary_experience_report",
+    "get_stories",
+    "get_stories_sorted",
+    "iter_dataset_rows",
+)
+
+_WORDS = [
+    "we",
+    "prayed",
+    "for",
+    "the",
+    "missionaries",
+    "and",
+    "invited",
+    "our",
+    "neighbor",
+    "to",
+    "church",
+    "she",
+    "shared",
+    "a",
+    "scripture",
+    "with",
+    "a",
+    "friend",
+    "who",
+    "asked",
+    "about",
+    "the",
+    "temple",
+]
+
+
+@dataclass
+class MethodResult:
+    """Timings for one service method at one dataset size."""
+
+    rows: int
+    method: str
+    iterations: int
+    ops_per_sec: float
+    mean_ms: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    max_ms: float
+    peak_alloc_bytes: int
+
+
+def percentile(sorted_values: list[float], fraction: float) -> float:
+    """Nearest-rank percentile of already sorted values."""
+    index = max(0, math.ceil(fraction * len(sorted_values)) - 1)
+    return sorted_values[index]
+
+
+def _synthetic_rows(dataset: Dataset, count: int, rng: random.Random) -> Iterator[list]:
+    """Yield ``count`` plausible rows for ``dataset``, spread over the past year."""
+    organizations = [organization.value for organization in Organization]
+    now = now_epoch()
+    for _ in range(count):
+        submitted = now - rng.randrange(365 * 24 * 3600)
+        if dataset is Dataset.MINISTERING_EVENTS:
+            yield [submitted, rng.choice(organizations)]
+        elif dataset is Dataset.MISSIONARY_EXPERIENCES:
+            question = rng.choice(QUESTIONS)
+            yield [
+                submitted,
+                rng.choice(organizations),
+                str(question.id),
+                persisted_question_text(question, "helped a neighbor move"),
+            ]
+        else:
+            yield [submitted, " ".join(rng.choices(_WORDS, k=rng.randint(10, 60)))]
+
+
+def seed(service: SurveyDataService, rows_per_dataset: int, rng: random.Random) -> None:
+    """Append ``rows_per_dataset`` synthetic rows to every dataset in batches."""
+    for dataset in Dataset:
+        rows = _synthetic_rows(dataset, rows_per_dataset, rng)
+        while chunk := [row for _, row in zip(range(SEED_CHUNK_SIZE), rows)]:
+            service.append_dataset_rows(dataset, chunk)
+
+
+def _operations(
+    service: SurveyDataService, rng: random.Random
+) -> dict[str, Callable[[], object]]:
+    """One representative call per ``SurveyDataService`` method."""
+    organizations = list(Organization)
+
+    def timestamp() -> int:
+        return now_epoch()
+
+    def save_missionary_experience_answer() -> None:
+        question = rng.choice(QUESTIONS)
+        service.save_missionary_experience_answer(
+            timestamp(),
+            rng.choice(organizations),
+            question.id,
+            persisted_question_text(question),
+        )
+
+    return {
+        "save_ministering_event": lambda: service.save_ministering_event(
+            timestamp(), rng.choice(organizations)
+        ),
+        "save_missionary_experience_answer": save_missionary_experience_answer,
+        "save_story": lambda: service.save_story(
+            timestamp(), " ".join(rng.choices(_WORDS, k=30))
+        ),
+        "append_dataset_rows": lambda: service.append_dataset_rows(
+            Dataset.MINISTERING_EVENTS,
+            list(_synthetic_rows(Dataset.MINISTERING_EVENTS, 100, rng)),
+        ),
+        "get_ministering_reports": service.get_ministering_reports,
+        "get_missionary_experience_report": service.get_missionary_experience_report,
+        "get_stories": service.get_stories,
+        "get_stories_sorted": lambda: sorted(
+            service.get_stories(),
+            key=lambda story: story.datetime_submitted,
+            reverse=True,
+        ),
+        "iter_dataset_rows": lambda: collections.deque(
+            service.iter_dataset_rows(Dataset.STORIES), maxlen=0
+        ),
+    }
+
+
+def measure(
+    operation: Callable[[], object],
+    rows: int,
+    method: str,
+    iterations: int,
+    max_seconds: float,
+) -> MethodResult:
+    """Time ``operation`` up to ``iterations`` times or ``max_seconds``, then once traced."""
+    durations: list[float] = []
+    deadline = time.perf_counter() + max_seconds
+    while len(durations) < iterations and (
+        not durations or time.perf_counter() < deadline
+    ):
+        started = time.perf_counter()
+        operation()
+        durations.append(time.perf_counter() - started)
+
+    # A separate traced call, so tracemalloc overhead does not skew the timings
+    tracemalloc.start()
+    try:
+        baseline = tracemalloc.get_traced_memory()[0]
+        operation()
+        peak = tracemalloc.get_traced_memory()[1] - baseline
+    finally:
+        tracemalloc.stop()
+
+    ordered = sorted(durations)
+    total = sum(durations)
+    return MethodResult(
+        rows=rows,
+        method=method,
+        iterations=len(durations),
+        ops_per_sec=len(durations) / total if total > 0 else math.inf,
+        mean_ms=total / len(durations) * 1000,
+        p50_ms=percentile(ordered, 0.50) * 1000,
+        p95_ms=percentile(ordered, 0.95) * 1000,
+        p99_ms=percentile(ordered, 0.99) * 1000,
+        max_ms=ordered[-1] * 1000,
+        peak_alloc_bytes=max(peak, 0),
+    )
+
+
+def run_benchmarks(
+    service: SurveyDataService,
+    row_counts: list[int],
+    iterations: int,
+    max_seconds: float,
+    methods: list[str] | None = None,
+    on_result: Callable[[MethodResult], None] = lambda result: None,
+    rng_seed: int = 0,
+) -> list[MethodResult]:
+    """Seed ``service`` up to each size in ``row_counts`` and time every method there.
+
+    Sizes are visited in ascending order and only the difference is seeded,
+    so one backend instance serves the whole run. ``service`` should start
+    empty.
+    """
+    rng = random.Random(rng_seed)
+    operations = _operations(service, rng)
+    selected = methods or list(METHODS)
+    results: list[MethodResult] = []
+    seeded = 0
+    for rows in sorted(row_counts):
+        seed(service, rows - seeded, rng)
+        seeded = rows
+        for method in selected:
+            result = measure(operations[method], rows, method, iterations, max_seconds)
+            results.append(result)
+            on_result(result)
+    return results
+
+
+def report(backend: str, results: list[MethodResult]) -> dict:
+    """Machine-readable results with enough context to compare runs."""
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return {
+        "backend": backend,
+        "created_at": datetime.now(UTC).strftime("%Y-%m-%d %H:%M:%S UTC"),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        # ru_maxrss is in kilobytes on Linux but bytes on macOS
+        "max_rss_bytes": max_rss if sys.platform == "darwin" else max_rss * 1024,
+        "results": [asdict(result) for result in results],
+    }
@@ -0,0 +1,670 @@
+"""Command-line tools for operating on rs-backend data.
+
+Usage::
+
+    rs-backend migrate --source csv:./data --target sheets:<spreadsheet-id>
+    rs-backend migrate --source sheets:<spreadsheet-id> --target csv:./export
+    rs-backend bench --rows 10000 --rows 100000 --output bench.json
+    rs-backend fake-sheets --port 8085 --latency-ms 150 --write-quota 60
+    rs-backend loadtest --target fake-sheets --duration 300 --peak-rps 40
+    rs-backend rebuild-summary --spreadsheet <spreadsheet-id>
+
+Backends are given as ``csv:<data dir>`` or ``sheets:<spreadsheet id>``. The
+Sheets credentials path defaults to ``RS_SURVEY__GOOGLE_SHEETS_CREDENTIALS_PATH``
+and the API endpoint to ``RS_SURVEY__GOOGLE_SHEETS_API_ENDPOINT``.
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import sys
+import tempfile
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+import uvicorn
+from loguru import logger
+
+from rs_backend.benchmarks import (
+    DEFAULT_ROW_COUNTS,
+    METHODS,
+    MethodResult,
+    report,
+    run_benchmarks,
+)
+from rs_backend.fake_sheets import (
+    FakeSheetsConfig,
+    create_fake_sheets_app,
+    serve_fake_sheets,
+)
+from rs_backend.loadtest import DEFAULT_MIX, BurstProfile, run_load, summarize
+from rs_backend.local_server import serve_in_thread
+from rs_backend.schemas.enums import Dataset
+from rs_backend.services.base import DATASET_HEADERS, SurveyDataService
+from rs_backend.services.csv_service import CSVService
+from rs_backend.services.sheets_service import SUMMARY_DATASETS, SheetsService
+from rs_backend.settings import Settings
+
+DEFAULT_CHUNK_SIZE = 1000
+
+
+def build_service(
+    spec: str, credentials_path: str | None, api_endpoint: str | None = None
+) -> SurveyDataService:
+    """Create a data service from a ``csv:<dir>`` or ``sheets:<id>`` spec."""
+    kind, _, location = spec.partition(":")
+    if not location:
+        raise ValueError(f"Invalid backend {spec!r}; expected csv:<dir> or sheets:<id>")
+    if kind == "csv":
+        CSVService.init(data_dir=Path(location))
+        return CSVService(data_dir=Path(location))
+    if kind == "sheets":
+        SheetsService.init(
+            credentials_path=credentials_path,
+            spreadsheet_id=location,
+            api_endpoint=api_endpoint,
+        )
+        return SheetsService(
+            credentials_path=credentials_path,
+            spreadsheet_id=location,
+            api_endpoint=api_endpoint,
+        )
+    raise ValueError(f"Unknown backend kind {kind!r}; expected 'csv' or 'sheets'")
+
+
+def _load_checkpoint(
+    path: Path, source: str, target: str
+) -> tuple[dict[str, int], dict | None]:
+    """Return rows already copied per dataset, and the chunk being appended if any."""
+    if not path.exists():
+        return {}, None
+    checkpoint = json.loads(path.read_text())
+    if checkpoint.get("source") != source or checkpoint.get("target") != target:
+        raise SystemExit(
+            f"Checkpoint {path} belongs to {checkpoint.get('source')} -> "
+            f"{checkpoint.get('target')}; pass --restart to discard it."
+        )
+    return dict(checkpoint.get("copied", {})), checkpoint.get("pending")
+
+
+def _save_checkpoint(
+    path: Path,
+    source: str,
+    target: str,
+    copied: dict[str, int],
+    pending: dict | None = None,
+) -> None:
+    """Atomically persist migration progress."""
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    tmp_path.write_text(
+        json.dumps(
+            {"source": source, "target": target, "copied": copied, "pending": pending}
+        )
+    )
+    os.replace(tmp_path, path)
+
+
+def _target_row_count(target: SurveyDataService, dataset: Dataset) -> int:
+    return sum(1 for _ in target.iter_dataset_rows(dataset))
+
+
+def _settle_pending(
+    target: SurveyDataService, pending: dict, copied: dict[str, int]
+) -> None:
+    """Count a chunk the last run was appending as copied if it reached ``target``.
+
+    ``pending`` records the dataset, the target's row count before the append
+    and the chunk's size. If the target holds none of the chunk it is copied
+    again; if it holds anything but the whole chunk once, the run stops.
+    """
+    dataset = Dataset(pending["dataset"])
+    landed = _target_row_count(target, dataset) - pending["target_rows"]
+    if landed == pending["rows"]:
+        copied[dataset.value] = copied.get(dataset.value, 0) + landed
+    elif landed != 0:
+        raise SystemExit(
+            f"{dataset.value}: the interrupted chunk of {pending['rows']} rows left "
+            f"{landed} rows in the target; remove them from the target and resume, "
+            "or pass --restart to copy into an empty target."
+        )
+
+
+def migrate(
+    source: SurveyDataService,
+    target: SurveyDataService,
+    datasets: list[Dataset],
+    chunk_size: int,
+    copied: dict[str, int],
+    on_chunk: Callable[[Dataset, dict[str, int]], None],
+    before_chunk: Callable[[dict[str, int], dict], None] = lambda copied, pending: None,
+) -> dict[str, int]:
+    """Copy datasets from ``source`` to ``target`` in chunks of ``chunk_size`` rows.
+
+    ``copied`` holds rows already copied per dataset (from a checkpoint); those
+    rows are skipped. ``before_chunk(copied, pending)`` is called before every
+    append with the chunk about to be written (see ``_settle_pending``), and
+    ``on_chunk(dataset, copied)`` after it lands in the target, so progress can
+    be checkpointed and reported.
+    """
+    for dataset in datasets:
+        headers = DATASET_HEADERS[dataset]
+        done = copied.get(dataset.value, 0)
+        rows = itertools.islice(source.iter_dataset_rows(dataset), done, None)
+        target_rows: int | None = None
+        while chunk := list(itertools.islice(rows, chunk_size)):
+            if target_rows is None:
+                target_rows = _target_row_count(target, dataset)
+            before_chunk(
+                copied,
+                {
+                    "dataset": dataset.value,
+                    "target_rows": target_rows,
+                    "rows": len(chunk),
+                },
+            )
+            target.append_dataset_rows(
+                dataset,
+                [[row.get(header, "") for header in headers] for row in chunk],
+            )
+            target_rows += len(chunk)
+            done += len(chunk)
+            copied[dataset.value] = done
+            on_chunk(dataset, copied)
+        copied[dataset.value] = done
+    return copied
+
+
+def _credentials_path(args: argparse.Namespace) -> str | None:
+    settings = Settings()
+    return args.credentials or (
+        settings.google_sheets_credentials_path.get_secret_value()
+        if settings.google_sheets_credentials_path is not None
+        else None
+    )
+
+
+def _run_migrate(args: argparse.Namespace) -> int:
+    credentials_path = _credentials_path(args)
+    checkpoint_path = Path(args.checkpoint)
+    if args.restart:
+        checkpoint_path.unlink(missing_ok=True)
+
+    api_endpoint = Settings().google_sheets_api_endpoint
+    source = build_service(args.source, credentials_path, api_endpoint)
+    target = build_service(args.target, credentials_path, api_endpoint)
+    copied, pending = _load_checkpoint(checkpoint_path, args.source, args.target)
+    if pending is not None:
+        _settle_pending(target, pending, copied)
+        _save_checkpoint(checkpoint_path, args.source, args.target, copied)
+    if copied:
+        print(f"Resuming from checkpoint {checkpoint_path}: {copied}")
+
+    started = time.monotonic()
+    resumed_from = sum(copied.values())
+
+    def before_chunk(copied: dict[str, int], pending: dict) -> None:
+        _save_checkpoint(checkpoint_path, args.source, args.target, copied, pending)
+
+    def on_chunk(dataset: Dataset, copied: dict[str, int]) -> None:
+        _save_checkpoint(checkpoint_path, args.source, args.target, copied)
+        elapsed = time.monotonic() - started
+        rate = (sum(copied.values()) - resumed_from) / elapsed if elapsed > 0 else 0.0
+        print(
+            f"{dataset.value}: {copied[dataset.value]} rows copied ({rate:,.0f} rows/s)"
+        )
+
+    datasets = (
+        [Dataset(name) for name in args.datasets] if args.datasets else list(Dataset)
+    )
+    copied = migrate(
+        source, target, datasets, args.chunk_size, copied, on_chunk, before_chunk
+    )
+    _save_checkpoint(checkpoint_path, args.source, args.target, copied)
+
+    elapsed = time.monotonic() - started
+    print(
+        f"Done: {sum(copied.values()) - resumed_from} rows in {elapsed:.1f}s ({copied})"
+    )
+    return 0
+
+
+def _run_bench(args: argparse.Namespace) -> int:
+    # Per-call service log lines would flood the output and dominate fast methods
+    logger.disable("rs_backend")
+    try:
+        with tempfile.TemporaryDirectory(prefix="rs-bench-") as tmp_dir:
+            # Seeding appends to the backend, so by default it gets a scratch CSV dir
+            backend = args.backend or f"csv:{tmp_dir}"
+            service = build_service(
+                backend, _credentials_path(args), Settings().google_sheets_api_endpoint
+            )
+
+            def on_result(result: MethodResult) -> None:
+                print(
+                    f"{result.rows:>9,} rows  {result.method:<34} "
+                    f"p50 {result.p50_ms:9.3f} ms  p95 {result.p95_ms:9.3f} ms  "
+                    f"p99 {result.p99_ms:9.3f} ms  {result.ops_per_sec:10,.1f} ops/s  "
+                    f"peak {result.peak_alloc_bytes / 1024:10,.0f} KiB"
+                )
+
+            results = run_benchmarks(
+                service,
+                row_counts=args.rows or list(DEFAULT_ROW_COUNTS),
+                iterations=args.iterations,
+                max_seconds=args.max_seconds,
+                methods=args.methods,
+                on_result=on_result,
+            )
+    finally:
+        logger.enable("rs_backend")
+
+    output = Path(args.output)
+    output.write_text(json.dumps(report(backend, results), indent=2))
+    print(f"Wrote {len(results)} results to {output}")
+    return 0
+
+
+def _run_rebuild_summary(args: argparse.Namespace) -> int:
+    spreadsheet_id = args.spreadsheet or Settings().google_sheets_spreadsheet_id
+    if spreadsheet_id is None:
+        raise SystemExit(
+            "Pass --spreadsheet or set RS_SURVEY__GOOGLE_SHEETS_SPREADSHEET_ID."
+        )
+    credentials_path = _credentials_path(args)
+    api_endpoint = Settings().google_sheets_api_endpoint
+    SheetsService.init(
+        credentials_path=credentials_path,
+        spreadsheet_id=spreadsheet_id,
+        api_endpoint=api_endpoint,
+    )
+    service = SheetsService(
+        credentials_path=credentials_path,
+        spreadsheet_id=spreadsheet_id,
+        api_endpoint=api_endpoint,
+    )
+    counts = service.rebuild_summary()
+    for dataset in SUMMARY_DATASETS:
+        print(
+            f"{dataset.value}: {counts.get((dataset.value, 'total', ''), 0)} rows counted "
+            f"({counts.get((dataset.value, 'rows', ''), 0)} raw rows)"
+        )
+    return 0
+
+
+def _run_fake_sheets(args: argparse.Namespace) -> int:
+    config = FakeSheetsConfig(
+        latency_ms=args.latency_ms,
+        latency_sigma=args.latency_sigma,
+        read_quota_per_minute=args.read_quota,
+        write_quota_per_minute=args.write_quota,
+        error_rate=args.error_rate,
+        seed=args.seed,
+    )
+    print(f"Fake Sheets API on http://{args.host}:{args.port}/ ({config})")
+    uvicorn.run(
+        create_fake_sheets_app(config),
+        host=args.host,
+        port=args.port,
+        log_level="warning",
+    )
+    return 0
+
+
+@contextmanager
+def _local_app(target: str, fake_sheets: FakeSheetsConfig) -> Iterator[str]:
+    """Serve the full app in-process against a scratch CSV dir or the fake Sheets API."""
+    # Imported here: importing main builds the module-level app
+    from rs_backend.main import create_app
+
+    with tempfile.TemporaryDirectory(prefix="rs-loadtest-") as tmp_dir:
+        app = create_app()
+        # Settings are swapped before serving: lifespan builds the service from them
+        if target == "csv":
+            app.state.settings = app.state.settings.model_copy(
+                update={
+                    "use_csv_service": True,
+                    "csv_data_dir": Path(tmp_dir),
+                    "shared_counters_path": None,
+                }
+            )
+            with serve_in_thread(app, lifespan="on") as base_url:
+                yield base_url
+            return
+        with serve_fake_sheets(fake_sheets) as endpoint:
+            app.state.settings = app.state.settings.model_copy(
+                update={
+                    "use_csv_service": False,
+                    "google_sheets_api_endpoint": endpoint,
+                    "google_sheets_spreadsheet_id": "loadtest",
+                    "google_sheets_credentials_path": None,
+                    "shared_counters_path": None,
+                }
+            )
+            with serve_in_thread(app, lifespan="on") as base_url:
+                yield base_url
+
+
+def _parse_mix(value: str) -> dict[str, float]:
+    mix: dict[str, float] = {}
+    for part in value.split(","):
+        operation, _, weight = part.partition("=")
+        if operation not in DEFAULT_MIX:
+            raise argparse.ArgumentTypeError(
+                f"Unknown operation {operation!r}; expected one of {', '.join(DEFAULT_MIX)}"
+            )
+        mix[operation] = float(weight)
+    return mix
+
+
+def _run_loadtest(args: argparse.Namespace) -> int:
+    profile = BurstProfile(
+        duration_s=args.duration,
+        peak_rps=args.peak_rps,
+        base_rps=args.base_rps,
+        rise_s=args.rise if args.rise is not None else args.duration * 0.1,
+        decay_s=args.decay if args.decay is not None else args.duration * 0.25,
+    )
+    fake_sheets = FakeSheetsConfig(
+        latency_ms=args.sheets_latency_ms,
+        latency_sigma=args.sheets_latency_sigma,
+        read_quota_per_minute=args.sheets_read_quota,
+        write_quota_per_minute=args.sheets_write_quota,
+        seed=args.seed,
+    )
+
+    if args.target.startswith("http"):
+        samples = asyncio.run(
+            run_load(
+                args.target,
+                profile,
+                args.mix,
+                args.max_in_flight,
+                seed=args.seed,
+                devices=args.devices,
+            )
+        )
+    else:
+        # The in-process app and our HTTP client share stdout; their per-request
+        # log lines would bury the report
+        if not args.app_logs:
+            logger.disable("")
+        try:
+            with _local_app(args.target, fake_sheets) as base_url:
+                samples = asyncio.run(
+                    run_load(
+                        base_url,
+                        profile,
+                        args.mix,
+                        args.max_in_flight,
+                        seed=args.seed,
+                        devices=args.devices,
+                    )
+                )
+        finally:
+            logger.enable("")
+
+    summary = summarize(
+        samples, profile, args.window, args.slo_p95_ms, args.max_error_rate
+    )
+    summary["target"] = args.target
+    Path(args.output).write_text(json.dumps(summary, indent=2))
+
+    overall = summary["overall"]
+    for name, stats in [("overall", overall), *summary["per_operation"].items()]:
+        latencies = "  ".join(
+            f"{key.removesuffix('_ms')} {stats[key]:8.1f} ms"
+            for key in ("p50_ms", "p95_ms", "p99_ms")
+            if stats[key] is not None
+        )
+        print(
+            f"{name:<28} {stats['requests']:>7} req  "
+            f"{stats['error_rate']:7.2%} errors  {latencies}"
+        )
+    saturation = summary["saturation"]
+    if saturation is None:
+        print(f"No saturation up to {summary['max_sustained_rps']:.1f} req/s offered")
+    else:
+        print(
+            f"Saturated at {saturation['offered_rps']:.1f} req/s offered "
+            f"(t={saturation['start_s']:.0f}s, {saturation['reason']}); "
+            f"sustained {summary['max_sustained_rps']:.1f} req/s"
+        )
+    print(f"Wrote results to {args.output}")
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the ``rs-backend`` argument parser."""
+    parser = argparse.ArgumentParser(
+        prog="rs-backend", description=__doc__.splitlines()[0]
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    migrate_parser = subparsers.add_parser(
+        "migrate", help="Copy every dataset from one backend to another in batches."
+    )
+    migrate_parser.add_argument(
+        "--source", required=True, help="csv:<dir> or sheets:<id>"
+    )
+    migrate_parser.add_argument(
+        "--target", required=True, help="csv:<dir> or sheets:<id>"
+    )
+    migrate_parser.add_argument(
+        "--dataset",
+        dest="datasets",
+        action="append",
+        choices=[dataset.value for dataset in Dataset],
+        help="Dataset to copy (repeatable); defaults to all datasets.",
+    )
+    migrate_parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=DEFAULT_CHUNK_SIZE,
+        help=f"Rows per batched write (default: {DEFAULT_CHUNK_SIZE}).",
+    )
+    migrate_parser.add_argument(
+        "--checkpoint",
+        default="migrate-checkpoint.json",
+        help="Progress file used to resume an interrupted migration. A chunk "
+        "interrupted mid-append is checked against the target's row count on resume, "
+        "so nothing else should write to the target while migrating.",
+    )
+    migrate_parser.add_argument(
+        "--restart", action="store_true", help="Discard any existing checkpoint."
+    )
+    migrate_parser.add_argument(
+        "--credentials", help="Google service-account JSON path."
+    )
+    migrate_parser.set_defaults(func=_run_migrate)
+
+    bench_parser = subparsers.add_parser(
+        "bench", help="Time every data service method at increasing dataset sizes."
+    )
+    bench_parser.add_argument(
+        "--backend",
+        help="csv:<dir> or sheets:<id> to seed and benchmark; defaults to a temporary CSV dir. "
+        "Rows are appended, so use an empty backend.",
+    )
+    bench_parser.add_argument(
+        "--rows",
+        type=int,
+        action="append",
+        help="Rows per dataset to benchmark at (repeatable); "
+        f"defaults to {', '.join(str(count) for count in DEFAULT_ROW_COUNTS)}.",
+    )
+    bench_parser.add_argument(
+        "--method",
+        dest="methods",
+        action="append",
+        choices=METHODS,
+        help="Method to benchmark (repeatable); defaults to all methods.",
+    )
+    bench_parser.add_argument(
+        "--iterations",
+        type=int,
+        default=200,
+        help="Calls per method and size (default: 200).",
+    )
+    bench_parser.add_argument(
+        "--max-seconds",
+        type=float,
+        default=10.0,
+        help="Time budget per method and size; slow methods stop early (default: 10).",
+    )
+    bench_parser.add_argument(
+        "--output", default="bench-results.json", help="JSON results file."
+    )
+    bench_parser.add_argument("--credentials", help="Google service-account JSON path.")
+    bench_parser.set_defaults(func=_run_bench)
+
+    summary_parser = subparsers.add_parser(
+        "rebuild-summary",
+        help="Regenerate the Sheets summary worksheet from the raw worksheets.",
+    )
+    summary_parser.add_argument(
+        "--spreadsheet",
+        help="Spreadsheet ID (default: RS_SURVEY__GOOGLE_SHEETS_SPREADSHEET_ID).",
+    )
+    summary_parser.add_argument(
+        "--credentials", help="Google service-account JSON path."
+    )
+    summary_parser.set_defaults(func=_run_rebuild_summary)
+
+    fake_parser = subparsers.add_parser(
+        "fake-sheets", help="Serve an in-memory stand-in for the Google Sheets API."
+    )
+    fake_parser.add_argument("--host", default="127.0.0.1")
+    fake_parser.add_argument("--port", type=int, default=8085)
+    fake_parser.add_argument(
+        "--latency-ms",
+        type=float,
+        default=0.0,
+        help="Median added latency per request.",
+    )
+    fake_parser.add_argument(
+        "--latency-sigma",
+        type=float,
+        default=0.0,
+        help="Log-normal spread of the latency (0 = constant; ~0.5 resembles real Sheets).",
+    )
+    fake_parser.add_argument(
+        "--read-quota",
+        type=int,
+        help="Read requests per minute before 429s (default: unlimited).",
+    )
+    fake_parser.add_argument(
+        "--write-quota",
+        type=int,
+        help="Write requests per minute before 429s (default: unlimited).",
+    )
+    fake_parser.add_argument(
+        "--error-rate",
+        type=float,
+        default=0.0,
+        help="Fraction of requests failed with a 5xx.",
+    )
+    fake_parser.add_argument(
+        "--seed", type=int, help="Random seed for latency and errors."
+    )
+    fake_parser.set_defaults(func=_run_fake_sheets)
+
+    load_parser = subparsers.add_parser(
+        "loadtest", help="Replay a post-meeting submission burst against the HTTP API."
+    )
+    load_parser.add_argument(
+        "--target",
+        default="csv",
+        help="Base URL of a running server, or 'csv' / 'fake-sheets' to serve the app "
+        "in-process against a scratch CSV dir or the fake Sheets API (default: csv).",
+    )
+    load_parser.add_argument(
+        "--duration",
+        type=float,
+        default=900.0,
+        help="Burst length in seconds (default: 900).",
+    )
+    load_parser.add_argument(
+        "--peak-rps",
+        type=float,
+        default=20.0,
+        help="Peak arrival rate above base (default: 20).",
+    )
+    load_parser.add_argument(
+        "--base-rps",
+        type=float,
+        default=0.5,
+        help="Background arrival rate (default: 0.5).",
+    )
+    load_parser.add_argument(
+        "--rise",
+        type=float,
+        help="Seconds to reach the peak (default: 10%% of duration).",
+    )
+    load_parser.add_argument(
+        "--decay",
+        type=float,
+        help="Decay time constant in seconds (default: 25%% of duration).",
+    )
+    load_parser.add_argument(
+        "--mix",
+        type=_parse_mix,
+        default=DEFAULT_MIX,
+        help="Operation weights, e.g. missionary_experience_post=0.5,story_post=0.2,"
+        "report_read=0.2,stories_read=0.1",
+    )
+    load_parser.add_argument(
+        "--max-in-flight",
+        type=int,
+        default=1000,
+        help="Outstanding requests before arrivals are dropped client-side (default: 1000).",
+    )
+    load_parser.add_argument(
+        "--devices",
+        type=int,
+        default=200,
+        help="Simulated devices, each with its own X-Device-Token (default: 200).",
+    )
+    load_parser.add_argument(
+        "--window",
+        type=float,
+        default=10.0,
+        help="Seconds per reporting window (default: 10).",
+    )
+    load_parser.add_argument(
+        "--slo-p95-ms",
+        type=float,
+        default=1000.0,
+        help="p95 latency SLO (default: 1000).",
+    )
+    load_parser.add_argument(
+        "--max-error-rate",
+        type=float,
+        default=0.01,
+        help="Error rate SLO (default: 0.01).",
+    )
+    load_parser.add_argument("--sheets-latency-ms", type=float, default=150.0)
+    load_parser.add_argument("--sheets-latency-sigma", type=float, default=0.5)
+    load_parser.add_argument("--sheets-read-quota", type=int)
+    load_parser.add_argument("--sheets-write-quota", type=int)
+    load_parser.add_argument(
+        "--app-logs", action="store_true", help="Keep the in-process app's log output."
+    )
+    load_parser.add_argument("--seed", type=int, default=0)
+    load_parser.add_argument("--output", default="loadtest-results.json")
+    load_parser.set_defaults(func=_run_loadtest)
+
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Entry point for the ``rs-backend`` command."""
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
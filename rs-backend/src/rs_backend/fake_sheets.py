@@ -0,0 +1,381 @@
+"""Local stand-in for the parts of the Google Sheets v4 API SheetsService uses.
+
+Serves ``spreadsheets.get``, ``spreadsheets.batchUpdate`` (``addSheet``),
+``values.get``, ``values.append`` and ``values.update`` from in-memory
+worksheets, so the Sheets path can be benchmarked and soak-tested offline::
+
+    rs-backend fake-sheets --port 8085 --latency-ms 150 --read-quota 300
+    RS_SURVEY__USE_CSV_SERVICE=false \\
+    RS_SURVEY__GOOGLE_SHEETS_API_ENDPOINT=http://127.0.0.1:8085/ \\
+    RS_SURVEY__GOOGLE_SHEETS_SPREADSHEET_ID=fake uv run poe serve
+
+Spreadsheets are created on first use, with one worksheet (and header row)
+per dataset, like a production spreadsheet that has been set up. Each
+request waits for a latency drawn from a log-normal distribution, and can be
+failed with a 429 once the per-minute read or write quota is spent, or with an
+injected 5xx. Errors use the Google API error body, so googleapiclient raises
+the same ``HttpError`` it would in production.
+"""
+
+import asyncio
+import math
+import random
+import re
+import time
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+from rs_backend.local_server import serve_in_thread
+from rs_backend.schemas.enums import Dataset
+from rs_backend.services.base import DATASET_HEADERS
+
+_CELL_RE = re.compile(r"^([A-Za-z]*)(\d*)$")
+
+# Sheets quotas are per minute
+QUOTA_WINDOW_SECONDS = 60.0
+
+
+@dataclass
+class FakeSheetsConfig:
+    """Latency, quota and failure behaviour of the fake server."""
+
+    latency_ms: float = 0.0  # median added latency per request
+    latency_sigma: float = 0.0  # log-normal shape; 0 makes latency constant
+    read_quota_per_minute: int | None = None  # None means unlimited
+    write_quota_per_minute: int | None = None
+    error_rate: float = 0.0  # fraction of requests failed with a 5xx
+    seed: int | None = None
+
+
+@dataclass
+class FakeStats:
+    """Counts of what the fake served, exposed at GET /_fake/stats."""
+
+    requests: dict[str, int] = field(default_factory=dict)
+    quota_rejections: int = 0
+    injected_errors: int = 0
+
+
+class FakeSheetsError(Exception):
+    """An error response in the Google API error format."""
+
+    def __init__(self, code: int, status: str, message: str) -> None:
+        super().__init__(message)
+        self.code = code
+        self.status = status
+        self.message = message
+
+
+def _column_index(letters: str) -> int:
+    index = 0
+    for letter in letters.upper():
+        index = index * 26 + (ord(letter) - ord("A") + 1)
+    return index - 1
+
+
+def _column_letters(index: int) -> str:
+    letters = ""
+    index += 1
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(ord("A") + remainder) + letters
+    return letters
+
+
+@dataclass(frozen=True)
+class A1Range:
+    """A parsed A1 range; rows are 1-based and inclusive, columns 0-based."""
+
+    sheet: str
+    start_row: int
+    end_row: int | None
+    start_column: int
+    end_column: int | None
+
+
+def parse_a1_range(range_: str) -> A1Range:
+    """Parse ``Sheet!A2:C1001``, ``Sheet!A:B``, ``Sheet!A1`` or ``Sheet``."""
+    sheet, _, cells = range_.partition("!")
+    sheet = sheet.strip("'")
+    if not cells:
+        return A1Range(sheet, 1, None, 0, None)
+    start, _, end = cells.partition(":")
+    start_match = _CELL_RE.match(start)
+    end_match = _CELL_RE.match(end or start)
+    if not sheet or start_match is None or end_match is None:
+        raise FakeSheetsError(
+            400, "INVALID_ARGUMENT", f"Unable to parse range: {range_}"
+        )
+    start_column, start_row = start_match.groups()
+    end_column, end_row = end_match.groups()
+    return A1Range(
+        sheet=sheet,
+        start_row=int(start_row) if start_row else 1,
+        end_row=int(end_row) if end_row else None,
+        start_column=_column_index(start_column) if start_column else 0,
+        end_column=_column_index(end_column) if end_column else None,
+    )
+
+
+def _trim(row: list[str]) -> list[str]:
+    """Drop trailing empty cells, as the Sheets API does."""
+    end = len(row)
+    while end and row[end - 1] == "":
+        end -= 1
+    return row[:end]
+
+
+class FakeSpreadsheet:
+    """In-memory worksheets of one spreadsheet; cells are stored formatted (as strings)."""
+
+    def __init__(self, spreadsheet_id: str) -> None:
+        self.spreadsheet_id = spreadsheet_id
+        self.sheets: dict[str, list[list[str]]] = {}
+        self.sheet_ids: dict[str, int] = {}
+        for dataset in Dataset:
+            self.add_sheet(dataset.value)
+            self.sheets[dataset.value].append(list(DATASET_HEADERS[dataset]))
+
+    def add_sheet(self, title: str) -> dict:
+        if title in self.sheets:
+            raise FakeSheetsError(
+                400,
+                "INVALID_ARGUMENT",
+                f'Invalid requests[0].addSheet: A sheet with the name "{title}" already exists.',
+            )
+        self.sheets[title] = []
+        self.sheet_ids[title] = len(self.sheet_ids)
+        return self._properties(title)
+
+    def _properties(self, title: str) -> dict:
+        return {
+            "sheetId": self.sheet_ids[title],
+            "title": title,
+            "index": self.sheet_ids[title],
+            # New sheets get a 1000-row grid, which appends grow as needed
+            "gridProperties": {
+                "rowCount": max(len(self.sheets[title]), 1000),
+                "columnCount": 26,
+            },
+        }
+
+    def metadata(self) -> dict:
+        return {
+            "spreadsheetId": self.spreadsheet_id,
+            "properties": {"title": self.spreadsheet_id},
+            "sheets": [
+                {"properties": self._properties(title)} for title in self.sheets
+            ],
+        }
+
+    def _rows(self, a1: A1Range, range_: str) -> list[list[str]]:
+        rows = self.sheets.get(a1.sheet)
+        if rows is None:
+            raise FakeSheetsError(
+                400, "INVALID_ARGUMENT", f"Unable to parse range: {range_}"
+            )
+        return rows
+
+    def get_values(self, range_: str) -> dict:
+        a1 = parse_a1_range(range_)
+        rows = self._rows(a1, range_)
+        end_column = None if a1.end_column is None else a1.end_column + 1
+        values = [
+            _trim(row[a1.start_column : end_column])
+            for row in rows[a1.start_row - 1 : a1.end_row]
+        ]
+        while values and not values[-1]:
+            values.pop()
+        result = {"range": range_, "majorDimension": "ROWS"}
+        if values:
+            result["values"] = values
+        return result
+
+    def _write(
+        self, rows: list[list[str]], start_row: int, start_column: int, values: list
+    ) -> None:
+        for offset, value_row in enumerate(values):
+            row_index = start_row - 1 + offset
+            while len(rows) <= row_index:
+                rows.append([])
+            row = rows[row_index]
+            end = start_column + len(value_row)
+            if len(row) < end:
+                row.extend([""] * (end - len(row)))
+            row[start_column:end] = [
+                "" if value is None else str(value) for value in value_row
+            ]
+
+    def _updates(
+        self, sheet: str, start_row: int, start_column: int, values: list
+    ) -> dict:
+        width = max((len(row) for row in values), default=0)
+        end_column = _column_letters(start_column + max(width, 1) - 1)
+        return {
+            "spreadsheetId": self.spreadsheet_id,
+            "updatedRange": (
+                f"{sheet}!{_column_letters(start_column)}{start_row}:"
+                f"{end_column}{start_row + len(values) - 1}"
+            ),
+            "updatedRows": len(values),
+            "updatedColumns": width,
+            "updatedCells": sum(len(row) for row in values),
+        }
+
+    def append_values(self, range_: str, values: list) -> dict:
+        a1 = parse_a1_range(range_)
+        rows = self._rows(a1, range_)
+        # Append below the last non-empty row of the table
+        last = len(rows)
+        while last and not _trim(rows[last - 1]):
+            last -= 1
+        start_row = last + 1
+        self._write(rows, start_row, a1.start_column, values)
+        return {
+            "spreadsheetId": self.spreadsheet_id,
+            "tableRange": f"{a1.sheet}!A1:{_column_letters(a1.start_column)}{last}",
+            "updates": self._updates(a1.sheet, start_row, a1.start_column, values),
+        }
+
+    def update_values(self, range_: str, values: list) -> dict:
+        a1 = parse_a1_range(range_)
+        rows = self._rows(a1, range_)
+        self._write(rows, a1.start_row, a1.start_column, values)
+        return self._updates(a1.sheet, a1.start_row, a1.start_column, values)
+
+
+class _QuotaWindow:
+    """Sliding one-minute window of admitted request times."""
+
+    def __init__(self, limit: int | None) -> None:
+        self.limit = limit
+        self._times: deque[float] = deque()
+
+    def admit(self, now: float) -> bool:
+        if self.limit is None:
+            return True
+        while self._times and now - self._times[0] >= QUOTA_WINDOW_SECONDS:
+            self._times.popleft()
+        if len(self._times) >= self.limit:
+            return False
+        self._times.append(now)
+        return True
+
+
+def create_fake_sheets_app(config: FakeSheetsConfig | None = None) -> FastAPI:
+    """Build the fake Sheets v4 server app."""
+    config = config or FakeSheetsConfig()
+    rng = random.Random(config.seed)
+    spreadsheets: dict[str, FakeSpreadsheet] = {}
+    stats = FakeStats()
+    quotas = {
+        "read": _QuotaWindow(config.read_quota_per_minute),
+        "write": _QuotaWindow(config.write_quota_per_minute),
+    }
+
+    app = FastAPI(title="Fake Google Sheets API", docs_url=None, redoc_url=None)
+    app.state.config = config
+    app.state.spreadsheets = spreadsheets
+    app.state.stats = stats
+
+    def spreadsheet(spreadsheet_id: str) -> FakeSpreadsheet:
+        existing = spreadsheets.get(spreadsheet_id)
+        if existing is None:
+            existing = spreadsheets[spreadsheet_id] = FakeSpreadsheet(spreadsheet_id)
+        return existing
+
+    async def simulate(verb: str, kind: str) -> None:
+        """Apply latency, quota and error injection for one API call."""
+        stats.requests[verb] = stats.requests.get(verb, 0) + 1
+        if config.latency_ms > 0:
+            latency = config.latency_ms * math.exp(rng.gauss(0.0, config.latency_sigma))
+            await asyncio.sleep(latency / 1000)
+        if not quotas[kind].admit(time.monotonic()):
+            stats.quota_rejections += 1
+            raise FakeSheetsError(
+                429,
+                "RESOURCE_EXHAUSTED",
+                f"Quota exceeded for quota metric '{kind.title()} requests' and limit "
+                f"'{kind.title()} requests per minute per user'.",
+            )
+        if config.error_rate > 0 and rng.random() < config.error_rate:
+            stats.injected_errors += 1
+            code, status = rng.choice(
+                [(500, "INTERNAL"), (502, "UNAVAILABLE"), (503, "UNAVAILABLE")]
+            )
+            raise FakeSheetsError(code, status, "The service is currently unavailable.")
+
+    @app.exception_handler(FakeSheetsError)
+    async def sheets_error_handler(
+        request: Request, exc: FakeSheetsError
+    ) -> JSONResponse:
+        return JSONResponse(
+            status_code=exc.code,
+            content={
+                "error": {
+                    "code": exc.code,
+                    "message": exc.message,
+                    "status": exc.status,
+                }
+            },
+        )
+
+    @app.get("/_fake/stats")
+    async def get_stats() -> dict:
+        return {
+            "requests": stats.requests,
+            "quota_rejections": stats.quota_rejections,
+            "injected_errors": stats.injected_errors,
+        }
+
+    # Ranges contain ":" as well, so the method suffix routes come first
+    @app.post("/v4/spreadsheets/{spreadsheet_id}:batchUpdate")
+    async def batch_update(spreadsheet_id: str, request: Request) -> dict:
+        await simulate("spreadsheets.batchUpdate", "write")
+        body = await request.json()
+        replies = []
+        for entry in body.get("requests", []):
+            if "addSheet" not in entry:
+                raise FakeSheetsError(
+                    400, "INVALID_ARGUMENT", f"Unsupported request: {sorted(entry)}"
+                )
+            title = entry["addSheet"]["properties"]["title"]
+            properties = spreadsheet(spreadsheet_id).add_sheet(title)
+            replies.append({"addSheet": {"properties": properties}})
+        return {"spreadsheetId": spreadsheet_id, "replies": replies}
+
+    @app.post("/v4/spreadsheets/{spreadsheet_id}/values/{range_}:append")
+    async def append_values(spreadsheet_id: str, range_: str, request: Request) -> dict:
+        await simulate("spreadsheets.values.append", "write")
+        body = await request.json()
+        return spreadsheet(spreadsheet_id).append_values(range_, body.get("values", []))
+
+    @app.put("/v4/spreadsheets/{spreadsheet_id}/values/{range_}")
+    async def update_values(spreadsheet_id: str, range_: str, request: Request) -> dict:
+        await simulate("spreadsheets.values.update", "write")
+        body = await request.json()
+        return spreadsheet(spreadsheet_id).update_values(range_, body.get("values", []))
+
+    @app.get("/v4/spreadsheets/{spreadsheet_id}/values/{range_}")
+    async def get_values(spreadsheet_id: str, range_: str) -> dict:
+        await simulate("spreadsheets.values.get", "read")
+        return spreadsheet(spreadsheet_id).get_values(range_)
+
+    @app.get("/v4/spreadsheets/{spreadsheet_id}")
+    async def get_spreadsheet(spreadsheet_id: str) -> dict:
+        await simulate("spreadsheets.get", "read")
+        return spreadsheet(spreadsheet_id).metadata()
+
+    return app
+
+
+@contextmanager
+def serve_fake_sheets(config: FakeSheetsConfig | None = None) -> Iterator[str]:
+    """Run the fake on a free local port in a background thread; yield its endpoint."""
+    with serve_in_thread(create_fake_sheets_app(config)) as endpoint:
+        yield endpoint
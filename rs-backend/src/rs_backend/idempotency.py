@@ -0,0 +1,168 @@
+"""Idempotency-Key support for the submission endpoints.
+
+The PWA retries POSTs on flaky connections. A client that sends an
+``Idempotency-Key`` header gets the stored response replayed for any retry
+with the same key, without the request reaching the data service again.
+A key reused with a different request body is a client bug, not a retry,
+and is rejected with ``422`` rather than answered with the other request's
+response.
+Recent keys live in a bounded LRU whose entries also expire after a TTL.
+"""
+
+import asyncio
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from fastapi import Request, Response
+from fastapi.responses import JSONResponse
+from loguru import logger
+
+from rs_backend.metrics import record_cache_lookup
+
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+REPLAYED_HEADER = "Idempotent-Replayed"
+
+# POST endpoints whose retries are deduplicated
+IDEMPOTENT_PATHS = frozenset(
+    {"/ministering/", "/missionary-experience/", "/stories/", "/ingest/batch"}
+)
+
+
+@dataclass(frozen=True)
+class StoredResponse:
+    """A completed response kept for replay."""
+
+    status_code: int
+    headers: dict[str, str]
+    body: bytes
+    stored_at: float
+    # SHA-256 of the request body the response answered
+    request_digest: str = ""
+
+
+class IdempotencyCache:
+    """Bounded LRU of idempotency keys to responses, with TTL eviction."""
+
+    def __init__(self, max_entries: int, ttl_seconds: float) -> None:
+        """Keep at most ``max_entries`` responses, each for ``ttl_seconds``."""
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, StoredResponse] = OrderedDict()
+        self._in_flight: dict[str, asyncio.Event] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> StoredResponse | None:
+        """Return the stored response for ``key`` if present and not expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() - entry.stored_at > self.ttl_seconds:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key: str, response: StoredResponse) -> None:
+        """Store a response, evicting expired and then least-recently-used keys."""
+        with self._lock:
+            self._entries[key] = response
+            self._entries.move_to_end(key)
+            now = time.monotonic()
+            # Entries are in LRU order, so expired ones cluster at the front
+            while self._entries:
+                oldest_key, oldest = next(iter(self._entries.items()))
+                if now - oldest.stored_at <= self.ttl_seconds:
+                    break
+                del self._entries[oldest_key]
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def begin(self, key: str) -> asyncio.Event | None:
+        """Mark ``key`` as in flight; return the existing event if it already was."""
+        existing = self._in_flight.get(key)
+        if existing is None:
+            self._in_flight[key] = asyncio.Event()
+        return existing
+
+    def finish(self, key: str) -> None:
+        """Release waiters for an in-flight ``key``."""
+        event = self._in_flight.pop(key, None)
+        if event is not None:
+            event.set()
+
+
+def _replay(entry: StoredResponse) -> Response:
+    return Response(
+        content=entry.body,
+        status_code=entry.status_code,
+        headers={**entry.headers, REPLAYED_HEADER: "true"},
+    )
+
+
+async def idempotency_middleware(request: Request, call_next):
+    """Replay the stored response for retried submissions with a known Idempotency-Key."""
+    client_key = request.headers.get(IDEMPOTENCY_HEADER)
+    if (
+        client_key is None
+        or request.method != "POST"
+        or request.url.path not in IDEMPOTENT_PATHS
+    ):
+        return await call_next(request)
+
+    cache: IdempotencyCache = request.app.state.idempotency_cache
+    tenant = getattr(request.state, "tenant", None) or ""
+    key = f"{tenant}:{request.url.path}:{client_key}"
+    request_digest = hashlib.sha256(await request.body()).hexdigest()
+
+    # A retry racing the original request waits for it rather than re-running
+    # it; if the original failed, the retry claims the key and runs itself.
+    entry = cache.get(key)
+    record_cache_lookup("idempotency", hit=entry is not None)
+    while entry is None and (in_flight := cache.begin(key)) is not None:
+        await in_flight.wait()
+        entry = cache.get(key)
+    if entry is not None:
+        if entry.request_digest != request_digest:
+            logger.warning(
+                "Idempotency key reused with a different body",
+                idempotency_key=client_key,
+            )
+            return JSONResponse(
+                status_code=422,
+                content={
+                    "detail": f"{IDEMPOTENCY_HEADER} was already used for a different request"
+                },
+            )
+        logger.info("Replaying idempotent response", idempotency_key=client_key)
+        return _replay(entry)
+
+    try:
+        response = await call_next(request)
+        body = b"".join([chunk async for chunk in response.body_iterator])
+        headers = {
+            name: value
+            for name, value in response.headers.items()
+            if name.lower() != "content-length"
+        }
+        # Only successful writes are remembered, so failed attempts can be retried
+        if 200 <= response.status_code < 300:
+            cache.put(
+                key,
+                StoredResponse(
+                    status_code=response.status_code,
+                    headers=headers,
+                    body=body,
+                    stored_at=time.monotonic(),
+                    request_digest=request_digest,
+                ),
+            )
+        return Response(content=body, status_code=response.status_code, headers=headers)
+    finally:
+        cache.finish(key)
@@ -0,0 +1,302 @@
+"""Load test that drives the HTTP API with a "Sunday burst" arrival profile.
+
+Nearly all real submissions arrive in the minutes after a ward meeting ends,
+so requests are generated open-loop (arrivals do not wait for responses) from
+a non-homogeneous Poisson process whose rate climbs quickly to a peak and
+then decays::
+
+    rate(t) = base + peak * t / rise               for t < rise
+    rate(t) = base + peak * exp(-(t - rise) / decay)   afterwards
+
+Each arrival picks an operation from a weighted mix of submissions and reads.
+The summary gives latency percentiles and error rates overall, per operation
+and per time window. Requests are spread over a pool of simulated devices,
+each sending its own ``X-Device-Token``, so per-client rate limits apply as
+they would to a real ward. All devices share the load generator's IP, so raise
+``RS_SURVEY__RATE_LIMIT_DEVICE_IP_FACTOR`` on the target for large pools. The saturation point is the offered rate of the first
+window whose p95 breaches the SLO or whose error rate exceeds the limit. Run
+through ``rs-backend loadtest``.
+"""
+
+import asyncio
+import math
+import random
+import time
+from dataclasses import dataclass
+
+import httpx
+
+from rs_backend.benchmarks import percentile
+from rs_backend.questions import QUESTIONS
+from rs_backend.schemas.enums import Organization
+
+# Fraction of arrivals per operation
+DEFAULT_MIX: dict[str, float] = {
+    "missionary_experience_post": 0.45,
+    "story_post": 0.15,
+    "report_read": 0.25,
+    "stories_read": 0.15,
+}
+
+_STORY_WORDS = [
+    "we",
+    "prayed",
+    "for",
+    "the",
+    "missionaries",
+    "and",
+    "invited",
+    "our",
+    "neighbor",
+    "to",
+    "church",
+    "she",
+    "shared",
+    "a",
+    "scripture",
+    "with",
+    "a",
+    "friend",
+    "who",
+    "asked",
+    "about",
+    "the",
+    "temple",
+]
+
+
+@dataclass(frozen=True)
+class BurstProfile:
+    """Arrival rate over time for one simulated post-meeting burst."""
+
+    duration_s: float = 900.0
+    peak_rps: float = 20.0
+    base_rps: float = 0.5
+    rise_s: float = 90.0
+    decay_s: float = 240.0
+
+    def rate(self, t: float) -> float:
+        """Arrivals per second at ``t`` seconds into the run."""
+        if t < self.rise_s:
+            return self.base_rps + self.peak_rps * t / self.rise_s
+        return self.base_rps + self.peak_rps * math.exp(
+            -(t - self.rise_s) / self.decay_s
+        )
+
+    def arrival_times(self, rng: random.Random) -> list[float]:
+        """Sample arrival offsets by thinning a Poisson process at the peak rate."""
+        max_rate = self.base_rps + self.peak_rps
+        arrivals: list[float] = []
+        t = 0.0
+        while True:
+            t += rng.expovariate(max_rate)
+            if t >= self.duration_s:
+                return arrivals
+            if rng.random() * max_rate < self.rate(t):
+                arrivals.append(t)
+
+
+@dataclass(frozen=True)
+class Sample:
+    """Outcome of one request; ``status`` is None if it never got a response."""
+
+    offset_s: float
+    operation: str
+    status: int | None
+    latency_s: float
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.status is not None and 200 <= self.status < 300
+
+
+async def _send(
+    client: httpx.AsyncClient, operation: str, rng: random.Random, device: str
+) -> httpx.Response:
+    headers = {"X-Device-Token": device}
+    organization = rng.choice(list(Organization)).value
+    if operation == "missionary_experience_post":
+        questions = rng.sample(QUESTIONS[:-1], k=rng.randint(1, 4))
+        return await client.post(
+            "/missionary-experience/",
+            json={
+                "organization": organization,
+                "answers": [{"question_id": question.id} for question in questions],
+            },
+            headers=headers,
+        )
+    if operation == "story_post":
+        content = " ".join(rng.choices(_STORY_WORDS, k=rng.randint(10, 60)))
+        return await client.post(
+            "/stories/", json={"content": content}, headers=headers
+        )
+    if operation == "report_read":
+        path = rng.choice(["/ministering/reports", "/missionary-experience/reports"])
+        return await client.get(path, headers=headers)
+    if operation == "stories_read":
+        return await client.get("/stories/", headers=headers)
+    raise ValueError(f"Unknown operation {operation!r}")
+
+
+async def run_load(
+    base_url: str,
+    profile: BurstProfile,
+    mix: dict[str, float] | None = None,
+    max_in_flight: int = 1000,
+    timeout_s: float = 30.0,
+    seed: int = 0,
+    devices: int = 200,
+) -> list[Sample]:
+    """Replay the burst profile against ``base_url`` and record every request.
+
+    Arrivals beyond ``max_in_flight`` outstanding requests are not sent and
+    are recorded as client-side overload errors, so an overwhelmed server
+    cannot slow the arrival rate down.
+    """
+    mix = mix or DEFAULT_MIX
+    rng = random.Random(seed)
+    operations = list(mix)
+    weights = [mix[operation] for operation in operations]
+    arrivals = profile.arrival_times(rng)
+    device_tokens = [f"loadtest-{seed}-{i}" for i in range(devices)]
+
+    samples: list[Sample] = []
+    in_flight = 0
+
+    async def issue(client: httpx.AsyncClient, offset: float, operation: str) -> None:
+        nonlocal in_flight
+        started = time.perf_counter()
+        try:
+            response = await _send(client, operation, rng, rng.choice(device_tokens))
+            samples.append(
+                Sample(
+                    offset,
+                    operation,
+                    response.status_code,
+                    time.perf_counter() - started,
+                )
+            )
+        except httpx.HTTPError as e:
+            samples.append(
+                Sample(
+                    offset,
+                    operation,
+                    None,
+                    time.perf_counter() - started,
+                    type(e).__name__,
+                )
+            )
+        finally:
+            in_flight -= 1
+
+    limits = httpx.Limits(max_connections=max_in_flight, max_keepalive_connections=100)
+    async with httpx.AsyncClient(
+        base_url=base_url, timeout=timeout_s, limits=limits
+    ) as client:
+        tasks: list[asyncio.Task] = []
+        started = time.perf_counter()
+        for offset in arrivals:
+            delay = offset - (time.perf_counter() - started)
+            if delay > 0:
+                await asyncio.sleep(delay)
+            operation = rng.choices(operations, weights)[0]
+            if in_flight >= max_in_flight:
+                samples.append(Sample(offset, operation, None, 0.0, "client_overload"))
+                continue
+            in_flight += 1
+            tasks.append(asyncio.create_task(issue(client, offset, operation)))
+        await asyncio.gather(*tasks)
+    return samples
+
+
+def _stats(samples: list[Sample]) -> dict:
+    latencies = sorted(
+        sample.latency_s for sample in samples if sample.status is not None
+    )
+    errors = sum(1 for sample in samples if not sample.ok)
+    stats = {
+        "requests": len(samples),
+        "errors": errors,
+        "error_rate": errors / len(samples) if samples else 0.0,
+    }
+    for name, fraction in (("p50_ms", 0.50), ("p95_ms", 0.95), ("p99_ms", 0.99)):
+        stats[name] = percentile(latencies, fraction) * 1000 if latencies else None
+    return stats
+
+
+def summarize(
+    samples: list[Sample],
+    profile: BurstProfile,
+    window_s: float = 10.0,
+    slo_p95_ms: float = 1000.0,
+    max_error_rate: float = 0.01,
+) -> dict:
+    """Overall, per-operation and per-window results, plus the saturation point."""
+    per_operation: dict[str, list[Sample]] = {}
+    for sample in samples:
+        per_operation.setdefault(sample.operation, []).append(sample)
+
+    windows = []
+    saturation = None
+    max_sustained_rps = 0.0
+    window_count = math.ceil(profile.duration_s / window_s)
+    by_window: list[list[Sample]] = [[] for _ in range(window_count)]
+    for sample in samples:
+        by_window[min(int(sample.offset_s // window_s), window_count - 1)].append(
+            sample
+        )
+    for i, window_samples in enumerate(by_window):
+        stats = _stats(window_samples)
+        offered_rps = len(window_samples) / window_s
+        window = {
+            "start_s": i * window_s,
+            "offered_rps": offered_rps,
+            "completed_rps": sum(1 for sample in window_samples if sample.ok)
+            / window_s,
+            **stats,
+        }
+        windows.append(window)
+        breached = stats["error_rate"] > max_error_rate or (
+            stats["p95_ms"] is not None and stats["p95_ms"] > slo_p95_ms
+        )
+        if breached and saturation is None:
+            saturation = {
+                "start_s": window["start_s"],
+                "offered_rps": offered_rps,
+                "reason": (
+                    "error_rate"
+                    if stats["error_rate"] > max_error_rate
+                    else "p95_latency"
+                ),
+            }
+        elif not breached and saturation is None:
+            max_sustained_rps = max(max_sustained_rps, offered_rps)
+
+    return {
+        "profile": profile.__dict__,
+        "slo_p95_ms": slo_p95_ms,
+        "max_error_rate": max_error_rate,
+        "overall": {
+            **_stats(samples),
+            "mean_rps": len(samples) / profile.duration_s,
+        },
+        "per_operation": {
+            operation: _stats(operation_samples)
+            for operation, operation_samples in sorted(per_operation.items())
+        },
+        "error_kinds": _error_kinds(samples),
+        "max_sustained_rps": max_sustained_rps,
+        "saturation": saturation,
+        "windows": windows,
+    }
+
+
+def _error_kinds(samples: list[Sample]) -> dict[str, int]:
+    kinds: dict[str, int] = {}
+    for sample in samples:
+        if sample.ok:
+            continue
+        kind = sample.error or str(sample.status)
+        kinds[kind] = kinds.get(kind, 0) + 1
+    return kinds
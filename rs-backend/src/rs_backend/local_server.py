@@ -0,0 +1,35 @@
+"""Run an ASGI app on a free local port in a background thread.
+
+Used by the fake Sheets server and the load-test harness to stand up real
+HTTP servers in-process (tests, benchmarks) without managing subprocesses.
+"""
+
+import socket
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+import uvicorn
+
+
+@contextmanager
+def serve_in_thread(app, lifespan: str = "off") -> Iterator[str]:
+    """Serve ``app`` on 127.0.0.1 with a free port; yield its base URL (with a trailing /)."""
+    server = uvicorn.Server(uvicorn.Config(app, log_level="warning", lifespan=lifespan))
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.bind(("127.0.0.1", 0))
+    thread = threading.Thread(
+        target=server.run, kwargs={"sockets": [sock]}, daemon=True
+    )
+    thread.start()
+    try:
+        while not server.started:
+            if not thread.is_alive():
+                raise RuntimeError("Local server failed to start")
+            time.sleep(0.01)
+        yield f"http://127.0.0.1:{sock.getsockname()[1]}/"
+    finally:
+        server.should_exit = True
+        thread.join()
+        sock.close()
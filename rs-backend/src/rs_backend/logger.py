@@ -7,6 +7,10 @@ from loguru import logger
 class InterceptHandler(logging.Handler):
     """Intercept standard logging messages and redirect them to loguru."""
 
+    # Walking the stack to attribute each record to its real caller is only
+    # worth its cost for human-readable output; JSON mode turns it off.
+    find_caller: bool = True
+
     def emit(self, record: logging.LogRecord) -> None:
         # Get corresponding loguru level if it exists
         try:
@@ -14,28 +18,50 @@ class InterceptHandler(logging.Handler):
         except ValueError:
             level = record.levelno
 
+        if not self.find_caller:
+            logger.opt(exception=record.exc_info).log(level, record.getMessage())
+            return
+
         # Find caller from where the logged message originated
         frame, depth = logging.currentframe(), 2
         while frame.f_code.co_filename == logging.__file__:
             frame = frame.f_back
             depth += 1
 
-        logger.opt(depth=depth, exception=record.exc_info).log(level, record.getMessage())
+        logger.opt(depth=depth, exception=record.exc_info).log(
+            level, record.getMessage()
+        )
 
 
-def setup_logging() -> None:
-    """Configure loguru and intercept standard library logging."""
+def setup_logging(log_format: str = "pretty") -> None:
+    """Configure loguru and intercept standard library logging.
+
+    ``pretty`` writes colorized lines synchronously to stdout (local dev).
+    ``json`` writes one JSON object per line through loguru's queue-backed
+    background writer, so request handlers never block on stdout.
+    """
     # Remove default handler
     logger.remove()
 
-    # Add custom handler with format from the course
-    logger.add(
-        sink=sys.stdout,
-        format="<green>{time:YYYY-MM-DD HH:mm:ss.SSS}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> | <bold><white>{message}</white></bold> | <dim>{extra}</dim>",
-        colorize=True,
-        diagnose=False,  # Set to False for production safety to avoid leaking sensitive data
-        backtrace=False,  # Set to False to avoid extended tracebacks
-    )
+    if log_format == "json":
+        logger.add(
+            sink=sys.stdout,
+            serialize=True,
+            enqueue=True,  # Hand records to a background thread via a queue
+            colorize=False,
+            diagnose=False,
+            backtrace=False,
+        )
+    else:
+        # Add custom handler with format from the course
+        logger.add(
+            sink=sys.stdout,
+            format="<green>{time:YYYY-MM-DD HH:mm:ss.SSS}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> | <bold><white>{message}</white></bold> | <dim>{extra}</dim>",
+            colorize=True,
+            diagnose=False,  # Set to False for production safety to avoid leaking sensitive data
+            backtrace=False,  # Set to False to avoid extended tracebacks
+        )
+    InterceptHandler.find_caller = log_format != "json"
 
     # Intercept standard library logging (including uvicorn)
     logging.basicConfig(handlers=[InterceptHandler()], level=0, force=True)
@@ -46,4 +72,3 @@ def setup_logging() -> None:
 
 # Setup logging when module is imported
 setup_logging()
-
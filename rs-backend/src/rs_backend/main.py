@@ -1,29 +1,81 @@
+import asyncio
+import contextlib
+import itertools
+import random
+import re
+import secrets
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, Request
 from fastapi.responses import FileResponse
 from loguru import logger
 
-import rs_backend.logger  # noqa: F401  # Import to configure logger
-from rs_backend.routers import missionary_experience, survey, stories
-from rs_backend.settings import Settings
+from rs_backend.admission import admission_middleware, build_limiters
+from rs_backend.idempotency import IdempotencyCache, idempotency_middleware
+from rs_backend.logger import setup_logging
+from rs_backend.metrics import (
+    ADMISSION_IN_FLIGHT,
+    ADMISSION_QUEUE_DEPTH,
+    CACHE_ENTRIES,
+    instrument_service,
+    metrics_middleware,
+)
+from rs_backend.precompute import PrecomputeScheduler
+from rs_backend.profiling import profiling_middleware
+from rs_backend.rate_limit import (
+    SlidingWindowRateLimiter,
+    parse_rate,
+    rate_limit_middleware,
+)
+from rs_backend.routers import (
+    admin,
+    export,
+    history,
+    ingest,
+    metrics,
+    missionary_experience,
+    stories,
+    survey,
+)
+from rs_backend.search import StoryIndex
 from rs_backend.services.base import SurveyDataService
 from rs_backend.services.csv_service import CSVService
+from rs_backend.services.report_snapshot import ReportSnapshotService, save_periodically
+from rs_backend.services.shared_counters import SharedCounters, SharedCounterService
 from rs_backend.services.sheets_service import SheetsService
+from rs_backend.services.story_log import StoryLog, StoryLogService
+from rs_backend.settings import Settings
+from rs_backend.tenants import TenantRegistry, tenant_middleware
+from rs_backend.timing import server_timing_middleware
+
+# Request IDs are a per-process random prefix plus a counter: unique, and far
+# cheaper than a uuid4 per request.
+_REQUEST_ID_PREFIX = secrets.token_hex(4)
+_request_counter = itertools.count(1)
+
+# Client-supplied request IDs are echoed into logs and headers only if they
+# look like an ID; anything else (newlines, huge values) gets a fresh one.
+_CLIENT_REQUEST_ID_RE = re.compile(r"[A-Za-z0-9._-]{1,128}")
 
 
 async def log_request_middleware(request: Request, call_next):
     """Middleware to log all incoming requests."""
-    from uuid import uuid4
+    request_id = request.headers.get("X-Request-ID")
+    if request_id is None or not _CLIENT_REQUEST_ID_RE.fullmatch(request_id):
+        request_id = f"{_REQUEST_ID_PREFIX}-{next(_request_counter):x}"
+    sample_rate: float = request.app.state.settings.access_log_sample_rate
+    # Decided once per request so its access lines are kept or dropped together
+    request.state.access_log_sampled = (
+        sample_rate >= 1.0 or random.random() < sample_rate
+    )
 
-    request_id = str(uuid4())
-    with logger.contextualize(
-        request_id=request_id,
-        method=request.method,
-        path=request.url.path,
-    ):
-        logger.info(f"Request {request.method} {request.url.path}")
+    method = request.method
+    path = request.scope["path"]
+    with logger.contextualize(request_id=request_id, method=method, path=path):
+        if request.state.access_log_sampled:
+            logger.info("Request {} {}", method, path)
         response = await call_next(request)
+        response.headers["X-Request-ID"] = request_id
         return response
 
 
@@ -50,27 +102,134 @@ async def lifespan(app: FastAPI):
         SheetsService.init(
             credentials_path=credentials_path_str,
             spreadsheet_id=settings.google_sheets_spreadsheet_id,
+            api_endpoint=settings.google_sheets_api_endpoint,
         )
         service = SheetsService(
             credentials_path=credentials_path_str,
             spreadsheet_id=settings.google_sheets_spreadsheet_id,
+            api_endpoint=settings.google_sheets_api_endpoint,
         )
         logger.info("Using SheetsService for data storage")
 
+    # Record per-method latency and errors for the storage backend
+    instrument_service(
+        service,
+        backend="csv" if settings.use_csv_service else "sheets",
+        methods=SurveyDataService.__abstractmethods__,
+    )
+
+    # Identifies the storage that the on-disk caches below are built from
+    storage_source = (
+        f"csv:{settings.csv_data_dir.resolve()}"
+        if settings.use_csv_service
+        else f"sheets:{settings.google_sheets_spreadsheet_id}"
+    )
+
+    # Serve story reads from the append-only, memory-mapped story log
+    if settings.story_log_dir is not None:
+        app.state.story_log = StoryLog(settings.story_log_dir)
+        service = StoryLogService(
+            inner=service, log=app.state.story_log, source=storage_source
+        )
+        instrument_service(
+            service,
+            backend="story_log",
+            methods=SurveyDataService.__abstractmethods__,
+        )
+        logger.info("Using story log", path=str(settings.story_log_dir))
+
+    # Serve reports from counts warm-started from the last snapshot. Shared
+    # counters answer every report themselves, so beneath them the snapshot
+    # would never read new rows and would save stale counts
+    report_snapshot: ReportSnapshotService | None = None
+    if (
+        settings.report_snapshot_path is not None
+        and settings.shared_counters_path is not None
+    ):
+        logger.warning(
+            "Report snapshot disabled: shared counters serve the reports",
+            path=str(settings.report_snapshot_path),
+        )
+    elif settings.report_snapshot_path is not None:
+        service = report_snapshot = ReportSnapshotService(
+            inner=service,
+            path=settings.report_snapshot_path,
+            source=storage_source,
+        )
+        instrument_service(
+            service,
+            backend="report_snapshot",
+            methods=SurveyDataService.__abstractmethods__,
+        )
+        snapshot_task = asyncio.create_task(
+            save_periodically(service, settings.report_snapshot_interval_seconds)
+        )
+        logger.info("Using report snapshot", path=str(settings.report_snapshot_path))
+
+    # Serve reports from counters shared by every worker process
+    if settings.shared_counters_path is not None:
+        service = SharedCounterService(
+            inner=service,
+            counters=SharedCounters(settings.shared_counters_path),
+            source=storage_source,
+        )
+        instrument_service(
+            service,
+            backend="shared_counters",
+            methods=SurveyDataService.__abstractmethods__,
+        )
+        logger.info(
+            "Using shared report counters",
+            path=str(settings.shared_counters_path),
+        )
+
     # Store service in app.state for access in routes
     app.state.survey_data_service = service
 
+    # Build the story search index from whichever backend is active
+    app.state.story_index = StoryIndex(service.get_stories())
+    logger.info("Story search index built", stories=len(app.state.story_index))
+
+    # Refresh report and story-list views in the background; handlers read the latest
+    if settings.precompute_enabled:
+        app.state.precompute = PrecomputeScheduler(
+            service,
+            active_interval_seconds=settings.precompute_active_interval_seconds,
+            idle_interval_seconds=settings.precompute_idle_interval_seconds,
+            max_staleness_seconds=settings.precompute_max_staleness_seconds,
+        )
+        await app.state.precompute.refresh()
+        precompute_task = asyncio.create_task(app.state.precompute.run())
+
     logger.info("Application initialized successfully")
 
     yield
 
-    # Shutdown: Cleanup code would go here if needed
-    # For now, we don't need any cleanup
+    # Shutdown: Stop background refreshes, release the shared mappings and
+    # save the report snapshot
+    if settings.precompute_enabled:
+        precompute_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await precompute_task
+    if isinstance(service, SharedCounterService):
+        service.counters.close()
+    if settings.story_log_dir is not None:
+        app.state.story_log.close()
+    if report_snapshot is not None:
+        snapshot_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await snapshot_task
+        await asyncio.to_thread(report_snapshot.save)
+        logger.info("Report snapshot saved", path=str(settings.report_snapshot_path))
+
+    # Flush any log records still queued for the background writer
+    await logger.complete()
 
 
 def create_app() -> FastAPI:
     """Create and configure the FastAPI application."""
     settings = Settings()
+    setup_logging(settings.log_format)
 
     app = FastAPI(
         title=settings.app_name,
@@ -82,13 +241,65 @@ def create_app() -> FastAPI:
     # Store settings in app.state for access in routes and lifespan
     app.state.settings = settings
 
-    # Register request logging middleware
+    # Bounded concurrency per route class; excess requests get a fast 503
+    # (innermost, so idempotent replays are never shed)
+    app.state.admission_limiters = build_limiters(settings)
+    app.middleware("http")(admission_middleware)
+    for name, limiter in app.state.admission_limiters.items():
+        ADMISSION_IN_FLIGHT.set_function(
+            lambda limiter=limiter: limiter.in_flight, name
+        )
+        ADMISSION_QUEUE_DEPTH.set_function(
+            lambda limiter=limiter: limiter.queue_depth, name
+        )
+
+    # Per-client submission limits; 429 before admission or any backend work
+    # (inside idempotency, so replaying a stored response costs no quota)
+    app.state.rate_limits = {
+        path: parse_rate(spec) for path, spec in settings.rate_limits.items()
+    }
+    app.state.rate_limiter = SlidingWindowRateLimiter(settings.rate_limit_max_clients)
+    app.middleware("http")(rate_limit_middleware)
+    CACHE_ENTRIES.set_function(lambda: len(app.state.rate_limiter), "rate_limiter")
+
+    # Replay responses for retried submissions carrying an Idempotency-Key
+    app.state.idempotency_cache = IdempotencyCache(
+        max_entries=settings.idempotency_max_keys,
+        ttl_seconds=settings.idempotency_ttl_seconds,
+    )
+    app.middleware("http")(idempotency_middleware)
+    CACHE_ENTRIES.set_function(lambda: len(app.state.idempotency_cache), "idempotency")
+    CACHE_ENTRIES.set_function(
+        lambda: len(getattr(app.state, "story_index", None) or ()), "story_index"
+    )
+
+    # Per-route latency histograms for /metrics
+    app.middleware("http")(metrics_middleware)
+
+    # Server-Timing header and per-request timing log line
+    app.middleware("http")(server_timing_middleware)
+
+    # Opt-in sampling profiler for requests carrying the admin token
+    app.middleware("http")(profiling_middleware)
+
+    # Resolve the ward (/w/{slug}/ prefix or tenant header) before anything else
+    # looks at the path; ward services are created lazily and LRU-evicted
+    app.state.tenant_registry = TenantRegistry(settings)
+    app.middleware("http")(tenant_middleware)
+    CACHE_ENTRIES.set_function(lambda: len(app.state.tenant_registry), "tenants")
+
+    # Register request logging middleware (outermost, so replays are logged too)
     app.middleware("http")(log_request_middleware)
 
     # Include routers first (so API routes and /docs work)
     app.include_router(survey.router)
     app.include_router(stories.router)
     app.include_router(missionary_experience.router)
+    app.include_router(export.router)
+    app.include_router(history.router)
+    app.include_router(ingest.router)
+    app.include_router(metrics.router)
+    app.include_router(admin.router)
 
     # Serve static files - use catch-all route for SPA
     @app.get("/{path:path}", include_in_schema=False)
@@ -97,16 +308,24 @@ def create_app() -> FastAPI:
         settings: Settings = app.state.settings
 
         # Skip API routes and docs
-        if (
-            path.startswith("api/")
-            or path.startswith("docs")
-            or path.startswith("openapi.json")
-            or path.startswith("redoc")
-            or path.startswith("ministering")
-            or path.startswith("stories")
-            or path.startswith("missionary-experience")
+        if path.startswith(
+            (
+                "api/",
+                "docs",
+                "openapi.json",
+                "redoc",
+                "ministering",
+                "stories",
+                "missionary-experience",
+                "export",
+                "history",
+                "ingest",
+                "metrics",
+                "admin",
+            )
         ):
             from fastapi import HTTPException
+
             raise HTTPException(status_code=404)
 
         # For root path (empty string), serve index.html
@@ -115,6 +334,7 @@ def create_app() -> FastAPI:
             if index_path.exists():
                 return FileResponse(str(index_path))
             from fastapi import HTTPException
+
             raise HTTPException(status_code=404)
 
         # Try to serve the requested file
@@ -128,6 +348,7 @@ def create_app() -> FastAPI:
             return FileResponse(str(index_path))
 
         from fastapi import HTTPException
+
         raise HTTPException(status_code=404)
 
     return app
@@ -0,0 +1,153 @@
+"""tracemalloc-based memory diagnostics for the admin endpoints.
+
+Tracing is off by default because it roughly doubles allocation cost. An
+operator starts it, takes a snapshot, lets traffic run, takes another, and
+diffs the two to see which source lines are accumulating memory. Snapshots are
+held in process (the most recent few only) so they can be compared later.
+"""
+
+import resource
+import sys
+import threading
+import tracemalloc
+from collections import OrderedDict
+from datetime import UTC, datetime
+from typing import Literal
+
+from rs_backend.metrics import CACHE_ENTRIES
+from rs_backend.schemas.memory import AllocationSite, MemorySnapshotInfo, MemoryStatus
+
+GroupBy = Literal["lineno", "filename", "traceback"]
+
+# Allocations by tracemalloc itself and the import machinery are noise here
+_SNAPSHOT_FILTERS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+
+class TracingNotStartedError(RuntimeError):
+    """Raised when a snapshot is requested while tracemalloc is not tracing."""
+
+
+def _location(
+    statistic: tracemalloc.Statistic | tracemalloc.StatisticDiff, group_by: GroupBy
+) -> str:
+    frames = statistic.traceback
+    if group_by == "traceback":
+        return " <- ".join(f"{frame.filename}:{frame.lineno}" for frame in frames)
+    frame = frames[0]
+    return (
+        frame.filename if group_by == "filename" else f"{frame.filename}:{frame.lineno}"
+    )
+
+
+def _max_rss_bytes() -> int:
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in kilobytes on Linux but bytes on macOS
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+class MemoryDiagnostics:
+    """Controls tracemalloc and keeps the most recent snapshots for comparison."""
+
+    def __init__(self, max_snapshots: int = 8) -> None:
+        """Keep at most ``max_snapshots`` snapshots; older ones are dropped."""
+        self.max_snapshots = max_snapshots
+        self._snapshots: OrderedDict[
+            int, tuple[MemorySnapshotInfo, tracemalloc.Snapshot]
+        ] = OrderedDict()
+        self._next_id = 1
+        self._lock = threading.Lock()
+
+    def start(self, frames: int = 1) -> None:
+        """Start tracing, recording ``frames`` frames of traceback per allocation."""
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+        tracemalloc.start(frames)
+
+    def stop(self) -> None:
+        """Stop tracing and drop all snapshots."""
+        tracemalloc.stop()
+        with self._lock:
+            self._snapshots.clear()
+
+    def take_snapshot(self) -> MemorySnapshotInfo:
+        """Take and keep a snapshot of current allocations."""
+        if not tracemalloc.is_tracing():
+            raise TracingNotStartedError("tracemalloc is not tracing; start it first")
+        snapshot = tracemalloc.take_snapshot().filter_traces(_SNAPSHOT_FILTERS)
+        with self._lock:
+            info = MemorySnapshotInfo(
+                snapshot_id=self._next_id,
+                taken_at=datetime.now(UTC).strftime("%Y-%m-%d %H:%M:%S UTC"),
+                traced_bytes=sum(trace.size for trace in snapshot.traces),
+            )
+            self._next_id += 1
+            self._snapshots[info.snapshot_id] = (info, snapshot)
+            while len(self._snapshots) > self.max_snapshots:
+                self._snapshots.popitem(last=False)
+        return info
+
+    def _snapshot(self, snapshot_id: int) -> tracemalloc.Snapshot:
+        with self._lock:
+            entry = self._snapshots.get(snapshot_id)
+        if entry is None:
+            raise KeyError(snapshot_id)
+        return entry[1]
+
+    def top(
+        self, snapshot_id: int, limit: int = 20, group_by: GroupBy = "lineno"
+    ) -> list[AllocationSite]:
+        """Return the largest allocation sites in a snapshot."""
+        statistics = self._snapshot(snapshot_id).statistics(group_by)
+        return [
+            AllocationSite(
+                location=_location(statistic, group_by),
+                size_bytes=statistic.size,
+                count=statistic.count,
+            )
+            for statistic in statistics[:limit]
+        ]
+
+    def diff(
+        self,
+        base_id: int,
+        current_id: int,
+        limit: int = 20,
+        group_by: GroupBy = "lineno",
+    ) -> list[AllocationSite]:
+        """Return the allocation sites that grew (or shrank) most between two snapshots."""
+        statistics = self._snapshot(current_id).compare_to(
+            self._snapshot(base_id), group_by
+        )
+        return [
+            AllocationSite(
+                location=_location(statistic, group_by),
+                size_bytes=statistic.size,
+                count=statistic.count,
+                size_diff_bytes=statistic.size_diff,
+                count_diff=statistic.count_diff,
+            )
+            for statistic in statistics[:limit]
+        ]
+
+    def status(self) -> MemoryStatus:
+        """Summarize tracing state, process memory and in-process cache sizes."""
+        current, peak = tracemalloc.get_traced_memory()
+        with self._lock:
+            snapshots = [info for info, _ in self._snapshots.values()]
+        return MemoryStatus(
+            tracing=tracemalloc.is_tracing(),
+            traceback_frames=tracemalloc.get_traceback_limit(),
+            traced_current_bytes=current,
+            traced_peak_bytes=peak,
+            max_rss_bytes=_max_rss_bytes(),
+            snapshots=snapshots,
+            cache_entries={
+                cache: int(entries)
+                for (cache,), entries in CACHE_ENTRIES.values().items()
+            },
+        )
@@ -0,0 +1,432 @@
+"""In-process Prometheus-style metrics, rendered by GET /metrics.
+
+Counters and histograms are sharded per thread: the hot path only ever
+touches the calling thread's own dict, so recording needs no lock. A scrape
+merges a copy of every shard. When a thread exits (anyio retires idle worker
+threads and starts new ones), its shard is folded into a retired total, so
+the number of shards tracks live threads rather than every thread ever seen. Values are per worker process; Prometheus sums
+them across workers at query time.
+"""
+
+import functools
+import inspect
+import math
+import threading
+import time
+import weakref
+from bisect import bisect_left
+from collections.abc import Callable, Iterator
+from typing import TypeVar
+
+from fastapi import Request
+
+from rs_backend.profiling import profiled_thread
+
+# Latency buckets in seconds, spanning fast CSV reads to slow Sheets round-trips
+DEFAULT_BUCKETS: tuple[float, ...] = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(
+    names: tuple[str, ...], values: tuple[str, ...], extra: str = ""
+) -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class _ShardHolder:
+    """Thread-local owner of a shard, so its thread's exit can be observed."""
+
+    __slots__ = ("__weakref__", "shard")
+
+    def __init__(self, shard: dict) -> None:
+        self.shard = shard
+
+
+class _ShardedMetric:
+    """Base for metrics whose state is kept in one dict per recording thread."""
+
+    kind = ""
+
+    def __init__(
+        self, name: str, help_text: str, labelnames: tuple[str, ...] = ()
+    ) -> None:
+        self.name = name
+        self.help_text = help_text
+        self.labelnames = labelnames
+        self._local = threading.local()
+        self._shards: list[dict] = []
+        # Merged shards of threads that have exited; replaced, never mutated
+        self._retired: dict = {}
+        self._shards_lock = threading.Lock()
+
+    def _shard(self) -> dict:
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            # Taken once per thread, never on the recording path
+            shard = {}
+            holder = self._local.holder = _ShardHolder(shard)
+            # Thread-local values are released when their thread exits
+            weakref.finalize(holder, self._retire, shard)
+            self._local.shard = shard
+            with self._shards_lock:
+                self._shards.append(shard)
+        return shard
+
+    def _retire(self, shard: dict) -> None:
+        with self._shards_lock:
+            self._shards = [live for live in self._shards if live is not shard]
+            self._retired = self._merge([self._retired, dict(shard)])
+
+    def _snapshot(self) -> list[dict]:
+        with self._shards_lock:
+            shards = list(self._shards)
+            retired = self._retired
+        # dict(shard) copies in C without releasing the GIL
+        return [retired, *(dict(shard) for shard in shards)]
+
+    def _merge(self, shards: list[dict]) -> dict:
+        """Combine shards into one new dict of per-series totals."""
+        raise NotImplementedError
+
+    def render(self) -> list[str]:
+        raise NotImplementedError
+
+
+class Counter(_ShardedMetric):
+    """Monotonically increasing count, optionally split by labels."""
+
+    kind = "counter"
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        """Add ``amount`` to the series identified by ``labels``."""
+        shard = self._shard()
+        shard[labels] = shard.get(labels, 0.0) + amount
+
+    def _merge(self, shards: list[dict]) -> dict[tuple[str, ...], float]:
+        totals: dict[tuple[str, ...], float] = {}
+        for shard in shards:
+            for labels, value in shard.items():
+                totals[labels] = totals.get(labels, 0.0) + value
+        return totals
+
+    def values(self) -> dict[tuple[str, ...], float]:
+        """Return the merged value of every series."""
+        return self._merge(self._snapshot())
+
+    def render(self) -> list[str]:
+        return [
+            f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}"
+            for labels, value in sorted(self.values().items())
+        ]
+
+
+class Histogram(_ShardedMetric):
+    """Distribution of observations over fixed buckets (e.g. latency)."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, help_text, labelnames)
+        self.buckets = buckets
+
+    def observe(self, value: float, *labels: str) -> None:
+        """Record one observation for the series identified by ``labels``."""
+        shard = self._shard()
+        state = shard.get(labels)
+        if state is None:
+            # One slot per bucket plus +Inf, then sum and count
+            state = shard[labels] = [0.0] * (len(self.buckets) + 3)
+        state[bisect_left(self.buckets, value)] += 1
+        state[-2] += value
+        state[-1] += 1
+
+    def _merge(self, shards: list[dict]) -> dict[tuple[str, ...], list[float]]:
+        merged: dict[tuple[str, ...], list[float]] = {}
+        for shard in shards:
+            for labels, state in shard.items():
+                totals = merged.setdefault(labels, [0.0] * len(state))
+                for i, value in enumerate(list(state)):
+                    totals[i] += value
+        return merged
+
+    def render(self) -> list[str]:
+        merged = self._merge(self._snapshot())
+
+        lines: list[str] = []
+        for labels, state in sorted(merged.items()):
+            cumulative = 0.0
+            for bound, count in zip((*self.buckets, math.inf), state):
+                cumulative += count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(
+                    f"{self.name}_bucket{_format_labels(self.labelnames, labels, le)} "
+                    f"{_format_value(cumulative)}"
+                )
+            label_str = _format_labels(self.labelnames, labels)
+            lines.append(f"{self.name}_sum{label_str} {_format_value(state[-2])}")
+            lines.append(f"{self.name}_count{label_str} {_format_value(state[-1])}")
+        return lines
+
+
+class Gauge:
+    """Point-in-time values computed by callbacks at scrape time."""
+
+    kind = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: tuple[str, ...] = (),
+        collect: Callable[[], dict[tuple[str, ...], float]] | None = None,
+    ) -> None:
+        self.name = name
+        self.help_text = help_text
+        self.labelnames = labelnames
+        self._collect = collect
+        self._callbacks: dict[tuple[str, ...], Callable[[], float]] = {}
+
+    def set_function(self, fn: Callable[[], float], *labels: str) -> None:
+        """Report ``fn()`` for the series identified by ``labels``."""
+        self._callbacks[labels] = fn
+
+    def values(self) -> dict[tuple[str, ...], float]:
+        """Evaluate every series."""
+        values = self._collect() if self._collect is not None else {}
+        for labels, fn in self._callbacks.items():
+            values[labels] = fn()
+        return values
+
+    def render(self) -> list[str]:
+        return [
+            f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}"
+            for labels, value in sorted(self.values().items())
+        ]
+
+
+MetricT = TypeVar("MetricT", bound="_ShardedMetric | Gauge")
+
+
+class MetricsRegistry:
+    """Ordered collection of metrics rendered together."""
+
+    def __init__(self) -> None:
+        self._metrics: list[_ShardedMetric | Gauge] = []
+
+    def register(self, metric: MetricT) -> MetricT:
+        """Add a metric to the registry and return it."""
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        """Render every metric in the Prometheus text exposition format."""
+        lines: list[str] = []
+        for metric in self._metrics:
+            lines.append(f"# HELP {metric.name} {metric.help_text}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+HTTP_REQUEST_DURATION = REGISTRY.register(
+    Histogram(
+        "rs_http_request_duration_seconds",
+        "HTTP request latency by route template.",
+        ("method", "route", "status"),
+    )
+)
+SERVICE_CALL_DURATION = REGISTRY.register(
+    Histogram(
+        "rs_service_call_duration_seconds",
+        "SurveyDataService call latency by backend and method.",
+        ("backend", "method"),
+    )
+)
+SERVICE_CALL_ERRORS = REGISTRY.register(
+    Counter(
+        "rs_service_call_errors_total",
+        "SurveyDataService calls that raised, by backend, method and exception type.",
+        ("backend", "method", "error"),
+    )
+)
+SHEETS_API_CALLS = REGISTRY.register(
+    Counter(
+        "rs_sheets_api_calls_total",
+        "Google Sheets API requests executed, by verb.",
+        ("verb",),
+    )
+)
+SHEETS_API_ERRORS = REGISTRY.register(
+    Counter(
+        "rs_sheets_api_errors_total",
+        "Google Sheets API requests that failed, by verb and HTTP status.",
+        ("verb", "status"),
+    )
+)
+CACHE_REQUESTS = REGISTRY.register(
+    Counter(
+        "rs_cache_requests_total",
+        "In-process cache lookups by cache and result (hit/miss).",
+        ("cache", "result"),
+    )
+)
+
+
+def _hit_ratios() -> dict[tuple[str, ...], float]:
+    lookups: dict[str, dict[str, float]] = {}
+    for (cache, result), count in CACHE_REQUESTS.values().items():
+        lookups.setdefault(cache, {})[result] = count
+    return {
+        (cache,): counts.get("hit", 0.0) / sum(counts.values())
+        for cache, counts in lookups.items()
+    }
+
+
+CACHE_HIT_RATIO = REGISTRY.register(
+    Gauge(
+        "rs_cache_hit_ratio",
+        "Fraction of cache lookups that were hits since process start.",
+        ("cache",),
+        collect=_hit_ratios,
+    )
+)
+CACHE_ENTRIES = REGISTRY.register(
+    Gauge(
+        "rs_cache_entries",
+        "Entries currently held by each in-process cache.",
+        ("cache",),
+    )
+)
+ADMISSION_SHED = REGISTRY.register(
+    Counter(
+        "rs_admission_shed_total",
+        "Requests answered 503 by admission control, by route class and reason.",
+        ("route_class", "reason"),
+    )
+)
+ADMISSION_IN_FLIGHT = REGISTRY.register(
+    Gauge(
+        "rs_admission_in_flight",
+        "Requests currently admitted, by route class.",
+        ("route_class",),
+    )
+)
+ADMISSION_QUEUE_DEPTH = REGISTRY.register(
+    Gauge(
+        "rs_admission_queue_depth",
+        "Requests waiting for admission, by route class.",
+        ("route_class",),
+    )
+)
+
+RATE_LIMITED = REGISTRY.register(
+    Counter(
+        "rs_rate_limited_total",
+        "Submissions answered 429 by the per-client rate limiter, by route.",
+        ("route",),
+    )
+)
+PRECOMPUTE_REFRESH_ERRORS = REGISTRY.register(
+    Counter(
+        "rs_precompute_refresh_errors_total",
+        "Background view refreshes that failed; the previous views stay in use.",
+    )
+)
+
+
+def record_cache_lookup(cache: str, hit: bool) -> None:
+    """Count one lookup against a named in-process cache."""
+    CACHE_REQUESTS.inc(cache, "hit" if hit else "miss")
+
+
+def _timed_iterator(iterator: Iterator, backend: str, method: str) -> Iterator:
+    """Time a streaming call from first request to exhaustion."""
+    started = time.perf_counter()
+    try:
+        yield from iterator
+    except Exception as e:
+        SERVICE_CALL_ERRORS.inc(backend, method, type(e).__name__)
+        raise
+    finally:
+        SERVICE_CALL_DURATION.observe(time.perf_counter() - started, backend, method)
+
+
+def _instrumented(original: Callable, backend: str, method: str) -> Callable:
+    @functools.wraps(original)
+    def wrapper(*args, **kwargs):
+        started = time.perf_counter()
+        try:
+            with profiled_thread():
+                result = original(*args, **kwargs)
+        except Exception as e:
+            SERVICE_CALL_ERRORS.inc(backend, method, type(e).__name__)
+            SERVICE_CALL_DURATION.observe(
+                time.perf_counter() - started, backend, method
+            )
+            raise
+        if inspect.isgenerator(result):
+            return _timed_iterator(result, backend, method)
+        SERVICE_CALL_DURATION.observe(time.perf_counter() - started, backend, method)
+        return result
+
+    return wrapper
+
+
+def instrument_service(service, backend: str, methods: frozenset[str]) -> None:
+    """Record latency and errors for each of ``methods`` on a service instance."""
+    for method in methods:
+        setattr(
+            service, method, _instrumented(getattr(service, method), backend, method)
+        )
+
+
+async def metrics_middleware(request: Request, call_next):
+    """Record request latency labelled by the matched route template."""
+    started = time.perf_counter()
+    status = "500"
+    try:
+        response = await call_next(request)
+        status = str(response.status_code)
+        return response
+    finally:
+        route = request.scope.get("route")
+        HTTP_REQUEST_DURATION.observe(
+            time.perf_counter() - started,
+            request.method,
+            getattr(route, "path", "unmatched"),
+            status,
+        )
@@ -0,0 +1,193 @@
+"""Report and story views precomputed in the background.
+
+Without this, every report or story-list request reads storage (or counts)
+itself, so its latency is whatever the backend's latency is at that moment.
+A PrecomputeScheduler started in the lifespan instead rebuilds the views off
+the request path and publishes them as one immutable ``Views`` object; the
+handlers only read the latest one, which costs no storage access at all.
+
+The cadence adapts to traffic: a write wakes the scheduler, which waits
+``precompute_active_interval_seconds`` to gather the rest of a burst and then
+refreshes. With no writes it still refreshes every
+``precompute_idle_interval_seconds``, which picks up rows written by other
+workers or directly into the spreadsheet.
+
+Readers get the latest published views even while a refresh is pending, so a
+burst of writes does not send reads to storage. Staleness is bounded: views
+older than ``precompute_max_staleness_seconds`` (refreshes keep failing) are
+not served. The one exception is a client that wrote since the views were
+computed: until a refresh includes its write, its own reads are computed on
+demand, so it always sees what it just submitted. Clients are identified as
+by the rate limiter (device token, else IP) and tracked per process.
+
+Precompute is off by default (``precompute_enabled``): the idle refreshes
+reread every story and both reports, which costs Sheets quota per worker.
+
+Each view also carries its response already encoded (JSON plus gzip, see
+rs_backend.responses). A refresh that finds a view unchanged reuses the
+previous bytes, so encoding happens once per version of the data.
+
+Views cover the deployment's own storage; requests for a ward (see
+rs_backend.tenants) are computed on demand as before.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+
+from fastapi import Request
+from loguru import logger
+from pydantic import TypeAdapter
+
+from rs_backend.metrics import PRECOMPUTE_REFRESH_ERRORS
+from rs_backend.rate_limit import client_id
+from rs_backend.responses import EncodedResponse, encode_json
+from rs_backend.schemas.missionary_experience import MissionaryExperienceReport
+from rs_backend.schemas.story import Story
+from rs_backend.schemas.survey import MinisteringReport
+from rs_backend.services.base import SurveyDataService
+from rs_backend.settings import Settings
+
+_ADAPTERS = {
+    "ministering": TypeAdapter(MinisteringReport),
+    "missionary_experience": TypeAdapter(MissionaryExperienceReport),
+    "stories": TypeAdapter(tuple[Story, ...]),
+}
+
+
+@dataclass(frozen=True)
+class Views:
+    """One consistent set of precomputed results. Never mutated once published."""
+
+    ministering: MinisteringReport
+    missionary_experience: MissionaryExperienceReport
+    # Newest first, as served by GET /stories/
+    stories: tuple[Story, ...]
+    # Encoded response per view, keyed like the fields above
+    responses: dict[str, EncodedResponse]
+    computed_at: float
+
+
+def compute_views(service: SurveyDataService, previous: Views | None = None) -> Views:
+    """Read storage and build every view (blocking; run off the event loop).
+
+    Responses of views equal to those in ``previous`` are reused, not re-encoded.
+    """
+    values = {
+        "ministering": service.get_ministering_reports(),
+        "missionary_experience": service.get_missionary_experience_report(),
+        "stories": tuple(
+            sorted(
+                service.get_stories(), key=lambda s: s.datetime_submitted, reverse=True
+            )
+        ),
+    }
+    responses = {
+        name: (
+            previous.responses[name]
+            if previous is not None and getattr(previous, name) == value
+            else encode_json(_ADAPTERS[name], value)
+        )
+        for name, value in values.items()
+    }
+    return Views(**values, responses=responses, computed_at=time.time())
+
+
+class PrecomputeScheduler:
+    """Refresh ``views`` from ``service``, soon after writes and slowly when idle."""
+
+    def __init__(
+        self,
+        service: SurveyDataService,
+        active_interval_seconds: float,
+        idle_interval_seconds: float,
+        max_staleness_seconds: float = 120.0,
+    ) -> None:
+        self.service = service
+        self.active_interval_seconds = active_interval_seconds
+        self.idle_interval_seconds = idle_interval_seconds
+        self.max_staleness_seconds = max_staleness_seconds
+        self.views: Views | None = None
+        self._written = asyncio.Event()
+        # Writes noted so far, and how many of them ``views`` is known to include
+        self._writes = 0
+        self._views_writes = 0
+        # Client -> number of its latest write, while views do not include it
+        self._writers: dict[str, int] = {}
+
+    def note_write(self, client: str = "") -> None:
+        """Record ``client``'s write and schedule a refresh (call from the event loop)."""
+        self._writes += 1
+        self._writers[client] = self._writes
+        self._written.set()
+
+    def views_for(self, client: str = "") -> Views | None:
+        """Return the latest views, unless too old or missing ``client``'s own writes."""
+        views = self.views
+        if (
+            views is None
+            or time.time() - views.computed_at > self.max_staleness_seconds
+        ):
+            return None
+        if self._writers.get(client, 0) > self._views_writes:
+            return None
+        return views
+
+    async def refresh(self) -> None:
+        """Rebuild and publish the views; on failure keep the previous ones."""
+        # Writes noted while computing may have landed after their rows were read
+        writes = self._writes
+        try:
+            views = await asyncio.to_thread(compute_views, self.service, self.views)
+        except Exception:  # noqa: BLE001  # Any failure keeps the previous views
+            PRECOMPUTE_REFRESH_ERRORS.inc()
+            logger.exception("Precompute refresh failed; keeping previous views")
+            return
+        self.views = views
+        self._views_writes = writes
+        self._writers = {
+            client: write for client, write in self._writers.items() if write > writes
+        }
+
+    async def run(self) -> None:
+        """Refresh forever on the adaptive cadence, until cancelled."""
+        while True:
+            try:
+                await asyncio.wait_for(
+                    self._written.wait(), timeout=self.idle_interval_seconds
+                )
+            except TimeoutError:
+                pass
+            else:
+                # Let the rest of a burst of writes land before recomputing
+                await asyncio.sleep(self.active_interval_seconds)
+            self._written.clear()
+            await self.refresh()
+
+
+def _client(request: Request) -> str:
+    settings: Settings = request.app.state.settings
+    return client_id(request, settings.rate_limit_trust_forwarded_for)
+
+
+def current_views(request: Request) -> Views | None:
+    """Return the latest views for the request, or None to compute on demand."""
+    if getattr(request.state, "tenant", None) is not None:
+        return None
+    scheduler: PrecomputeScheduler | None = getattr(
+        request.app.state, "precompute", None
+    )
+    if scheduler is None:
+        return None
+    return scheduler.views_for(_client(request))
+
+
+def note_write(request: Request) -> None:
+    """Tell the scheduler (if running) that the request wrote to its storage."""
+    if getattr(request.state, "tenant", None) is not None:
+        return
+    scheduler: PrecomputeScheduler | None = getattr(
+        request.app.state, "precompute", None
+    )
+    if scheduler is not None:
+        scheduler.note_write(_client(request))
@@ -0,0 +1,200 @@
+"""Opt-in sampling profiler for single requests.
+
+When ``profiling_enabled`` is set and a request carries ``X-Profile-Token``
+matching ``admin_token``, a background thread samples Python stacks
+(``sys._current_frames``) at a fixed interval while that request is handled.
+Only the threads working for the request are sampled: the event-loop thread
+running it, and threadpool workers while they run its storage calls (see
+``profiled_thread``, applied by ``rs_backend.metrics.instrument_service``).
+Idle workers and threads busy with other requests' storage calls are left
+out. Samples are written in the "collapsed stacks" format
+(``thread;outer;...;inner count`` per line) that flamegraph.pl, speedscope
+and inferno all read.
+
+The profile is saved under ``profiling_output_dir`` and its file name is
+returned in ``X-Profile-File``. With ``X-Profile-Return: 1`` the profile itself
+is returned as the response body instead.
+"""
+
+import asyncio
+import sys
+import threading
+import time
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import UTC, datetime
+from pathlib import Path
+
+from fastapi import Request, Response
+from loguru import logger
+
+from rs_backend.settings import Settings
+
+PROFILE_TOKEN_HEADER = "X-Profile-Token"
+PROFILE_RETURN_HEADER = "X-Profile-Return"
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    return f"{Path(code.co_filename).name}:{code.co_name}:{frame.f_lineno}"
+
+
+class StackSampler:
+    """Sample watched threads' stacks on a background thread into collapsed-stack counts."""
+
+    def __init__(self, interval_seconds: float) -> None:
+        """Sample every ``interval_seconds`` once started."""
+        self.interval_seconds = interval_seconds
+        self.samples: Counter[str] = Counter()
+        # Thread id -> how many watches are open on it (calls may nest)
+        self._watched: Counter[int] = Counter()
+        self._watched_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="rs-profiler", daemon=True
+        )
+
+    def watch(self, thread_id: int) -> None:
+        """Include ``thread_id`` in samples until a matching ``unwatch``."""
+        with self._watched_lock:
+            self._watched[thread_id] += 1
+
+    def unwatch(self, thread_id: int) -> None:
+        """Undo one ``watch`` of ``thread_id``."""
+        with self._watched_lock:
+            self._watched[thread_id] -= 1
+            if self._watched[thread_id] <= 0:
+                del self._watched[thread_id]
+
+    def start(self) -> None:
+        """Begin sampling."""
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop sampling and wait for the sampler thread to exit."""
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval_seconds):
+            with self._watched_lock:
+                watched = list(self._watched)
+            if not watched:
+                continue
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            frames = sys._current_frames()
+            for thread_id in watched:
+                frame = frames.get(thread_id)
+                if frame is None:
+                    continue
+                stack: list[str] = []
+                while frame is not None:
+                    stack.append(_frame_label(frame))
+                    frame = frame.f_back
+                stack.append(names.get(thread_id, str(thread_id)))
+                self.samples[";".join(reversed(stack))] += 1
+
+    def collapsed(self) -> str:
+        """Render the samples in collapsed-stack format, heaviest first."""
+        return "".join(
+            f"{stack} {count}\n" for stack, count in self.samples.most_common()
+        )
+
+
+# The sampler of the request being handled in this context, if it is profiled
+_ACTIVE_SAMPLER: ContextVar[StackSampler | None] = ContextVar(
+    "active_sampler", default=None
+)
+
+
+@contextmanager
+def profiled_thread() -> Iterator[None]:
+    """Sample the current thread while the block runs, if its request is profiled.
+
+    Threadpool calls copy the request's context, so work handed to a worker
+    thread is attributed to the request only for as long as it runs there.
+    """
+    sampler = _ACTIVE_SAMPLER.get()
+    if sampler is None:
+        yield
+        return
+    thread_id = threading.get_ident()
+    sampler.watch(thread_id)
+    try:
+        yield
+    finally:
+        sampler.unwatch(thread_id)
+
+
+def _write_profile(profile_file: Path, profile: str) -> None:
+    profile_file.parent.mkdir(parents=True, exist_ok=True)
+    profile_file.write_text(profile)
+
+
+# Only one request is profiled at a time; sampling is not free
+_profile_lock = threading.Lock()
+
+
+async def profiling_middleware(request: Request, call_next):
+    """Profile the request if it carries a valid X-Profile-Token."""
+    settings: Settings = request.app.state.settings
+    if not settings.profiling_enabled or not settings.admin_token_matches(
+        request.headers.get(PROFILE_TOKEN_HEADER)
+    ):
+        return await call_next(request)
+    if not _profile_lock.acquire(blocking=False):
+        response = await call_next(request)
+        response.headers["X-Profile-Skipped"] = "another request is being profiled"
+        return response
+
+    try:
+        sampler = StackSampler(settings.profiling_interval_ms / 1000)
+        # The event-loop thread runs the handler itself
+        loop_thread_id = threading.get_ident()
+        sampler.watch(loop_thread_id)
+        # call_next runs the app in a task, which copies this context
+        token = _ACTIVE_SAMPLER.set(sampler)
+        started = time.perf_counter()
+        sampler.start()
+        try:
+            response = await call_next(request)
+            # Drain the body so streamed work is included in the profile
+            body = b"".join([chunk async for chunk in response.body_iterator])
+        finally:
+            sampler.stop()
+            _ACTIVE_SAMPLER.reset(token)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+    finally:
+        _profile_lock.release()
+
+    profile = sampler.collapsed()
+    stamp = datetime.now(UTC).strftime("%Y%m%dT%H%M%S%fZ")
+    slug = request.url.path.strip("/").replace("/", "_") or "root"
+    profile_file = (
+        settings.profiling_output_dir
+        / f"{stamp}-{request.method.lower()}-{slug}.collapsed"
+    )
+    # File I/O stays off the event loop
+    await asyncio.to_thread(_write_profile, profile_file, profile)
+    logger.info(
+        "Request profiled",
+        profile_file=str(profile_file),
+        samples=sum(sampler.samples.values()),
+        elapsed_ms=round(elapsed_ms, 2),
+    )
+
+    headers = {
+        name: value
+        for name, value in response.headers.items()
+        if name.lower() != "content-length"
+    }
+    headers["X-Profile-File"] = profile_file.name
+    if request.headers.get(PROFILE_RETURN_HEADER) == "1":
+        headers = {
+            "X-Profile-File": profile_file.name,
+            "X-Profiled-Status": str(response.status_code),
+        }
+        return Response(content=profile, media_type="text/plain", headers=headers)
+    return Response(content=body, status_code=response.status_code, headers=headers)
@@ -50,8 +50,17 @@ def to_sheet_text(question_text: str) -> str:
     with only its trailing "?" stripped.
     """
     text = question_text
-    if text.startswith(_DID_YOU_PREFIX):
-        text = text[len(_DID_YOU_PREFIX):]
-    if text.endswith("?"):
-        text = text[:-1]
+    text = text.removeprefix(_DID_YOU_PREFIX)
+    text = text.removesuffix("?")
     return text.strip()
+
+
+def persisted_question_text(question: Question, other_text: str | None = None) -> str:
+    """Return the text stored alongside a question_id when an answer is saved.
+
+    For "Other", the user's verbatim description is persisted rather than
+    the canonical "Other" label so the row is self-explanatory.
+    """
+    if question.id == OTHER_QUESTION_ID:
+        return (other_text or "").strip() or question.text
+    return to_sheet_text(question.text)
@@ -0,0 +1,145 @@
+"""Per-client rate limiting for the submission endpoints.
+
+Every POST to a limited path is counted against the client, identified by
+its ``X-Device-Token`` header or, failing that, its IP address. Device tokens
+let members sharing a meetinghouse's Wi-Fi be limited separately, but they
+are chosen by the client, so a client rotating tokens would never be
+limited. Token-bearing requests therefore also count against a per-IP
+backstop of ``rate_limit_device_ip_factor`` times the per-client limit,
+checked first so a rejected request creates no per-token entry. Counting uses
+the sliding-window counter approximation: each client keeps only the counts
+of the current and previous fixed windows, and the previous count is weighted
+by how much of it still overlaps the sliding window. That is O(1) memory per
+client, and clients live in a bounded LRU, so memory stays flat however many
+clients appear. Over-limit requests get ``429`` with ``Retry-After`` before
+any backend work happens.
+"""
+
+import math
+import threading
+import time
+from collections import OrderedDict
+
+from fastapi import Request
+from fastapi.responses import JSONResponse
+from loguru import logger
+
+from rs_backend.metrics import RATE_LIMITED
+from rs_backend.settings import Settings
+
+DEVICE_TOKEN_HEADER = "X-Device-Token"
+
+_PERIODS = {"second": 1, "minute": 60, "hour": 3600}
+
+
+def parse_rate(spec: str) -> tuple[int, float]:
+    """Parse ``"20/minute"`` into (20, 60.0)."""
+    count, _, period = spec.partition("/")
+    if not count.strip().isdigit() or period.strip() not in _PERIODS:
+        raise ValueError(f"Invalid rate {spec!r}; expected e.g. '20/minute'")
+    return int(count), float(_PERIODS[period.strip()])
+
+
+class SlidingWindowRateLimiter:
+    """Sliding-window counters per (route, client), held in a bounded LRU."""
+
+    def __init__(self, max_keys: int) -> None:
+        """Track at most ``max_keys`` (route, client) pairs; the stalest are evicted."""
+        self.max_keys = max_keys
+        # key -> [window index, previous window count, current window count]
+        self._windows: OrderedDict[tuple[str, str], list[int]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._windows)
+
+    def hit(
+        self,
+        route: str,
+        client: str,
+        limit: int,
+        window_seconds: float,
+        now: float | None = None,
+    ) -> float | None:
+        """Count one request; return None if allowed, else seconds until a retry may pass."""
+        now = time.time() if now is None else now
+        window = int(now // window_seconds)
+        elapsed = (now - window * window_seconds) / window_seconds
+        key = (route, client)
+
+        with self._lock:
+            state = self._windows.get(key)
+            if state is None:
+                state = self._windows[key] = [window, 0, 0]
+                while len(self._windows) > self.max_keys:
+                    self._windows.popitem(last=False)
+            else:
+                self._windows.move_to_end(key)
+                if window == state[0] + 1:
+                    state[:] = [window, state[2], 0]
+                elif window != state[0]:
+                    state[:] = [window, 0, 0]
+
+            _, previous, current = state
+            if previous * (1 - elapsed) + current + 1 <= limit:
+                state[2] += 1
+                return None
+
+        if current + 1 > limit:
+            # Nothing passes until this window ends and the count becomes "previous"
+            return (1 - elapsed) * window_seconds
+        # Wait for the previous window's weight to decay enough
+        needed = 1 - (limit - current - 1) / previous
+        return max(needed - elapsed, 0.0) * window_seconds
+
+
+def client_ip(request: Request, trust_forwarded_for: bool) -> str:
+    """Return the client's (forwarded) IP address."""
+    if trust_forwarded_for and (forwarded := request.headers.get("X-Forwarded-For")):
+        return forwarded.split(",")[0].strip()
+    return request.client.host if request.client else "unknown"
+
+
+def client_id(request: Request, trust_forwarded_for: bool) -> str:
+    """Identify the client by device token, else by (forwarded) IP address."""
+    token = request.headers.get(DEVICE_TOKEN_HEADER)
+    if token:
+        return f"device:{token}"
+    return f"ip:{client_ip(request, trust_forwarded_for)}"
+
+
+async def rate_limit_middleware(request: Request, call_next):
+    """Reject submissions from clients over their per-route limit with 429."""
+    limits: dict[str, tuple[int, float]] = request.app.state.rate_limits
+    path = request.url.path
+    if request.method != "POST" or path not in limits:
+        return await call_next(request)
+
+    settings: Settings = request.app.state.settings
+    limiter: SlidingWindowRateLimiter = request.app.state.rate_limiter
+    limit, window_seconds = limits[path]
+    client = client_id(request, settings.rate_limit_trust_forwarded_for)
+    retry_after = None
+    if not client.startswith("ip:"):
+        # Backstop for all device tokens from one address
+        ip = client_ip(request, settings.rate_limit_trust_forwarded_for)
+        retry_after = limiter.hit(
+            path,
+            f"devices-from:{ip}",
+            limit * settings.rate_limit_device_ip_factor,
+            window_seconds,
+        )
+    if retry_after is None:
+        retry_after = limiter.hit(path, client, limit, window_seconds)
+    if retry_after is None:
+        return await call_next(request)
+
+    RATE_LIMITED.inc(path)
+    logger.warning(
+        "Rate limited", client=client, limit=limit, window_seconds=window_seconds
+    )
+    return JSONResponse(
+        status_code=429,
+        content={"detail": "Too many submissions; please wait and try again."},
+        headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+    )
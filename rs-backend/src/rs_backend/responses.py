@@ -0,0 +1,61 @@
+"""Responses encoded once and served as raw bytes.
+
+For data that changes rarely or never (the question list, precomputed
+report and story views) the JSON body and its gzip variant are built once
+per version of the data, off the request path. Handlers then return the
+stored bytes, so a request costs no validation, serialization or
+compression. JSON is encoded by pydantic-core's Rust serializer via
+``TypeAdapter.dump_json``.
+"""
+
+import gzip
+from dataclasses import dataclass
+from typing import Any
+
+from fastapi import Request, Response
+from pydantic import TypeAdapter
+
+# Below this, gzip saves too little to be worth a Content-Encoding
+GZIP_MIN_SIZE = 500
+
+
+@dataclass(frozen=True)
+class EncodedResponse:
+    """A JSON body and, when large enough to benefit, its gzip variant."""
+
+    body: bytes
+    gzipped: bytes | None
+
+
+def encode_json(adapter: TypeAdapter, value: Any) -> EncodedResponse:
+    """Serialize ``value`` and compress it once, for serving many times."""
+    body = adapter.dump_json(value)
+    # mtime=0 keeps the bytes identical for identical data
+    gzipped = gzip.compress(body, mtime=0) if len(body) >= GZIP_MIN_SIZE else None
+    return EncodedResponse(body=body, gzipped=gzipped)
+
+
+def accepts_gzip(request: Request) -> bool:
+    """Whether the client's Accept-Encoding allows gzip."""
+    for coding in request.headers.get("accept-encoding", "").split(","):
+        name, _, params = coding.partition(";")
+        if name.strip().lower() in ("gzip", "*"):
+            return params.replace(" ", "") not in ("q=0", "q=0.0", "q=0.00", "q=0.000")
+    return False
+
+
+def encoded_response(request: Request, encoded: EncodedResponse) -> Response:
+    """Return the stored bytes, gzipped if the client accepts it."""
+    if encoded.gzipped is None:
+        return Response(content=encoded.body, media_type="application/json")
+    if accepts_gzip(request):
+        return Response(
+            content=encoded.gzipped,
+            media_type="application/json",
+            headers={"Content-Encoding": "gzip", "Vary": "Accept-Encoding"},
+        )
+    return Response(
+        content=encoded.body,
+        media_type="application/json",
+        headers={"Vary": "Accept-Encoding"},
+    )
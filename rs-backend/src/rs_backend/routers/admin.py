@@ -0,0 +1,109 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.concurrency import run_in_threadpool
+
+from rs_backend.memory import GroupBy, MemoryDiagnostics, TracingNotStartedError
+from rs_backend.schemas.memory import AllocationSite, MemorySnapshotInfo, MemoryStatus
+from rs_backend.settings import Settings
+
+ADMIN_TOKEN_HEADER = "X-Admin-Token"
+
+
+def require_admin(request: Request) -> None:
+    """Reject requests without a valid X-Admin-Token (or when no token is configured)."""
+    settings: Settings = request.app.state.settings
+    if not settings.admin_token_matches(request.headers.get(ADMIN_TOKEN_HEADER)):
+        raise HTTPException(status_code=403, detail="Admin token required")
+
+
+router = APIRouter(
+    prefix="/admin", tags=["admin"], dependencies=[Depends(require_admin)]
+)
+
+
+def get_memory_diagnostics(request: Request) -> MemoryDiagnostics:
+    """Return the app's memory diagnostics, creating them on first use."""
+    diagnostics: MemoryDiagnostics | None = getattr(
+        request.app.state, "memory_diagnostics", None
+    )
+    if diagnostics is None:
+        diagnostics = request.app.state.memory_diagnostics = MemoryDiagnostics()
+    return diagnostics
+
+
+@router.get("/memory", response_model=MemoryStatus)
+async def get_memory_status(request: Request) -> MemoryStatus:
+    """Tracing state, process peak RSS, held snapshots and in-process cache sizes."""
+    return get_memory_diagnostics(request).status()
+
+
+@router.post("/memory/start", response_model=MemoryStatus)
+async def start_memory_tracing(
+    request: Request,
+    frames: int = Query(
+        default=1, ge=1, le=64, description="Traceback frames kept per allocation"
+    ),
+) -> MemoryStatus:
+    """Start tracemalloc (restarting it if already tracing)."""
+    diagnostics = get_memory_diagnostics(request)
+    diagnostics.start(frames)
+    return diagnostics.status()
+
+
+@router.post("/memory/stop", response_model=MemoryStatus)
+async def stop_memory_tracing(request: Request) -> MemoryStatus:
+    """Stop tracemalloc and discard held snapshots."""
+    diagnostics = get_memory_diagnostics(request)
+    # Freeing the traces of a large heap takes a while
+    await run_in_threadpool(diagnostics.stop)
+    return diagnostics.status()
+
+
+@router.post("/memory/snapshots", response_model=MemorySnapshotInfo)
+async def take_memory_snapshot(request: Request) -> MemorySnapshotInfo:
+    """Take a snapshot of current allocations for later inspection or diffing."""
+    # Snapshots and their statistics take seconds on a large heap, so they run
+    # in the threadpool rather than stalling the event loop
+    try:
+        return await run_in_threadpool(get_memory_diagnostics(request).take_snapshot)
+    except TracingNotStartedError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+
+
+@router.get("/memory/snapshots/{snapshot_id}", response_model=list[AllocationSite])
+async def get_memory_snapshot_top(
+    snapshot_id: int,
+    request: Request,
+    limit: int = Query(default=20, ge=1, le=500),
+    group_by: GroupBy = "lineno",
+) -> list[AllocationSite]:
+    """Largest allocation sites in a snapshot."""
+    try:
+        return await run_in_threadpool(
+            get_memory_diagnostics(request).top,
+            snapshot_id,
+            limit=limit,
+            group_by=group_by,
+        )
+    except KeyError:
+        raise HTTPException(status_code=404, detail=f"Unknown snapshot: {snapshot_id}")
+
+
+@router.get("/memory/diff", response_model=list[AllocationSite])
+async def get_memory_diff(
+    request: Request,
+    base: int = Query(description="Earlier snapshot id"),
+    current: int = Query(description="Later snapshot id"),
+    limit: int = Query(default=20, ge=1, le=500),
+    group_by: GroupBy = "lineno",
+) -> list[AllocationSite]:
+    """Allocation sites ordered by growth between two snapshots."""
+    try:
+        return await run_in_threadpool(
+            get_memory_diagnostics(request).diff,
+            base,
+            current,
+            limit=limit,
+            group_by=group_by,
+        )
+    except KeyError as e:
+        raise HTTPException(status_code=404, detail=f"Unknown snapshot: {e.args[0]}")
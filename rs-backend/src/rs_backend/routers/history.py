@@ -0,0 +1,22 @@
+from fastapi import APIRouter, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from pydantic import TypeAdapter
+
+from rs_backend.schemas.survey_history import SurveyHistoryReport
+from rs_backend.services.survey_history import get_survey_history_report
+from rs_backend.settings import Settings
+from rs_backend.timing import json_response
+
+router = APIRouter(prefix="/history", tags=["history"])
+
+_REPORT_ADAPTER = TypeAdapter(SurveyHistoryReport)
+
+
+@router.get("/cfm-survey", response_model=SurveyHistoryReport)
+async def get_cfm_survey_history(request: Request) -> Response:
+    """Yes-rates by organization and by week from the legacy 0.1.0 survey."""
+    settings: Settings = request.app.state.settings
+    report = await run_in_threadpool(
+        get_survey_history_report, settings.survey_history_file
+    )
+    return json_response(_REPORT_ADAPTER, report)
@@ -0,0 +1,97 @@
+from datetime import datetime
+
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
+
+from rs_backend.precompute import note_write
+from rs_backend.questions import QUESTIONS_BY_ID, persisted_question_text
+from rs_backend.schemas.enums import Dataset
+from rs_backend.schemas.ingest import (
+    IngestBatchRequest,
+    IngestBatchResponse,
+    MinisteringEventItem,
+    MissionaryExperienceItem,
+    StoryItem,
+)
+from rs_backend.schemas.story import Story
+from rs_backend.search import StoryIndex
+from rs_backend.services.base import SurveyDataService
+from rs_backend.tenants import get_service, ward_state
+from rs_backend.timestamps import from_datetime, now_epoch
+
+router = APIRouter(prefix="/ingest", tags=["ingest"])
+
+
+def _client_epoch(client_timestamp: datetime, now: int) -> int:
+    """Return a client timestamp in epoch seconds, like server-side submissions.
+
+    Naive timestamps are taken as UTC; timestamps from a fast device clock
+    are clamped to the server's current time.
+    """
+    return min(from_datetime(client_timestamp), now)
+
+
+@router.post("/batch", response_model=IngestBatchResponse)
+async def ingest_batch(
+    payload: IngestBatchRequest, request: Request
+) -> IngestBatchResponse:
+    """Validate a batch of queued submissions, then write each dataset in one call.
+
+    The batch is all-or-nothing: if any item is invalid, nothing is written
+    and every problem is reported with its item index.
+    """
+    service: SurveyDataService = get_service(request)
+    now = now_epoch()
+
+    rows: dict[Dataset, list[tuple[int, list]]] = {dataset: [] for dataset in Dataset}
+    errors: list[str] = []
+    for i, item in enumerate(payload.items):
+        submitted = _client_epoch(item.client_timestamp, now)
+        if isinstance(item, MinisteringEventItem):
+            rows[Dataset.MINISTERING_EVENTS].append(
+                (submitted, [submitted, item.organization.value])
+            )
+        elif isinstance(item, MissionaryExperienceItem):
+            if not item.answers:
+                errors.append(f"items[{i}]: at least one answer must be selected.")
+            for answer in item.answers:
+                question = QUESTIONS_BY_ID.get(answer.question_id)
+                if question is None:
+                    errors.append(
+                        f"items[{i}]: unknown question_id: {answer.question_id}"
+                    )
+                    continue
+                rows[Dataset.MISSIONARY_EXPERIENCES].append(
+                    (
+                        submitted,
+                        [
+                            submitted,
+                            item.organization.value,
+                            str(question.id),
+                            persisted_question_text(question, answer.other_text),
+                        ],
+                    )
+                )
+        elif isinstance(item, StoryItem):
+            rows[Dataset.STORIES].append((submitted, [submitted, item.content]))
+
+    if errors:
+        raise HTTPException(status_code=400, detail=errors)
+
+    saved: dict[str, int] = {}
+    for dataset, dataset_rows in rows.items():
+        # Append in submission order; the sort is stable for equal timestamps
+        dataset_rows.sort(key=lambda entry: entry[0])
+        await run_in_threadpool(
+            service.append_dataset_rows, dataset, [row for _, row in dataset_rows]
+        )
+        saved[dataset.value] = len(dataset_rows)
+    if payload.items:
+        note_write(request)
+
+    index: StoryIndex | None = getattr(ward_state(request), "story_index", None)
+    if index is not None:
+        for submitted, (_, content) in rows[Dataset.STORIES]:
+            index.add(Story(datetime_submitted=submitted, content=content))
+
+    return IngestBatchResponse(saved=saved)
@@ -1,27 +1,35 @@
-from datetime import datetime, timezone
-
-from fastapi import APIRouter, HTTPException, Request
+from fastapi import APIRouter, HTTPException, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from pydantic import TypeAdapter
 
+from rs_backend.precompute import current_views, note_write
 from rs_backend.questions import (
-    OTHER_QUESTION_ID,
     QUESTIONS,
     QUESTIONS_BY_ID,
     Question,
-    to_sheet_text,
+    persisted_question_text,
 )
+from rs_backend.responses import encode_json, encoded_response
 from rs_backend.schemas.missionary_experience import (
     MissionaryExperienceReport,
     MissionaryExperienceRequest,
 )
 from rs_backend.services.base import SurveyDataService
+from rs_backend.tenants import get_service
+from rs_backend.timestamps import now_epoch
+from rs_backend.timing import json_response
 
 router = APIRouter(prefix="/missionary-experience", tags=["missionary-experience"])
 
+_REPORT_ADAPTER = TypeAdapter(MissionaryExperienceReport)
+# The question list never changes while the process runs
+_QUESTIONS_RESPONSE = encode_json(TypeAdapter(list[Question]), QUESTIONS)
+
 
 @router.get("/questions", response_model=list[Question])
-async def list_questions() -> list[Question]:
+async def list_questions(request: Request) -> Response:
     """Return the canonical list of 'Did you...' questions."""
-    return QUESTIONS
+    return encoded_response(request, _QUESTIONS_RESPONSE)
 
 
 @router.post("/", response_model=dict[str, int])
@@ -29,14 +37,14 @@ async def submit_missionary_experience(
     payload: MissionaryExperienceRequest, request: Request
 ) -> dict[str, int]:
     """Submit one or more 'Did you...' answers; writes one sheet row per answer."""
-    service: SurveyDataService = request.app.state.survey_data_service
+    service: SurveyDataService = get_service(request)
 
     if not payload.answers:
         raise HTTPException(
             status_code=400, detail="At least one answer must be selected."
         )
 
-    datetime_submitted = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")
+    datetime_submitted = now_epoch()
     saved = 0
     for answer in payload.answers:
         question = QUESTIONS_BY_ID.get(answer.question_id)
@@ -45,25 +53,25 @@ async def submit_missionary_experience(
                 status_code=400,
                 detail=f"Unknown question_id: {answer.question_id}",
             )
-        if question.id == OTHER_QUESTION_ID:
-            # For "Other", persist the user's verbatim description rather
-            # than the canonical "Other" label so the row is self-explanatory.
-            question_text = (answer.other_text or "").strip() or question.text
-        else:
-            question_text = to_sheet_text(question.text)
-        service.save_missionary_experience_answer(
+        await run_in_threadpool(
+            service.save_missionary_experience_answer,
             datetime_submitted=datetime_submitted,
             organization=payload.organization,
             question_id=question.id,
-            question_text=question_text,
+            question_text=persisted_question_text(question, answer.other_text),
         )
         saved += 1
+    note_write(request)
 
     return {"saved": saved}
 
 
 @router.get("/reports", response_model=MissionaryExperienceReport)
-async def get_report(request: Request) -> MissionaryExperienceReport:
+async def get_report(request: Request) -> Response:
     """COUNT(*) of answer rows GROUP BY organization."""
-    service: SurveyDataService = request.app.state.survey_data_service
-    return service.get_missionary_experience_report()
+    views = current_views(request)
+    if views is not None:
+        return encoded_response(request, views.responses["missionary_experience"])
+    service: SurveyDataService = get_service(request)
+    report = await run_in_threadpool(service.get_missionary_experience_report)
+    return json_response(_REPORT_ADAPTER, report)
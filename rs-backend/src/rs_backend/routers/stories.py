@@ -1,37 +1,125 @@
-from datetime import datetime, timezone
+from fastapi import APIRouter, HTTPException, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from pydantic import TypeAdapter
 
-from fastapi import APIRouter, Request
-
-from rs_backend.schemas.story import Story, StoryCreate
+from rs_backend.precompute import current_views, note_write
+from rs_backend.responses import encoded_response
+from rs_backend.schemas.story import NumberedStory, Story, StoryCreate, StoryPage
+from rs_backend.search import StoryIndex
 from rs_backend.services.base import SurveyDataService
+from rs_backend.services.story_log import StoryLog
+from rs_backend.tenants import get_service, ward_state
+from rs_backend.timestamps import now_epoch
+from rs_backend.timing import json_response, span
 
 router = APIRouter(prefix="/stories", tags=["stories"])
 
+_STORIES_ADAPTER = TypeAdapter(list[Story])
+_PAGE_ADAPTER = TypeAdapter(StoryPage)
+
+
+def get_story_index(request: Request) -> StoryIndex:
+    """Return the ward's story index, building it from storage on first use."""
+    owner = ward_state(request)
+    index: StoryIndex | None = getattr(owner, "story_index", None)
+    if index is None:
+        service: SurveyDataService = get_service(request)
+        index = StoryIndex(service.get_stories())
+        owner.story_index = index
+    return index
+
 
 @router.post("/", response_model=Story)
 async def post_story(story: StoryCreate, request: Request) -> Story:
     """Post an anonymous story."""
-    service: SurveyDataService = request.app.state.survey_data_service
-    
-    datetime_submitted = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")
-    service.save_story(
+    service: SurveyDataService = get_service(request)
+
+    datetime_submitted = now_epoch()
+    await run_in_threadpool(
+        service.save_story,
         datetime_submitted=datetime_submitted,
         content=story.content,
     )
-    
-    return Story(
+    note_write(request)
+    saved = Story(
         datetime_submitted=datetime_submitted,
         content=story.content,
     )
 
+    index: StoryIndex | None = getattr(ward_state(request), "story_index", None)
+    if index is not None:
+        index.add(saved)
+
+    return saved
+
+
+@router.get("/search", response_model=list[Story])
+async def search_stories(
+    request: Request,
+    q: str = Query(min_length=1),
+    limit: int = Query(default=20, ge=1, le=100),
+) -> Response:
+    """Full-text search over stories; every query word matches as a prefix."""
+    with span("search"):
+        results = get_story_index(request).search(q, limit=limit)
+    return json_response(_STORIES_ADAPTER, results)
+
 
 @router.get("/", response_model=list[Story])
-async def get_stories(request: Request) -> list[Story]:
+async def get_stories(request: Request) -> Response:
     """Get all stories."""
-    service: SurveyDataService = request.app.state.survey_data_service
-    stories = service.get_stories()
-    stories.sort(
-        key=lambda s: datetime.strptime(s.datetime_submitted, "%Y-%m-%d %H:%M:%S %Z"),
-        reverse=True,
+    views = current_views(request)
+    if views is not None:
+        return encoded_response(request, views.responses["stories"])
+    service: SurveyDataService = get_service(request)
+    stories = await run_in_threadpool(service.get_stories)
+    with span("sort"):
+        stories.sort(key=lambda s: s.datetime_submitted, reverse=True)
+    return json_response(_STORIES_ADAPTER, stories)
+
+
+@router.get("/page", response_model=StoryPage)
+async def get_story_page(
+    request: Request,
+    limit: int = Query(default=20, ge=1, le=100),
+    before: int | None = Query(default=None, ge=0),
+) -> Response:
+    """Get a page of stories in submission order, newest first, numbered below ``before``."""
+    log: StoryLog | None = getattr(ward_state(request), "story_log", None)
+    if log is not None:
+        with span("story_log"):
+            numbered = log.page(limit, before)
+    else:
+        stories = await run_in_threadpool(get_service(request).get_stories)
+        end = len(stories) if before is None else min(before, len(stories))
+        numbered = [
+            (number, stories[number])
+            for number in range(end - 1, max(end - limit, 0) - 1, -1)
+        ]
+    page = StoryPage(
+        stories=[
+            NumberedStory(number=number, **story.model_dump())
+            for number, story in numbered
+        ],
+        next_before=numbered[-1][0] if numbered and numbered[-1][0] > 0 else None,
     )
-    return stories
+    return json_response(_PAGE_ADAPTER, page)
+
+
+@router.get("/{number}/content")
+async def get_story_content(number: int, request: Request) -> Response:
+    """Get one story's text by number, served straight from the story log when enabled."""
+    log: StoryLog | None = getattr(ward_state(request), "story_log", None)
+    try:
+        if log is not None:
+            content: memoryview | bytes = log.content(number)
+        else:
+            stories = await run_in_threadpool(get_service(request).get_stories)
+            if number < 0:
+                raise IndexError(number)
+            content = stories[number].content.encode()
+    except IndexError:
+        raise HTTPException(
+            status_code=404, detail=f"No story number {number}"
+        ) from None
+    return Response(content=content, media_type="text/plain; charset=utf-8")
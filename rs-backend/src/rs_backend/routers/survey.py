@@ -1,23 +1,34 @@
-from datetime import datetime, timezone
-
-from fastapi import APIRouter, Request
+from fastapi import APIRouter, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from pydantic import TypeAdapter
 
+from rs_backend.precompute import current_views, note_write
+from rs_backend.responses import encoded_response
 from rs_backend.schemas.survey import MinisteringEventRequest, MinisteringReport
 from rs_backend.services.base import SurveyDataService
+from rs_backend.tenants import get_service
+from rs_backend.timestamps import now_epoch
+from rs_backend.timing import json_response
 
 router = APIRouter(prefix="/ministering", tags=["ministering"])
 
+_REPORT_ADAPTER = TypeAdapter(MinisteringReport)
+
 
 @router.post("/", response_model=dict[str, str])
-async def submit_ministering_event(event: MinisteringEventRequest, request: Request) -> dict[str, str]:
+async def submit_ministering_event(
+    event: MinisteringEventRequest, request: Request
+) -> dict[str, str]:
     """Submit a ministering event."""
-    service: SurveyDataService = request.app.state.survey_data_service
+    service: SurveyDataService = get_service(request)
 
-    datetime_submitted = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")
-    service.save_ministering_event(
+    datetime_submitted = now_epoch()
+    await run_in_threadpool(
+        service.save_ministering_event,
         datetime_submitted=datetime_submitted,
         organization=event.organization,
     )
+    note_write(request)
 
     return {
         "message": "Ministering event recorded",
@@ -26,7 +37,11 @@ async def submit_ministering_event(event: MinisteringEventRequest, request: Requ
 
 
 @router.get("/reports", response_model=MinisteringReport)
-async def get_reports(request: Request) -> MinisteringReport:
+async def get_reports(request: Request) -> Response:
     """Get ministering reports and statistics."""
-    service: SurveyDataService = request.app.state.survey_data_service
-    return service.get_ministering_reports()
+    views = current_views(request)
+    if views is not None:
+        return encoded_response(request, views.responses["ministering"])
+    service: SurveyDataService = get_service(request)
+    report = await run_in_threadpool(service.get_ministering_reports)
+    return json_response(_REPORT_ADAPTER, report)
@@ -18,3 +18,17 @@ class Organization(str, Enum):
     YOUNG_MENS = "young mens"
     YOUNG_WOMENS = "young womens"
 
+
+class Dataset(str, Enum):
+    """Enum for the stored datasets (CSV file stems / worksheet names)."""
+
+    MINISTERING_EVENTS = "ministering_events"
+    MISSIONARY_EXPERIENCES = "missionary_experiences"
+    STORIES = "stories"
+
+
+class ExportFormat(str, Enum):
+    """Enum for bulk export formats."""
+
+    CSV = "csv"
+    NDJSON = "ndjson"
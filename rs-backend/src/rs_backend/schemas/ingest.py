@@ -0,0 +1,53 @@
+from datetime import datetime
+from typing import Annotated, Literal
+
+from pydantic import BaseModel, Field
+
+from rs_backend.schemas.enums import Organization
+from rs_backend.schemas.missionary_experience import MissionaryExperienceAnswer
+
+# Upper bound on items per batch, so one request can't monopolize a worker
+MAX_BATCH_ITEMS = 500
+
+
+class MinisteringEventItem(BaseModel):
+    """An offline-queued ministering event."""
+
+    type: Literal["ministering_event"]
+    client_timestamp: datetime
+    organization: Organization
+
+
+class MissionaryExperienceItem(BaseModel):
+    """An offline-queued set of missionary-experience answers."""
+
+    type: Literal["missionary_experience"]
+    client_timestamp: datetime
+    organization: Organization
+    answers: list[MissionaryExperienceAnswer] = Field(default_factory=list)
+
+
+class StoryItem(BaseModel):
+    """An offline-queued story."""
+
+    type: Literal["story"]
+    client_timestamp: datetime
+    content: str
+
+
+IngestItem = Annotated[
+    MinisteringEventItem | MissionaryExperienceItem | StoryItem,
+    Field(discriminator="type"),
+]
+
+
+class IngestBatchRequest(BaseModel):
+    """A batch of mixed submissions queued while the client was offline."""
+
+    items: list[IngestItem] = Field(max_length=MAX_BATCH_ITEMS)
+
+
+class IngestBatchResponse(BaseModel):
+    """Rows written per dataset by a batch ingest."""
+
+    saved: dict[str, int]
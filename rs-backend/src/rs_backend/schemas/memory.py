@@ -0,0 +1,31 @@
+from pydantic import BaseModel
+
+
+class AllocationSite(BaseModel):
+    """Memory allocated from one source location (or traceback)."""
+
+    location: str
+    size_bytes: int
+    count: int
+    size_diff_bytes: int = 0  # only set in snapshot diffs
+    count_diff: int = 0
+
+
+class MemorySnapshotInfo(BaseModel):
+    """A tracemalloc snapshot held by the process."""
+
+    snapshot_id: int
+    taken_at: str
+    traced_bytes: int
+
+
+class MemoryStatus(BaseModel):
+    """Process memory overview for diagnosing growth."""
+
+    tracing: bool
+    traceback_frames: int
+    traced_current_bytes: int
+    traced_peak_bytes: int
+    max_rss_bytes: int
+    snapshots: list[MemorySnapshotInfo]
+    cache_entries: dict[str, int]  # cache name -> entries currently held
@@ -22,3 +22,4 @@ class MissionaryExperienceReport(BaseModel):
 
     total_answers: int
     counts_by_org: dict[str, int]
+    counts_by_question: dict[int, int] = Field(default_factory=dict)
@@ -1,4 +1,16 @@
-from pydantic import BaseModel
+from typing import Annotated
+
+from pydantic import BaseModel, BeforeValidator, PlainSerializer
+
+from rs_backend.timestamps import format_timestamp, to_epoch
+
+# Epoch seconds in memory (formatted strings from older rows are parsed);
+# "YYYY-MM-DD HH:MM:SS UTC" in JSON
+SubmittedAt = Annotated[
+    int,
+    BeforeValidator(to_epoch),
+    PlainSerializer(format_timestamp, return_type=str, when_used="json"),
+]
 
 
 class StoryCreate(BaseModel):
@@ -10,6 +22,18 @@ class StoryCreate(BaseModel):
 class Story(BaseModel):
     """Response schema for a story."""
 
-    datetime_submitted: str  # Format: YYYY-MM-DD HH:MM:SS UTC
+    datetime_submitted: SubmittedAt
     content: str
 
+
+class NumberedStory(Story):
+    """A story with its position in submission order, starting at 0."""
+
+    number: int
+
+
+class StoryPage(BaseModel):
+    """Response schema for a page of stories, newest first."""
+
+    stories: list[NumberedStory]
+    next_before: int | None  # Pass as ``before`` for the next (older) page
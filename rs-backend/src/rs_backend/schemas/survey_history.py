@@ -0,0 +1,20 @@
+from pydantic import BaseModel
+
+
+class YesRate(BaseModel):
+    """Yes/no tally for one question within one group."""
+
+    responses: int
+    yes: int
+    yes_rate: float
+
+
+class SurveyHistoryReport(BaseModel):
+    """Yes-rates from the legacy 0.1.0 Come Follow Me survey (read-only)."""
+
+    total_responses: int
+    overall: dict[str, YesRate]  # question -> rate
+    by_organization: dict[str, dict[str, YesRate]]  # question -> organization -> rate
+    by_week: dict[
+        str, dict[str, YesRate]
+    ]  # question -> week (Monday, YYYY-MM-DD) -> rate
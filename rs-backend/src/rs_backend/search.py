@@ -0,0 +1,120 @@
+"""In-memory inverted index for full-text story search.
+
+Stories are tokenized into lowercase word tokens; each token maps to the
+stories containing it and how often. A sorted vocabulary lets every query
+term match as a prefix ("pray" finds "prayed" and "prayer") with a bisect
+instead of a scan. Results are ranked by TF-IDF, exact matches weighing more
+than prefix expansions, and ties go to the newest story.
+
+The index is per process: it is rebuilt from the active backend on startup
+and updated incrementally as this process saves stories.
+"""
+
+import math
+import re
+import threading
+from bisect import bisect_left, insort
+
+from rs_backend.schemas.story import Story
+
+_TOKEN_RE = re.compile(r"\w+")
+
+# Weight of a prefix expansion relative to an exact token match
+PREFIX_MATCH_WEIGHT = 0.5
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into lowercase word tokens."""
+    return _TOKEN_RE.findall(text.lower())
+
+
+class StoryIndex:
+    """Inverted index over stories with prefix matching and TF-IDF ranking."""
+
+    def __init__(self, stories: list[Story] | None = None) -> None:
+        """Build the index from an initial list of stories."""
+        self._lock = threading.Lock()
+        self._stories: list[Story] = []
+        self._postings: dict[str, dict[int, int]] = {}
+        self._vocabulary: list[str] = []
+        for story in stories or []:
+            self._add(story, sort_vocabulary=False)
+        # One sort for the whole initial build instead of an insort per word
+        self._vocabulary.sort()
+
+    def __len__(self) -> int:
+        return len(self._stories)
+
+    def add(self, story: Story) -> None:
+        """Index one newly saved story."""
+        with self._lock:
+            self._add(story)
+
+    def _add(self, story: Story, sort_vocabulary: bool = True) -> None:
+        doc_id = len(self._stories)
+        self._stories.append(story)
+        for token in tokenize(story.content):
+            postings = self._postings.get(token)
+            if postings is None:
+                postings = self._postings[token] = {}
+                # Only words never seen before enter the vocabulary
+                if sort_vocabulary:
+                    insort(self._vocabulary, token)
+                else:
+                    self._vocabulary.append(token)
+            postings[doc_id] = postings.get(doc_id, 0) + 1
+
+    def _expand(self, term: str) -> list[str]:
+        """Return every indexed token starting with ``term``."""
+        vocabulary = self._vocabulary
+        matches: list[str] = []
+        # Walk from the bisect point by index; slicing would copy the whole tail
+        for i in range(bisect_left(vocabulary, term), len(vocabulary)):
+            token = vocabulary[i]
+            if not token.startswith(term):
+                break
+            matches.append(token)
+        return matches
+
+    def search(self, query: str, limit: int = 20) -> list[Story]:
+        """Return stories matching every query term (as a prefix), best first."""
+        terms = tokenize(query)
+        if not terms:
+            return []
+
+        with self._lock:
+            total_docs = len(self._stories)
+            scores: dict[int, float] | None = None
+            for term in terms:
+                term_scores: dict[int, float] = {}
+                for token in self._expand(term):
+                    postings = self._postings[token]
+                    idf = math.log(1 + total_docs / len(postings))
+                    weight = 1.0 if token == term else PREFIX_MATCH_WEIGHT
+                    for doc_id, freq in postings.items():
+                        score = weight * freq * idf
+                        if score > term_scores.get(doc_id, 0.0):
+                            term_scores[doc_id] = score
+
+                # AND semantics: keep only stories matching every term so far
+                if scores is None:
+                    scores = term_scores
+                else:
+                    scores = {
+                        doc_id: score + term_scores[doc_id]
+                        for doc_id, score in scores.items()
+                        if doc_id in term_scores
+                    }
+                if not scores:
+                    return []
+
+            ranked = sorted(
+                scores.items(),
+                key=lambda item: (
+                    item[1],
+                    self._stories[item[0]].datetime_submitted,
+                    item[0],
+                ),
+                reverse=True,
+            )
+            return [self._stories[doc_id] for doc_id, _ in ranked[:limit]]
@@ -0,0 +1,88 @@
+"""Report counts built incrementally from raw dataset rows.
+
+Counts are kept as ``(dataset, dimension, key) -> count``, with dimensions
+``total``, ``org``, ``question`` and ``week`` (ISO week, e.g. ``2025-W03``),
+plus ``rows``: how many raw rows were counted, blank ones included. Adding
+rows is a merge, so a holder of counts only ever needs to read the rows
+appended since it last looked.
+"""
+
+from datetime import UTC, datetime
+
+from rs_backend.schemas.enums import Dataset
+from rs_backend.schemas.missionary_experience import MissionaryExperienceReport
+from rs_backend.schemas.survey import MinisteringReport
+from rs_backend.timestamps import to_epoch
+
+# Datasets the report endpoints aggregate
+REPORT_DATASETS = (Dataset.MINISTERING_EVENTS, Dataset.MISSIONARY_EXPERIENCES)
+
+# (dataset, dimension, key) -> count
+ReportCounts = dict[tuple[str, str, str], int]
+
+
+def iso_week(datetime_submitted: int | str) -> str | None:
+    """Return the ISO week of a stored timestamp, or None if it does not parse."""
+    try:
+        moment = datetime.fromtimestamp(to_epoch(datetime_submitted), UTC)
+    except (ValueError, OverflowError, OSError):
+        return None
+    year, week, _ = moment.isocalendar()
+    return f"{year}-W{week:02d}"
+
+
+def count_rows(counts: ReportCounts, dataset: Dataset, rows: list[list]) -> None:
+    """Add raw rows, in DATASET_HEADERS column order, to ``counts``."""
+
+    def add(dimension: str, key: str, amount: int = 1) -> None:
+        counts[(dataset.value, dimension, key)] = (
+            counts.get((dataset.value, dimension, key), 0) + amount
+        )
+
+    # Blank rows still occupy a row position
+    add("rows", "", len(rows))
+    for row in rows:
+        if len(row) < 2:
+            continue
+        add("total", "")
+        add("org", str(row[1]).strip().lower())
+        if week := iso_week(row[0]):
+            add("week", week)
+        question_id = str(row[2]).strip() if len(row) > 2 else ""
+        if dataset == Dataset.MISSIONARY_EXPERIENCES and question_id.isdigit():
+            add("question", question_id)
+
+
+def dimension_counts(
+    counts: ReportCounts, dataset: Dataset, dimension: str
+) -> dict[str, int]:
+    """Return key -> count for one dimension of one dataset."""
+    return {
+        key: count
+        for (name, dim, key), count in counts.items()
+        if name == dataset.value and dim == dimension
+    }
+
+
+def ministering_report(counts: ReportCounts) -> MinisteringReport:
+    """Build the ministering report from counts."""
+    dataset = Dataset.MINISTERING_EVENTS
+    return MinisteringReport(
+        total_events=counts.get((dataset.value, "total", ""), 0),
+        counts_by_org=dimension_counts(counts, dataset, "org"),
+    )
+
+
+def missionary_experience_report(counts: ReportCounts) -> MissionaryExperienceReport:
+    """Build the missionary-experience report from counts."""
+    dataset = Dataset.MISSIONARY_EXPERIENCES
+    return MissionaryExperienceReport(
+        total_answers=counts.get((dataset.value, "total", ""), 0),
+        counts_by_org=dimension_counts(counts, dataset, "org"),
+        counts_by_question={
+            int(question_id): count
+            for question_id, count in dimension_counts(
+                counts, dataset, "question"
+            ).items()
+        },
+    )
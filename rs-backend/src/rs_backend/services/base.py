@@ -1,50 +1,93 @@
+import itertools
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
 
-from rs_backend.schemas.enums import Organization
+from rs_backend.schemas.enums import Dataset, Organization
 from rs_backend.schemas.missionary_experience import MissionaryExperienceReport
-from rs_backend.schemas.survey import MinisteringReport
 from rs_backend.schemas.story import Story
+from rs_backend.schemas.survey import MinisteringReport
+
+# Column headers of each dataset, in storage order
+DATASET_HEADERS: dict[Dataset, list[str]] = {
+    Dataset.MINISTERING_EVENTS: ["datetime_submitted", "organization"],
+    Dataset.MISSIONARY_EXPERIENCES: [
+        "datetime_submitted",
+        "organization",
+        "question_id",
+        "question_text",
+    ],
+    Dataset.STORIES: ["datetime_submitted", "content"],
+}
+
+# Where a reader of a dataset got up to: a row count or byte offset, or, for
+# storage split across files, one such offset per file (JSON-serializable)
+ReadPosition = int | dict[str, int]
 
 
 class SurveyDataService(ABC):
-    """Abstract base class for data persistence services."""
+    """Abstract base class for data persistence services.
+
+    ``datetime_submitted`` is epoch seconds (see rs_backend.timestamps). Rows
+    written earlier hold formatted strings, which readers must also accept.
+    """
 
     @abstractmethod
     def save_ministering_event(
         self,
-        datetime_submitted: str,
+        datetime_submitted: int,
         organization: Organization,
     ) -> None:
         """Save a ministering event to storage."""
-        pass
 
     @abstractmethod
     def get_ministering_reports(self) -> MinisteringReport:
         """Get ministering reports and statistics."""
-        pass
 
     @abstractmethod
     def save_missionary_experience_answer(
         self,
-        datetime_submitted: str,
+        datetime_submitted: int,
         organization: Organization,
         question_id: int,
         question_text: str,
     ) -> None:
         """Save a single 'Did you...' missionary-experience answer."""
-        pass
 
     @abstractmethod
     def get_missionary_experience_report(self) -> MissionaryExperienceReport:
         """Aggregate missionary-experience answers grouped by organization."""
-        pass
 
     @abstractmethod
-    def save_story(self, datetime_submitted: str, content: str) -> None:
+    def save_story(self, datetime_submitted: int, content: str) -> None:
         """Save a story to storage."""
-        pass
 
     @abstractmethod
     def get_stories(self) -> list[Story]:
         """Get all stories."""
-        pass
+
+    @abstractmethod
+    def iter_dataset_rows(self, dataset: Dataset) -> Iterator[dict[str, str]]:
+        """Lazily yield every row of a dataset as a header -> value mapping.
+
+        Implementations must not materialize the whole dataset in memory.
+        """
+
+    @abstractmethod
+    def append_dataset_rows(self, dataset: Dataset, rows: list[list[str]]) -> None:
+        """Append many rows (in DATASET_HEADERS column order) in a single write."""
+
+    def read_rows_since(
+        self, dataset: Dataset, position: ReadPosition
+    ) -> tuple[list[list[str]], ReadPosition]:
+        """Return the rows appended after ``position`` and the position after them.
+
+        Positions are opaque, start at 0 and only stay valid while the dataset
+        is append-only. This default skips ``position`` rows of a full scan;
+        backends that can seek override it.
+        """
+        headers = DATASET_HEADERS[dataset]
+        rows = [
+            [row.get(header, "") for header in headers]
+            for row in itertools.islice(self.iter_dataset_rows(dataset), position, None)
+        ]
+        return rows, position + len(rows)
@@ -1,14 +1,20 @@
 import csv
+import fcntl
+import heapq
+import os
+from collections.abc import Iterator
 from pathlib import Path
 
 from loguru import logger
 
 import rs_backend.logger  # noqa: F401  # Import to configure logger
-from rs_backend.schemas.enums import Organization
+from rs_backend.schemas.enums import Dataset, Organization
 from rs_backend.schemas.missionary_experience import MissionaryExperienceReport
-from rs_backend.schemas.survey import MinisteringReport
 from rs_backend.schemas.story import Story
-from rs_backend.services.base import SurveyDataService
+from rs_backend.schemas.survey import MinisteringReport
+from rs_backend.services.base import DATASET_HEADERS, ReadPosition, SurveyDataService
+from rs_backend.timestamps import to_epoch
+from rs_backend.timing import span
 
 MISSIONARY_EXPERIENCE_HEADERS = [
     "datetime_submitted",
@@ -17,9 +23,30 @@ MISSIONARY_EXPERIENCE_HEADERS = [
     "question_text",
 ]
 
+# Datasets whose rows are split into one append file per organization
+SHARDED_DATASETS = frozenset(
+    {Dataset.MINISTERING_EVENTS, Dataset.MISSIONARY_EXPERIENCES}
+)
+
+
+def _merge_key(row: dict[str, str]) -> int:
+    """Order rows by submission time; a malformed time sorts first instead of raising."""
+    try:
+        return to_epoch(row.get("datetime_submitted") or "")
+    except ValueError:
+        return 0
+
 
 class CSVService(SurveyDataService):
-    """Service for interacting with local CSV files."""
+    """Service for interacting with local CSV files.
+
+    Ministering events and missionary-experience answers are appended to one
+    file per organization (``ministering_events.relief_society.csv``), each
+    guarded by its own ``flock``, so writers for different organizations
+    never wait on each other. The original per-dataset file stays as a shard
+    too: it keeps existing rows and takes rows whose organization is unknown.
+    Reads merge every shard of a dataset.
+    """
 
     def __init__(self, data_dir: Path | None = None) -> None:
         """Initialize CSVService with data directory."""
@@ -77,7 +104,7 @@ class CSVService(SurveyDataService):
 
     def save_ministering_event(
         self,
-        datetime_submitted: str,
+        datetime_submitted: int,
         organization: Organization,
     ) -> None:
         """Save a ministering event to CSV file."""
@@ -86,30 +113,31 @@ class CSVService(SurveyDataService):
             datetime_submitted=datetime_submitted,
             organization=organization.value,
         )
-        with open(self.ministering_file, "a", newline="") as f:
-            writer = csv.writer(f)
-            writer.writerow([datetime_submitted, organization.value])
+        self._append(
+            self._shard_file(Dataset.MINISTERING_EVENTS, organization),
+            Dataset.MINISTERING_EVENTS,
+            [[datetime_submitted, organization.value]],
+        )
 
     def get_ministering_reports(self) -> MinisteringReport:
-        """Get ministering reports from CSV file."""
-        if not self.ministering_file.exists():
-            return MinisteringReport(total_events=0, counts_by_org={})
-
+        """Get ministering reports, merging the counts of every shard."""
         total_events = 0
         counts_by_org: dict[str, int] = {}
 
-        with open(self.ministering_file, "r", newline="") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                total_events += 1
-                org = row["organization"]
-                counts_by_org[org] = counts_by_org.get(org, 0) + 1
+        # Reading and counting are interleaved in one streaming pass per shard
+        for path in self._dataset_files(Dataset.MINISTERING_EVENTS):
+            with span("csv_scan"), open(path, "r", newline="") as f:
+                reader = csv.DictReader(f)
+                for row in reader:
+                    total_events += 1
+                    org = row["organization"]
+                    counts_by_org[org] = counts_by_org.get(org, 0) + 1
 
         return MinisteringReport(total_events=total_events, counts_by_org=counts_by_org)
 
     def save_missionary_experience_answer(
         self,
-        datetime_submitted: str,
+        datetime_submitted: int,
         organization: Organization,
         question_id: int,
         question_text: str,
@@ -121,36 +149,40 @@ class CSVService(SurveyDataService):
             organization=organization.value,
             question_id=question_id,
         )
-        with open(self.missionary_experience_file, "a", newline="") as f:
-            writer = csv.writer(f)
-            writer.writerow(
-                [datetime_submitted, organization.value, question_id, question_text]
-            )
+        self._append(
+            self._shard_file(Dataset.MISSIONARY_EXPERIENCES, organization),
+            Dataset.MISSIONARY_EXPERIENCES,
+            [[datetime_submitted, organization.value, question_id, question_text]],
+        )
 
     def get_missionary_experience_report(self) -> MissionaryExperienceReport:
-        """Aggregate missionary-experience answers grouped by organization."""
-        if not self.missionary_experience_file.exists():
-            return MissionaryExperienceReport(total_answers=0, counts_by_org={})
-
+        """Aggregate missionary-experience answers of every shard, grouped by organization."""
         total = 0
         counts_by_org: dict[str, int] = {}
-        with open(self.missionary_experience_file, "r", newline="") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                total += 1
-                org = (row.get("organization") or "").strip().lower()
-                counts_by_org[org] = counts_by_org.get(org, 0) + 1
+        counts_by_question: dict[int, int] = {}
+        for path in self._dataset_files(Dataset.MISSIONARY_EXPERIENCES):
+            with span("csv_scan"), open(path, "r", newline="") as f:
+                reader = csv.DictReader(f)
+                for row in reader:
+                    total += 1
+                    org = (row.get("organization") or "").strip().lower()
+                    counts_by_org[org] = counts_by_org.get(org, 0) + 1
+                    question_id = (row.get("question_id") or "").strip()
+                    if question_id.isdigit():
+                        qid = int(question_id)
+                        counts_by_question[qid] = counts_by_question.get(qid, 0) + 1
 
         return MissionaryExperienceReport(
             total_answers=total,
             counts_by_org=counts_by_org,
+            counts_by_question=counts_by_question,
         )
 
-    def save_story(self, datetime_submitted: str, content: str) -> None:
+    def save_story(self, datetime_submitted: int, content: str) -> None:
         """Save a story to CSV file."""
-        with open(self.stories_file, "a", newline="") as f:
-            writer = csv.writer(f)
-            writer.writerow([datetime_submitted, content])
+        self._append(
+            self.stories_file, Dataset.STORIES, [[datetime_submitted, content]]
+        )
 
     def get_stories(self) -> list[Story]:
         """Get all stories from CSV file."""
@@ -158,7 +190,7 @@ class CSVService(SurveyDataService):
         if not self.stories_file.exists():
             return stories
 
-        with open(self.stories_file, "r", newline="") as f:
+        with span("csv_scan"), open(self.stories_file, "r", newline="") as f:
             reader = csv.DictReader(f)
             for row in reader:
                 stories.append(
@@ -168,3 +200,117 @@ class CSVService(SurveyDataService):
                     )
                 )
         return stories
+
+    def _dataset_file(self, dataset: Dataset) -> Path:
+        """Return the original (unsharded) CSV file of a dataset."""
+        return {
+            Dataset.MINISTERING_EVENTS: self.ministering_file,
+            Dataset.MISSIONARY_EXPERIENCES: self.missionary_experience_file,
+            Dataset.STORIES: self.stories_file,
+        }[dataset]
+
+    def _shard_file(self, dataset: Dataset, organization: Organization) -> Path:
+        """Return the append file for one organization's rows of a dataset."""
+        return self.data_dir / f"{dataset.value}.{organization.name.lower()}.csv"
+
+    def _dataset_files(self, dataset: Dataset) -> list[Path]:
+        """Return every existing file holding rows of a dataset, in a fixed order."""
+        paths = [self._dataset_file(dataset)]
+        if dataset in SHARDED_DATASETS:
+            paths += [
+                self._shard_file(dataset, organization) for organization in Organization
+            ]
+        return [path for path in paths if path.exists()]
+
+    def _append(self, path: Path, dataset: Dataset, rows: list[list]) -> None:
+        """Append rows to one file under an exclusive lock, writing the header first if new."""
+        with open(path, "a", newline="") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            writer = csv.writer(f)
+            # Another process may have created the file since it was opened
+            if f.seek(0, os.SEEK_END) == 0:
+                writer.writerow(DATASET_HEADERS[dataset])
+            writer.writerows(rows)
+            # Closing flushes, then releases the lock
+
+    def iter_dataset_rows(self, dataset: Dataset) -> Iterator[dict[str, str]]:
+        """Stream rows of a dataset from its CSV files, merged by submission time."""
+        readers = [self._iter_file_rows(path) for path in self._dataset_files(dataset)]
+        if len(readers) == 1:
+            yield from readers[0]
+        else:
+            yield from heapq.merge(*readers, key=_merge_key)
+
+    @staticmethod
+    def _iter_file_rows(path: Path) -> Iterator[dict[str, str]]:
+        with open(path, "r", newline="") as f:
+            yield from csv.DictReader(f)
+
+    def append_dataset_rows(self, dataset: Dataset, rows: list[list[str]]) -> None:
+        """Append many rows with one open/write per shard they belong to."""
+        if not rows:
+            return
+        if dataset not in SHARDED_DATASETS:
+            self._append(self._dataset_file(dataset), dataset, rows)
+            return
+        by_file: dict[Path, list[list[str]]] = {}
+        for row in rows:
+            try:
+                path = self._shard_file(dataset, Organization(row[1]))
+            except ValueError:
+                path = self._dataset_file(dataset)
+            by_file.setdefault(path, []).append(row)
+        for path, file_rows in by_file.items():
+            self._append(path, dataset, file_rows)
+
+    def read_rows_since(
+        self, dataset: Dataset, position: ReadPosition
+    ) -> tuple[list[list[str]], ReadPosition]:
+        """Parse only the bytes appended to each shard since ``position``.
+
+        Positions map file names to byte offsets; a plain int is an offset
+        into the original file, as returned before datasets were sharded.
+        """
+        if isinstance(position, int):
+            position = {self._dataset_file(dataset).name: position}
+        rows: list[list[str]] = []
+        new_position = dict(position)
+        for path in self._dataset_files(dataset):
+            offset = position.get(path.name, 0)
+            file_rows, new_position[path.name] = self._read_file_since(path, offset)
+            rows += file_rows
+        return rows, new_position
+
+    @staticmethod
+    def _read_file_since(path: Path, offset: int) -> tuple[list[list[str]], int]:
+        with open(path, "rb") as f:
+            # Most shards have nothing new; skip them without reading
+            if os.fstat(f.fileno()).st_size <= offset:
+                return [], offset
+            f.seek(offset)
+            data = f.read()
+
+        # A quoted field may hold newlines, so a record can span lines: feed
+        # the csv reader whole lines and advance only to the end of the last
+        # complete record, leaving one still being written for next time
+        lines = [line + b"\n" for line in data.split(b"\n")[:-1]]
+        fed = 0
+        exhausted = False
+
+        def feed() -> Iterator[str]:
+            nonlocal fed, exhausted
+            for line in lines:
+                fed += len(line)
+                yield line.decode("utf-8")
+            exhausted = True
+
+        rows: list[list[str]] = []
+        consumed = 0
+        for row in csv.reader(feed()):
+            if exhausted:
+                break  # Ended by running out of data, not by a record end
+            rows.append(row)
+            consumed = fed
+        if offset == 0 and rows:
+            rows = rows[1:]  # Header row
+        return rows, offset + consumed
@@ -0,0 +1,181 @@
+"""Report aggregates kept in memory and persisted as a warm-start snapshot.
+
+Without it, report state comes from scanning every CSV row or reading whole
+Sheets ranges, so the first requests after a deploy are slow and get slower
+as data grows. ReportSnapshotService instead keeps report counts in memory
+together with how far into each dataset it has read. A report request only
+reads rows appended since then, which also picks up writes made by other
+workers. The counts and positions are saved to a small JSON file at shutdown
+and periodically while running; on startup the file is loaded and only the
+rows added since it was written are read.
+"""
+
+import asyncio
+import json
+import os
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+
+from loguru import logger
+
+import rs_backend.logger  # noqa: F401  # Import to configure logger
+from rs_backend.schemas.enums import Dataset, Organization
+from rs_backend.schemas.missionary_experience import MissionaryExperienceReport
+from rs_backend.schemas.story import Story
+from rs_backend.schemas.survey import MinisteringReport
+from rs_backend.services.aggregates import (
+    REPORT_DATASETS,
+    ReportCounts,
+    count_rows,
+    ministering_report,
+    missionary_experience_report,
+)
+from rs_backend.services.base import ReadPosition, SurveyDataService
+from rs_backend.timing import span
+
+SNAPSHOT_VERSION = 1
+
+
+class ReportSnapshotService(SurveyDataService):
+    """Wrap another SurveyDataService and serve reports from incremental counts."""
+
+    def __init__(self, inner: SurveyDataService, path: Path, source: str) -> None:
+        """Wrap ``inner``, warm-starting from the snapshot at ``path`` if it matches.
+
+        ``source`` identifies the storage (e.g. ``sheets:<id>``); a snapshot
+        taken from different storage is ignored.
+        """
+        self.inner = inner
+        self.path = Path(path)
+        self.source = source
+        self._lock = threading.Lock()
+        self._counts: ReportCounts = {}
+        self._positions: dict[str, ReadPosition] = {}
+        self._load()
+        self.catch_up(REPORT_DATASETS)
+
+    def _load(self) -> None:
+        try:
+            snapshot = json.loads(self.path.read_text())
+        except FileNotFoundError:
+            logger.info("No report snapshot; counting every row", path=str(self.path))
+            return
+        except (OSError, ValueError) as e:
+            logger.warning(
+                "Ignoring unreadable report snapshot", path=str(self.path), error=str(e)
+            )
+            return
+        if (
+            snapshot.get("version") != SNAPSHOT_VERSION
+            or snapshot.get("source") != self.source
+        ):
+            logger.warning(
+                "Ignoring report snapshot from other storage",
+                path=str(self.path),
+                source=snapshot.get("source"),
+            )
+            return
+        self._positions = dict(snapshot["positions"])
+        self._counts = {
+            (dataset, dimension, key): count
+            for dataset, dimension, key, count in snapshot["counts"]
+        }
+        logger.info(
+            "Loaded report snapshot", path=str(self.path), positions=self._positions
+        )
+
+    def save(self) -> None:
+        """Count any new rows, then atomically write the counts and read positions."""
+        # Reports may not have been read since the latest writes (or at all)
+        self.catch_up(REPORT_DATASETS)
+        with self._lock:
+            snapshot = {
+                "version": SNAPSHOT_VERSION,
+                "source": self.source,
+                "positions": dict(self._positions),
+                "counts": [
+                    [*key, count] for key, count in sorted(self._counts.items())
+                ],
+            }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        tmp_path.write_text(json.dumps(snapshot))
+        os.replace(tmp_path, self.path)
+
+    def catch_up(self, datasets: tuple[Dataset, ...]) -> None:
+        """Count the rows appended to ``datasets`` since they were last read."""
+        with self._lock, span("catch_up"):
+            for dataset in datasets:
+                rows, self._positions[dataset.value] = self.inner.read_rows_since(
+                    dataset, self._positions.get(dataset.value, 0)
+                )
+                count_rows(self._counts, dataset, rows)
+
+    def save_ministering_event(
+        self,
+        datetime_submitted: int,
+        organization: Organization,
+    ) -> None:
+        """Save a ministering event via the wrapped service."""
+        self.inner.save_ministering_event(datetime_submitted, organization)
+
+    def get_ministering_reports(self) -> MinisteringReport:
+        """Build the ministering report from counts, after reading any new rows."""
+        self.catch_up((Dataset.MINISTERING_EVENTS,))
+        with self._lock:
+            return ministering_report(self._counts)
+
+    def save_missionary_experience_answer(
+        self,
+        datetime_submitted: int,
+        organization: Organization,
+        question_id: int,
+        question_text: str,
+    ) -> None:
+        """Save a missionary-experience answer via the wrapped service."""
+        self.inner.save_missionary_experience_answer(
+            datetime_submitted, organization, question_id, question_text
+        )
+
+    def get_missionary_experience_report(self) -> MissionaryExperienceReport:
+        """Build the missionary-experience report from counts, after reading any new rows."""
+        self.catch_up((Dataset.MISSIONARY_EXPERIENCES,))
+        with self._lock:
+            return missionary_experience_report(self._counts)
+
+    def save_story(self, datetime_submitted: int, content: str) -> None:
+        """Save a story via the wrapped service."""
+        self.inner.save_story(datetime_submitted, content)
+
+    def get_stories(self) -> list[Story]:
+        """Get all stories from the wrapped service."""
+        return self.inner.get_stories()
+
+    def iter_dataset_rows(self, dataset: Dataset) -> Iterator[dict[str, str]]:
+        """Stream dataset rows from the wrapped service."""
+        return self.inner.iter_dataset_rows(dataset)
+
+    def read_rows_since(
+        self, dataset: Dataset, position: ReadPosition
+    ) -> tuple[list[list[str]], ReadPosition]:
+        """Read new rows from the wrapped service."""
+        return self.inner.read_rows_since(dataset, position)
+
+    def append_dataset_rows(self, dataset: Dataset, rows: list[list[str]]) -> None:
+        """Append rows via the wrapped service."""
+        self.inner.append_dataset_rows(dataset, rows)
+
+
+async def save_periodically(
+    service: ReportSnapshotService, interval_seconds: float
+) -> None:
+    """Save the snapshot every ``interval_seconds`` until cancelled."""
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            await asyncio.to_thread(service.save)
+        except OSError as e:
+            logger.warning(
+                "Failed to save report snapshot", path=str(service.path), error=str(e)
+            )
@@ -0,0 +1,359 @@
+"""Report counters shared by every uvicorn worker through an mmap'd file.
+
+Each worker process keeps its own copy of anything held in memory, so an
+in-process aggregate goes stale as soon as a different worker handles a
+write. Instead, report counts live in a small fixed-layout file (ideally on
+tmpfs, e.g. ``/dev/shm``) that every worker maps into memory and updates under
+an ``flock``. Any worker can then answer the report endpoints from the same
+live numbers without scanning storage.
+
+The counts are kept in step with storage by read position, not by counting
+each write: next to the counts the file records which storage it was seeded
+from and how far into each dataset it has read. After every write, and when
+a worker starts, the rows past those positions are counted and the positions
+advanced, all under the exclusive lock. Each row is therefore counted exactly
+once, including rows added by ``rs-backend migrate``, other tools or manual
+edits. A file seeded from different storage is reset and reseeded.
+
+File layout::
+
+    header  (64 bytes): magic (8) | seeded flag (u64) | state length (u32) | padding
+    state   (4096 bytes): JSON {"source": ..., "positions": {dataset: position}}
+    slots   (64 bytes each): key (56 bytes, NUL-padded utf-8) | count (i64)
+
+Slots are claimed in order and never freed, so a key's slot index never
+changes once written and can be cached per process.
+"""
+
+import fcntl
+import json
+import mmap
+import os
+import struct
+import threading
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+from loguru import logger
+
+import rs_backend.logger  # noqa: F401  # Import to configure logger
+from rs_backend.schemas.enums import Dataset, Organization
+from rs_backend.schemas.missionary_experience import MissionaryExperienceReport
+from rs_backend.schemas.story import Story
+from rs_backend.schemas.survey import MinisteringReport
+from rs_backend.services.aggregates import REPORT_DATASETS
+from rs_backend.services.base import ReadPosition, SurveyDataService
+from rs_backend.timing import span
+
+MAGIC = b"RSCNTR02"
+HEADER_SIZE = 64
+STATE_SIZE = 4096
+SLOTS_OFFSET = HEADER_SIZE + STATE_SIZE
+SLOT_SIZE = 64
+KEY_SIZE = 56
+DEFAULT_CAPACITY = 1023  # 64 KiB file including the header
+
+_SEEDED = struct.Struct("<Q")
+_STATE_LENGTH = struct.Struct("<I")
+_STATE_LENGTH_OFFSET = len(MAGIC) + _SEEDED.size
+_COUNT = struct.Struct("<q")
+
+# Counter key prefixes
+MINISTERING_PREFIX = Dataset.MINISTERING_EVENTS.value
+MISSIONARY_EXPERIENCE_PREFIX = Dataset.MISSIONARY_EXPERIENCES.value
+
+
+class SharedCounters:
+    """Named int64 counters in a memory-mapped file, safe across processes."""
+
+    def __init__(self, path: Path, capacity: int = DEFAULT_CAPACITY) -> None:
+        """Open (creating if needed) the counter file at ``path``."""
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.capacity = capacity
+        self._size = SLOTS_OFFSET + capacity * SLOT_SIZE
+        # flock() is per open file description, so threads of one process
+        # also need a regular lock to exclude each other.
+        self._thread_lock = threading.Lock()
+        self._slot_by_key: dict[str, int] = {}
+
+        self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        with self._locked(fcntl.LOCK_EX):
+            if os.fstat(self._fd).st_size < self._size:
+                os.ftruncate(self._fd, self._size)
+            self._mm = mmap.mmap(self._fd, self._size)
+            if self._mm[: len(MAGIC)] != MAGIC:
+                self._mm[:] = bytes(self._size)
+                self._mm[: len(MAGIC)] = MAGIC
+
+    def close(self) -> None:
+        """Unmap the counter file and close its descriptor."""
+        self._mm.close()
+        os.close(self._fd)
+
+    @contextmanager
+    def _locked(self, operation: int) -> Iterator[None]:
+        with self._thread_lock:
+            fcntl.flock(self._fd, operation)
+            try:
+                yield
+            finally:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    @property
+    def seeded(self) -> bool:
+        """Whether the counters have been initialised from storage."""
+        return _SEEDED.unpack_from(self._mm, len(MAGIC))[0] == 1
+
+    def catch_up(
+        self,
+        source: str,
+        count_since: Callable[
+            [dict[str, ReadPosition]], tuple[dict[str, int], dict[str, ReadPosition]]
+        ],
+    ) -> bool:
+        """Add the counts of rows stored past the recorded read positions.
+
+        ``count_since(positions)`` reads storage from ``positions`` and returns
+        counter deltas plus the new positions. It runs under the exclusive
+        file lock, so no two workers count the same rows. If the counters were
+        never seeded, or were seeded from storage other than ``source``, they
+        are reset and counted from the start. Returns True if this call
+        (re)seeded them.
+        """
+        with self._locked(fcntl.LOCK_EX):
+            state = self._read_state()
+            reseed = not self.seeded or state.get("source") != source
+            if reseed:
+                self._reset_counts()
+            deltas, positions = count_since({} if reseed else state["positions"])
+            for key, value in deltas.items():
+                self._add(key, value)
+            self._write_state({"source": source, "positions": positions})
+            _SEEDED.pack_into(self._mm, len(MAGIC), 1)
+            return reseed
+
+    def _read_state(self) -> dict:
+        length = _STATE_LENGTH.unpack_from(self._mm, _STATE_LENGTH_OFFSET)[0]
+        if not length:
+            return {}
+        return json.loads(self._mm[HEADER_SIZE : HEADER_SIZE + length])
+
+    def _write_state(self, state: dict) -> None:
+        encoded = json.dumps(state).encode("utf-8")
+        if len(encoded) > STATE_SIZE:
+            raise ValueError(f"Shared counter state exceeds {STATE_SIZE} bytes")
+        self._mm[HEADER_SIZE : HEADER_SIZE + len(encoded)] = encoded
+        _STATE_LENGTH.pack_into(self._mm, _STATE_LENGTH_OFFSET, len(encoded))
+
+    def _reset_counts(self) -> None:
+        """Zero every count; keys keep their slots, which other workers cache."""
+        for slot in range(self.capacity):
+            offset = SLOTS_OFFSET + slot * SLOT_SIZE
+            if not self._mm[offset : offset + KEY_SIZE].rstrip(b"\0"):
+                break
+            _COUNT.pack_into(self._mm, offset + KEY_SIZE, 0)
+
+    def increment(self, deltas: dict[str, int]) -> None:
+        """Atomically add each delta to its named counter."""
+        with self._locked(fcntl.LOCK_EX):
+            for key, delta in deltas.items():
+                self._add(key, delta)
+
+    def snapshot(self, prefix: str = "") -> dict[str, int]:
+        """Return all counters whose key starts with ``prefix``."""
+        counts: dict[str, int] = {}
+        with span("counters"), self._locked(fcntl.LOCK_SH):
+            for slot in range(self.capacity):
+                offset = SLOTS_OFFSET + slot * SLOT_SIZE
+                raw_key = self._mm[offset : offset + KEY_SIZE].rstrip(b"\0")
+                if not raw_key:
+                    break
+                key = raw_key.decode("utf-8", errors="ignore")
+                if key.startswith(prefix):
+                    counts[key] = _COUNT.unpack_from(self._mm, offset + KEY_SIZE)[0]
+        return counts
+
+    def _add(self, key: str, delta: int) -> None:
+        """Add ``delta`` to ``key``'s slot; the caller must hold the lock."""
+        slot = self._find_or_claim_slot(key)
+        if slot is None:
+            logger.error("Shared counter file is full", path=str(self.path), key=key)
+            return
+        offset = SLOTS_OFFSET + slot * SLOT_SIZE + KEY_SIZE
+        _COUNT.pack_into(
+            self._mm, offset, _COUNT.unpack_from(self._mm, offset)[0] + delta
+        )
+
+    def _find_or_claim_slot(self, key: str) -> int | None:
+        slot = self._slot_by_key.get(key)
+        if slot is not None:
+            return slot
+
+        encoded = key.encode("utf-8")[:KEY_SIZE]
+        for slot in range(self.capacity):
+            offset = SLOTS_OFFSET + slot * SLOT_SIZE
+            raw_key = self._mm[offset : offset + KEY_SIZE].rstrip(b"\0")
+            if raw_key == encoded:
+                self._slot_by_key[key] = slot
+                return slot
+            if not raw_key:
+                self._mm[offset : offset + KEY_SIZE] = encoded.ljust(KEY_SIZE, b"\0")
+                self._slot_by_key[key] = slot
+                return slot
+        return None
+
+
+def _report_counter_keys(
+    prefix: str,
+    total: int,
+    counts_by_org: dict[str, int],
+    counts_by_question: dict[int, int] | None = None,
+) -> dict[str, int]:
+    keys = {f"{prefix}:total": total}
+    for org, count in counts_by_org.items():
+        keys[f"{prefix}:org:{org}"] = count
+    for question_id, count in (counts_by_question or {}).items():
+        keys[f"{prefix}:question:{question_id}"] = count
+    return keys
+
+
+def _row_counter_keys(dataset: Dataset, rows: list[list[str]]) -> dict[str, int]:
+    """Counter deltas for raw rows appended in DATASET_HEADERS column order."""
+    if dataset == Dataset.STORIES:
+        return {}
+
+    total = 0
+    counts_by_org: dict[str, int] = {}
+    counts_by_question: dict[int, int] = {}
+    for row in rows:
+        if len(row) < 2:
+            continue
+        total += 1
+        org = str(row[1]).strip().lower()
+        counts_by_org[org] = counts_by_org.get(org, 0) + 1
+        question_id = str(row[2]).strip() if len(row) > 2 else ""
+        if dataset == Dataset.MISSIONARY_EXPERIENCES and question_id.isdigit():
+            qid = int(question_id)
+            counts_by_question[qid] = counts_by_question.get(qid, 0) + 1
+    return _report_counter_keys(dataset.value, total, counts_by_org, counts_by_question)
+
+
+class SharedCounterService(SurveyDataService):
+    """Wrap another SurveyDataService and serve reports from SharedCounters.
+
+    Writes go to the wrapped service first; the counters then count every row
+    stored since they last read, so report reads never touch storage.
+    Stories are passed straight through.
+    """
+
+    def __init__(
+        self, inner: SurveyDataService, counters: SharedCounters, source: str
+    ) -> None:
+        """Wrap ``inner``, seeding ``counters`` from it or catching them up.
+
+        ``source`` identifies the storage (e.g. ``sheets:<id>``); counters
+        seeded from different storage are reset.
+        """
+        self.inner = inner
+        self.counters = counters
+        self.source = source
+        if self._catch_up(REPORT_DATASETS):
+            logger.info("Seeded shared report counters", path=str(counters.path))
+
+    def _catch_up(self, datasets: tuple[Dataset, ...]) -> bool:
+        """Count the rows of ``datasets`` stored since the counters last read them."""
+
+        def count_since(
+            positions: dict[str, ReadPosition],
+        ) -> tuple[dict[str, int], dict[str, ReadPosition]]:
+            deltas: dict[str, int] = {}
+            new_positions = dict(positions)
+            for dataset in datasets:
+                rows, new_positions[dataset.value] = self.inner.read_rows_since(
+                    dataset, positions.get(dataset.value, 0)
+                )
+                for key, value in _row_counter_keys(dataset, rows).items():
+                    deltas[key] = deltas.get(key, 0) + value
+            return deltas, new_positions
+
+        return self.counters.catch_up(self.source, count_since)
+
+    def save_ministering_event(
+        self,
+        datetime_submitted: int,
+        organization: Organization,
+    ) -> None:
+        """Save via the wrapped service, then count the new rows."""
+        self.inner.save_ministering_event(datetime_submitted, organization)
+        self._catch_up((Dataset.MINISTERING_EVENTS,))
+
+    def get_ministering_reports(self) -> MinisteringReport:
+        """Build the ministering report from the shared counters."""
+        counts = self.counters.snapshot(f"{MINISTERING_PREFIX}:")
+        org_prefix = f"{MINISTERING_PREFIX}:org:"
+        return MinisteringReport(
+            total_events=counts.get(f"{MINISTERING_PREFIX}:total", 0),
+            counts_by_org={
+                key.removeprefix(org_prefix): value
+                for key, value in counts.items()
+                if key.startswith(org_prefix)
+            },
+        )
+
+    def save_missionary_experience_answer(
+        self,
+        datetime_submitted: int,
+        organization: Organization,
+        question_id: int,
+        question_text: str,
+    ) -> None:
+        """Save via the wrapped service, then count the new rows."""
+        self.inner.save_missionary_experience_answer(
+            datetime_submitted, organization, question_id, question_text
+        )
+        self._catch_up((Dataset.MISSIONARY_EXPERIENCES,))
+
+    def get_missionary_experience_report(self) -> MissionaryExperienceReport:
+        """Build the missionary-experience report from the shared counters."""
+        counts = self.counters.snapshot(f"{MISSIONARY_EXPERIENCE_PREFIX}:")
+        org_prefix = f"{MISSIONARY_EXPERIENCE_PREFIX}:org:"
+        question_prefix = f"{MISSIONARY_EXPERIENCE_PREFIX}:question:"
+        return MissionaryExperienceReport(
+            total_answers=counts.get(f"{MISSIONARY_EXPERIENCE_PREFIX}:total", 0),
+            counts_by_org={
+                key.removeprefix(org_prefix): value
+                for key, value in counts.items()
+                if key.startswith(org_prefix)
+            },
+            counts_by_question={
+                int(key.removeprefix(question_prefix)): value
+                for key, value in counts.items()
+                if key.startswith(question_prefix)
+            },
+        )
+
+    def save_story(self, datetime_submitted: int, content: str) -> None:
+        """Save a story via the wrapped service."""
+        self.inner.save_story(datetime_submitted, content)
+
+    def get_stories(self) -> list[Story]:
+        """Get all stories from the wrapped service."""
+        return self.inner.get_stories()
+
+    def iter_dataset_rows(self, dataset: Dataset) -> Iterator[dict[str, str]]:
+        """Stream dataset rows from the wrapped service."""
+        return self.inner.iter_dataset_rows(dataset)
+
+    def read_rows_since(
+        self, dataset: Dataset, position: ReadPosition
+    ) -> tuple[list[list[str]], ReadPosition]:
+        """Read new rows from the wrapped service."""
+        return self.inner.read_rows_since(dataset, position)
+
+    def append_dataset_rows(self, dataset: Dataset, rows: list[list[str]]) -> None:
+        """Append via the wrapped service, then count the new rows."""
+        self.inner.append_dataset_rows(dataset, rows)
+        if dataset in REPORT_DATASETS:
+            self._catch_up((dataset,))
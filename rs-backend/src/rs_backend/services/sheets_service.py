@@ -1,22 +1,39 @@
+import re
+import threading
+from collections.abc import Iterator
 from pathlib import Path
 
+import httplib2
+from google.auth.credentials import AnonymousCredentials
 from google.oauth2 import service_account
+from google_auth_httplib2 import AuthorizedHttp
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+from googleapiclient.http import HttpRequest
 from loguru import logger
 
 import rs_backend.logger  # noqa: F401  # Import to configure logger
-from rs_backend.schemas.enums import Organization
+from rs_backend.metrics import SHEETS_API_CALLS, SHEETS_API_ERRORS
+from rs_backend.schemas.enums import Dataset, Organization
 from rs_backend.schemas.missionary_experience import MissionaryExperienceReport
-from rs_backend.schemas.survey import MinisteringReport
 from rs_backend.schemas.story import Story
-from rs_backend.services.base import SurveyDataService
+from rs_backend.schemas.survey import MinisteringReport
+from rs_backend.services.aggregates import (
+    REPORT_DATASETS,
+    ReportCounts,
+    count_rows,
+    ministering_report,
+    missionary_experience_report,
+)
+from rs_backend.services.base import DATASET_HEADERS, SurveyDataService
 from rs_backend.services.errors import (
     SheetsCredentialsError,
     SheetsPermissionError,
     SheetsServiceError,
     SheetsSpreadsheetNotFoundError,
 )
+from rs_backend.timestamps import format_timestamp
+from rs_backend.timing import span
 
 # Worksheet names
 MINISTERING_WORKSHEET = "ministering_events"
@@ -29,6 +46,138 @@ MISSIONARY_EXPERIENCE_HEADERS = [
     "question_text",
 ]
 
+# Rows fetched per values.get call when streaming a whole worksheet
+EXPORT_PAGE_SIZE = 1000
+
+# Pre-aggregated report counts, one (dataset, dimension, key, count) row each.
+# Every write updates it, so report reads fetch only this range. The "rows"
+# dimension records how many raw rows of the dataset are counted, so a writer
+# only reads raw rows when others were appended past that mark.
+SUMMARY_WORKSHEET = "summary"
+SUMMARY_HEADERS = ["dataset", "dimension", "key", "count"]
+SUMMARY_DATASETS = REPORT_DATASETS
+
+
+class CountingHttpRequest(HttpRequest):
+    """HttpRequest that counts every executed Sheets API call by verb."""
+
+    def execute(self, *args, **kwargs):
+        # methodId looks like "sheets.spreadsheets.values.append"
+        verb = (self.methodId or "unknown").removeprefix("sheets.")
+        SHEETS_API_CALLS.inc(verb)
+        try:
+            with span("sheets"):
+                return super().execute(*args, **kwargs)
+        except HttpError as e:
+            SHEETS_API_ERRORS.inc(verb, str(e.resp.status))
+            raise
+
+
+# (dataset, data rows above the appended ones if known, appended rows)
+_Appended = tuple[Dataset, int | None, list[list]]
+
+_UPDATED_START_ROW_RE = re.compile(r"![A-Z]+(\d+)")
+
+
+def _appended_position(response: dict) -> int | None:
+    """Return how many data rows precede the rows a values.append wrote, if reported."""
+    updated_range = response.get("updates", {}).get("updatedRange", "")
+    match = _UPDATED_START_ROW_RE.search(updated_range)
+    # Row 1 is the header row
+    return int(match.group(1)) - 2 if match else None
+
+
+def _rows_following(
+    counted: int, appended: list[tuple[int | None, list[list]]]
+) -> list[list] | None:
+    """Return the appended rows if they directly follow the first ``counted`` rows.
+
+    Returns None when there is a gap (rows appended elsewhere, or a position
+    the API did not report), so the caller reads the raw rows instead.
+    """
+    following: list[list] = []
+    for at, rows in sorted(appended, key=lambda item: (item[0] is None, item[0] or 0)):
+        if at is not None and at + len(rows) <= counted:
+            continue  # Already counted by an earlier read of the raw rows
+        if at != counted + len(following):
+            return None
+        following += rows
+    return following
+
+
+def _sheet_timestamp(value: int | str) -> int | str:
+    """Format an epoch submission time for the (human-read) sheet; strings pass through."""
+    return format_timestamp(int(value)) if str(value).isdigit() else value
+
+
+def _load_credentials(credentials_path: str | None, api_endpoint: str | None = None):
+    """Load service-account credentials (anonymous for an alternative endpoint)."""
+    if credentials_path is None and api_endpoint is not None:
+        # Local stand-ins do not check auth
+        return AnonymousCredentials()
+    if credentials_path is None:
+        raise SheetsCredentialsError("Credentials path is required")
+
+    credentials_file = Path(credentials_path)
+    if not credentials_file.exists():
+        raise SheetsCredentialsError(
+            f"Credentials file not found at path: {credentials_path}"
+        )
+
+    try:
+        return service_account.Credentials.from_service_account_file(
+            str(credentials_file),
+            scopes=["https://www.googleapis.com/auth/spreadsheets"],
+        )
+    except Exception as e:
+        raise SheetsCredentialsError(f"Failed to load credentials: {e}") from e
+
+
+def _build_client(credentials, api_endpoint: str | None = None):
+    """Build a Sheets v4 client with its own HTTP connection, optionally for another endpoint."""
+    try:
+        return build(
+            "sheets",
+            "v4",
+            http=AuthorizedHttp(credentials, http=httplib2.Http()),
+            requestBuilder=CountingHttpRequest,
+            client_options={"api_endpoint": api_endpoint} if api_endpoint else None,
+        )
+    except Exception as e:
+        raise SheetsServiceError(f"Failed to create Sheets API client: {e}") from e
+
+
+class SheetsClientPool:
+    """Sheets API clients for one set of credentials, one client per thread.
+
+    httplib2 connections are not thread-safe, and service calls run on
+    threadpool workers, so each thread gets its own client. Clients are not
+    tied to a spreadsheet, so services for different spreadsheets can share
+    a pool and with it the open connections to the API.
+    """
+
+    def __init__(self, credentials, api_endpoint: str | None = None) -> None:
+        self.credentials = credentials
+        self.api_endpoint = api_endpoint
+        self._local = threading.local()
+
+    @classmethod
+    def from_path(
+        cls, credentials_path: str | None, api_endpoint: str | None = None
+    ) -> "SheetsClientPool":
+        """Create a pool from a service-account credentials file."""
+        return cls(_load_credentials(credentials_path, api_endpoint), api_endpoint)
+
+    @property
+    def client(self):
+        """The calling thread's Sheets API client."""
+        client = getattr(self._local, "client", None)
+        if client is None:
+            client = self._local.client = _build_client(
+                self.credentials, self.api_endpoint
+            )
+        return client
+
 
 class SheetsService(SurveyDataService):
     """Service for interacting with Google Sheets."""
@@ -37,58 +186,49 @@ class SheetsService(SurveyDataService):
         self,
         credentials_path: str | None = None,
         spreadsheet_id: str | None = None,
+        api_endpoint: str | None = None,
+        client_pool: SheetsClientPool | None = None,
     ) -> None:
-        """Initialize SheetsService with Google Sheets credentials."""
-        if credentials_path is None:
-            raise SheetsCredentialsError("Credentials path is required")
+        """Initialize SheetsService with Google Sheets credentials.
+
+        ``api_endpoint`` points the client at another Sheets API server, such
+        as the local fake (``rs-backend fake-sheets``); credentials are then
+        optional. Pass ``client_pool`` to share API clients with other
+        services instead of loading credentials again.
+        """
+        self.client_pool = client_pool or SheetsClientPool.from_path(
+            credentials_path, api_endpoint
+        )
+        _ = self.service  # fail fast if the client cannot be built
         if spreadsheet_id is None:
             raise SheetsSpreadsheetNotFoundError("Spreadsheet ID is required")
-
-        credentials_file = Path(credentials_path)
-        if not credentials_file.exists():
-            raise SheetsCredentialsError(f"Credentials file not found at path: {credentials_path}")
-
-        try:
-            self.credentials = service_account.Credentials.from_service_account_file(
-                str(credentials_file),
-                scopes=["https://www.googleapis.com/auth/spreadsheets"],
-            )
-        except Exception as e:
-            raise SheetsCredentialsError(f"Failed to load credentials: {e}") from e
-
-        try:
-            self.service = build("sheets", "v4", credentials=self.credentials)
-        except Exception as e:
-            raise SheetsServiceError(f"Failed to create Sheets API client: {e}") from e
-
         self.spreadsheet_id = spreadsheet_id
+        # Rows appended but not yet in the summary. One writer at a time
+        # folds in everything pending, so a burst shares summary updates.
+        self._summary_lock = threading.Lock()
+        self._pending_lock = threading.Lock()
+        self._pending: list[_Appended] = []
         logger.info("SheetsService initialized", spreadsheet_id=spreadsheet_id)
 
+    @property
+    def service(self):
+        """The calling thread's Sheets API client."""
+        return self.client_pool.client
+
     @classmethod
-    def init(cls, credentials_path: str | None = None, spreadsheet_id: str | None = None) -> None:
+    def init(
+        cls,
+        credentials_path: str | None = None,
+        spreadsheet_id: str | None = None,
+        api_endpoint: str | None = None,
+    ) -> None:
         """Validate credentials and spreadsheet before creating instance."""
-        if credentials_path is None:
-            raise SheetsCredentialsError("Credentials path is required")
+        service = _build_client(
+            _load_credentials(credentials_path, api_endpoint), api_endpoint
+        )
         if spreadsheet_id is None:
             raise SheetsSpreadsheetNotFoundError("Spreadsheet ID is required")
 
-        credentials_file = Path(credentials_path)
-        if not credentials_file.exists():
-            raise SheetsCredentialsError(f"Credentials file not found at path: {credentials_path}")
-
-        try:
-            credentials = service_account.Credentials.from_service_account_file(
-                str(credentials_file),
-                scopes=["https://www.googleapis.com/auth/spreadsheets"],
-            )
-        except Exception as e:
-            raise SheetsCredentialsError(f"Failed to load credentials: {e}") from e
-
-        try:
-            service = build("sheets", "v4", credentials=credentials)
-        except Exception as e:
-            raise SheetsServiceError(f"Failed to create Sheets API client: {e}") from e
-
         # Validate spreadsheet exists and is accessible
         try:
             service.spreadsheets().get(spreadsheetId=spreadsheet_id).execute()
@@ -106,11 +246,13 @@ class SheetsService(SurveyDataService):
         except Exception as e:
             raise SheetsServiceError(f"Failed to validate spreadsheet: {e}") from e
 
-        logger.info("SheetsService validation successful", spreadsheet_id=spreadsheet_id)
+        logger.info(
+            "SheetsService validation successful", spreadsheet_id=spreadsheet_id
+        )
 
     def save_ministering_event(
         self,
-        datetime_submitted: str,
+        datetime_submitted: int,
         organization: Organization,
     ) -> None:
         """Save a ministering event to Google Sheets."""
@@ -120,11 +262,11 @@ class SheetsService(SurveyDataService):
             organization=organization.value,
         )
 
-        values = [[datetime_submitted, organization.value]]
+        values = [[_sheet_timestamp(datetime_submitted), organization.value]]
         body = {"values": values}
 
         try:
-            (
+            response = (
                 self.service.spreadsheets()
                 .values()
                 .append(
@@ -146,17 +288,27 @@ class SheetsService(SurveyDataService):
                     f"Spreadsheet not found: {self.spreadsheet_id}"
                 ) from e
             else:
-                raise SheetsServiceError(f"Failed to save ministering event: {e}") from e
+                raise SheetsServiceError(
+                    f"Failed to save ministering event: {e}"
+                ) from e
         except Exception as e:
             raise SheetsServiceError(f"Failed to save ministering event: {e}") from e
+        self._after_append(Dataset.MINISTERING_EVENTS, response, values)
 
     def get_ministering_reports(self) -> MinisteringReport:
-        """Get ministering reports from Google Sheets."""
+        """Get ministering reports from the summary worksheet, or from all raw rows."""
+        counts = self._read_summary()
+        if counts is not None:
+            return ministering_report(counts)
+
         try:
             result = (
                 self.service.spreadsheets()
                 .values()
-                .get(spreadsheetId=self.spreadsheet_id, range=f"{MINISTERING_WORKSHEET}!A:B")
+                .get(
+                    spreadsheetId=self.spreadsheet_id,
+                    range=f"{MINISTERING_WORKSHEET}!A:B",
+                )
                 .execute()
             )
         except HttpError as e:
@@ -169,28 +321,20 @@ class SheetsService(SurveyDataService):
                     f"Spreadsheet not found: {self.spreadsheet_id}"
                 ) from e
             else:
-                raise SheetsServiceError(f"Failed to get ministering reports: {e}") from e
+                raise SheetsServiceError(
+                    f"Failed to get ministering reports: {e}"
+                ) from e
         except Exception as e:
             raise SheetsServiceError(f"Failed to get ministering reports: {e}") from e
 
         values = result.get("values", [])
-        if not values:
-            return MinisteringReport(total_events=0, counts_by_org={})
-
         # Skip header row
         data_rows = values[1:] if len(values) > 1 else []
 
-        total_events = 0
-        counts_by_org: dict[str, int] = {}
-
-        for row in data_rows:
-            if len(row) < 2:
-                continue
-            total_events += 1
-            org = row[1].strip().lower()
-            counts_by_org[org] = counts_by_org.get(org, 0) + 1
-
-        return MinisteringReport(total_events=total_events, counts_by_org=counts_by_org)
+        counts: ReportCounts = {}
+        with span("aggregate"):
+            count_rows(counts, Dataset.MINISTERING_EVENTS, data_rows)
+        return ministering_report(counts)
 
     def _ensure_worksheet_exists(
         self,
@@ -208,8 +352,7 @@ class SheetsService(SurveyDataService):
             raise SheetsServiceError(f"Failed to read spreadsheet metadata: {e}") from e
 
         existing = {
-            sheet["properties"]["title"]
-            for sheet in metadata.get("sheets", [])
+            sheet["properties"]["title"] for sheet in metadata.get("sheets", [])
         }
         if worksheet_name in existing:
             return
@@ -250,7 +393,7 @@ class SheetsService(SurveyDataService):
 
     def save_missionary_experience_answer(
         self,
-        datetime_submitted: str,
+        datetime_submitted: int,
         organization: Organization,
         question_id: int,
         question_text: str,
@@ -268,16 +411,18 @@ class SheetsService(SurveyDataService):
             header_row=MISSIONARY_EXPERIENCE_HEADERS,
         )
 
-        values = [[
-            datetime_submitted,
-            organization.value,
-            question_id,
-            question_text,
-        ]]
+        values = [
+            [
+                _sheet_timestamp(datetime_submitted),
+                organization.value,
+                question_id,
+                question_text,
+            ]
+        ]
         body = {"values": values}
 
         try:
-            (
+            response = (
                 self.service.spreadsheets()
                 .values()
                 .append(
@@ -306,9 +451,14 @@ class SheetsService(SurveyDataService):
             raise SheetsServiceError(
                 f"Failed to save missionary experience answer: {e}"
             ) from e
+        self._after_append(Dataset.MISSIONARY_EXPERIENCES, response, values)
 
     def get_missionary_experience_report(self) -> MissionaryExperienceReport:
-        """Aggregate missionary-experience answers grouped by organization."""
+        """Aggregate missionary-experience answers, from the summary worksheet if present."""
+        counts = self._read_summary()
+        if counts is not None:
+            return missionary_experience_report(counts)
+
         self._ensure_worksheet_exists(
             MISSIONARY_EXPERIENCE_WORKSHEET,
             header_row=MISSIONARY_EXPERIENCE_HEADERS,
@@ -345,23 +495,14 @@ class SheetsService(SurveyDataService):
         values = result.get("values", [])
         data_rows = values[1:] if len(values) > 1 else []
 
-        total = 0
-        counts_by_org: dict[str, int] = {}
-        for row in data_rows:
-            if len(row) < 2:
-                continue
-            total += 1
-            org = row[1].strip().lower()
-            counts_by_org[org] = counts_by_org.get(org, 0) + 1
+        counts: ReportCounts = {}
+        with span("aggregate"):
+            count_rows(counts, Dataset.MISSIONARY_EXPERIENCES, data_rows)
+        return missionary_experience_report(counts)
 
-        return MissionaryExperienceReport(
-            total_answers=total,
-            counts_by_org=counts_by_org,
-        )
-
-    def save_story(self, datetime_submitted: str, content: str) -> None:
+    def save_story(self, datetime_submitted: int, content: str) -> None:
         """Save a story to Google Sheets."""
-        values = [[datetime_submitted, content]]
+        values = [[_sheet_timestamp(datetime_submitted), content]]
         body = {"values": values}
 
         try:
@@ -397,7 +538,9 @@ class SheetsService(SurveyDataService):
             result = (
                 self.service.spreadsheets()
                 .values()
-                .get(spreadsheetId=self.spreadsheet_id, range=f"{STORIES_WORKSHEET}!A:B")
+                .get(
+                    spreadsheetId=self.spreadsheet_id, range=f"{STORIES_WORKSHEET}!A:B"
+                )
                 .execute()
             )
         except HttpError as e:
@@ -422,13 +565,274 @@ class SheetsService(SurveyDataService):
         data_rows = values[1:] if len(values) > 1 else []
 
         stories: list[Story] = []
-        for row in data_rows:
-            if len(row) < 2:
+        with span("aggregate"):
+            for row in data_rows:
+                if len(row) < 2:
+                    continue
+                stories.append(
+                    Story(
+                        datetime_submitted=row[0],
+                        content=row[1],
+                    )
+                )
+        return stories
+
+    def _grid_row_count(self, worksheet_name: str) -> int:
+        """Return the number of rows in a worksheet's grid (0 if it does not exist)."""
+        try:
+            metadata = (
+                self.service.spreadsheets()
+                .get(
+                    spreadsheetId=self.spreadsheet_id,
+                    fields="sheets.properties(title,gridProperties.rowCount)",
+                )
+                .execute()
+            )
+        except HttpError as e:
+            raise SheetsServiceError(f"Failed to read spreadsheet metadata: {e}") from e
+        for sheet in metadata.get("sheets", []):
+            if sheet["properties"]["title"] == worksheet_name:
+                return sheet["properties"].get("gridProperties", {}).get("rowCount", 0)
+        return 0
+
+    def iter_dataset_rows(self, dataset: Dataset) -> Iterator[dict[str, str]]:
+        """Stream rows of a worksheet in fixed-size pages of EXPORT_PAGE_SIZE rows.
+
+        Pages run to the end of the worksheet's grid: the API trims trailing
+        blank rows from each page, so a short or empty page does not mean the
+        data has ended when rows were cleared in the middle of the sheet.
+        """
+        headers = DATASET_HEADERS[dataset]
+        last_column = chr(ord("A") + len(headers) - 1)
+        row_count = self._grid_row_count(dataset.value)
+
+        # Row 1 is the header row; data starts at row 2
+        start_row = 2
+        while start_row <= row_count:
+            end_row = start_row + EXPORT_PAGE_SIZE - 1
+            try:
+                result = (
+                    self.service.spreadsheets()
+                    .values()
+                    .get(
+                        spreadsheetId=self.spreadsheet_id,
+                        range=f"{dataset.value}!A{start_row}:{last_column}{end_row}",
+                    )
+                    .execute()
+                )
+            except HttpError as e:
+                if e.resp.status == 403:
+                    raise SheetsPermissionError(
+                        "Permission denied. Unable to read from the spreadsheet."
+                    ) from e
+                elif e.resp.status == 404:
+                    raise SheetsSpreadsheetNotFoundError(
+                        f"Spreadsheet not found: {self.spreadsheet_id}"
+                    ) from e
+                else:
+                    raise SheetsServiceError(
+                        f"Failed to export {dataset.value}: {e}"
+                    ) from e
+            except Exception as e:
+                raise SheetsServiceError(
+                    f"Failed to export {dataset.value}: {e}"
+                ) from e
+
+            for row in result.get("values", []):
+                # Blank rows are skipped, not taken as the end of the data
+                if not row:
+                    continue
+                yield {
+                    header: str(row[i]) if i < len(row) else ""
+                    for i, header in enumerate(headers)
+                }
+            start_row = end_row + 1
+
+    def append_dataset_rows(self, dataset: Dataset, rows: list[list[str]]) -> None:
+        """Append many rows to a worksheet with a single values.append call."""
+        if not rows:
+            return
+        self._ensure_worksheet_exists(
+            dataset.value, header_row=DATASET_HEADERS[dataset]
+        )
+
+        try:
+            response = (
+                self.service.spreadsheets()
+                .values()
+                .append(
+                    spreadsheetId=self.spreadsheet_id,
+                    range=f"{dataset.value}!A:A",
+                    valueInputOption="RAW",
+                    insertDataOption="INSERT_ROWS",
+                    body={
+                        "values": [[_sheet_timestamp(row[0]), *row[1:]] for row in rows]
+                    },
+                )
+                .execute()
+            )
+        except HttpError as e:
+            if e.resp.status == 403:
+                raise SheetsPermissionError(
+                    "Permission denied. Unable to write to the spreadsheet."
+                ) from e
+            elif e.resp.status == 404:
+                raise SheetsSpreadsheetNotFoundError(
+                    f"Spreadsheet not found: {self.spreadsheet_id}"
+                ) from e
+            else:
+                raise SheetsServiceError(
+                    f"Failed to append rows to {dataset.value}: {e}"
+                ) from e
+        except Exception as e:
+            raise SheetsServiceError(
+                f"Failed to append rows to {dataset.value}: {e}"
+            ) from e
+        if dataset in SUMMARY_DATASETS:
+            self._after_append(dataset, response, rows)
+
+    def _get_values_if_exists(self, range_: str, action: str) -> list[list] | None:
+        """Read a range, returning None if its worksheet does not exist."""
+        try:
+            result = (
+                self.service.spreadsheets()
+                .values()
+                .get(
+                    spreadsheetId=self.spreadsheet_id,
+                    range=range_,
+                    valueRenderOption="UNFORMATTED_VALUE",
+                )
+                .execute()
+            )
+        except HttpError as e:
+            if e.resp.status == 400:
+                # "Unable to parse range": the worksheet has not been created
+                return None
+            elif e.resp.status == 403:
+                raise SheetsPermissionError(
+                    "Permission denied. Unable to read from the spreadsheet."
+                ) from e
+            elif e.resp.status == 404:
+                raise SheetsSpreadsheetNotFoundError(
+                    f"Spreadsheet not found: {self.spreadsheet_id}"
+                ) from e
+            else:
+                raise SheetsServiceError(f"Failed to {action}: {e}") from e
+        except Exception as e:
+            raise SheetsServiceError(f"Failed to {action}: {e}") from e
+        return result.get("values", [])
+
+    def _read_summary(self) -> ReportCounts | None:
+        """Read the summary worksheet, or None if it has not been created."""
+        values = self._get_values_if_exists(f"{SUMMARY_WORKSHEET}!A2:D", "read summary")
+        if values is None:
+            return None
+        counts: ReportCounts = {}
+        for row in values:
+            if len(row) < 4 or row[0] == "":
                 continue
-            stories.append(
-                Story(
-                    datetime_submitted=row[0],
-                    content=row[1],
+            try:
+                counts[(str(row[0]), str(row[1]), str(row[2]))] = int(row[3])
+            except (TypeError, ValueError):
+                logger.warning("Skipping malformed summary row", row=row)
+        return counts
+
+    def _rows_after(self, dataset: Dataset, counted: int) -> list[list]:
+        """Read the raw rows of a dataset that follow the first ``counted`` data rows."""
+        last_column = chr(ord("A") + len(DATASET_HEADERS[dataset]) - 1)
+        # Row 1 is the header row
+        values = self._get_values_if_exists(
+            f"{dataset.value}!A{counted + 2}:{last_column}", f"read {dataset.value}"
+        )
+        return values or []
+
+    def read_rows_since(
+        self, dataset: Dataset, position: int
+    ) -> tuple[list[list[str]], int]:
+        """Read only the rows below the first ``position`` data rows."""
+        rows = self._rows_after(dataset, position)
+        return [[str(value) for value in row] for row in rows], position + len(rows)
+
+    def _write_summary(self, counts: ReportCounts, previous_rows: int) -> None:
+        rows = [
+            [name, dimension, key, count]
+            for (name, dimension, key), count in sorted(counts.items())
+        ]
+        # Blank out whatever is left of a longer previous summary
+        rows += [["", "", "", ""]] * max(previous_rows - len(rows), 0)
+        try:
+            (
+                self.service.spreadsheets()
+                .values()
+                .update(
+                    spreadsheetId=self.spreadsheet_id,
+                    range=f"{SUMMARY_WORKSHEET}!A1",
+                    valueInputOption="RAW",
+                    body={"values": [SUMMARY_HEADERS, *rows]},
                 )
+                .execute()
             )
-        return stories
+        except HttpError as e:
+            raise SheetsServiceError(f"Failed to write summary: {e}") from e
+
+    def _update_summary(
+        self, rebuild: bool, appended: list[_Appended] | None = None
+    ) -> ReportCounts:
+        """Write the summary, counting new raw rows (or all of them when rebuilding).
+
+        Rows just appended, given with their position, are counted as sent
+        when they directly follow the summary's mark; otherwise the raw rows
+        past the mark are read. The summary records how many raw rows it
+        covers, so concurrent updaters, in this process or another, each
+        write a consistent summary, and rows one of them missed are counted
+        by the next.
+        """
+        previous = self._read_summary()
+        if previous is None:
+            self._ensure_worksheet_exists(SUMMARY_WORKSHEET, header_row=SUMMARY_HEADERS)
+            previous = {}
+        counts = {} if rebuild else dict(previous)
+        for dataset in SUMMARY_DATASETS:
+            counted = counts.get((dataset.value, "rows", ""), 0)
+            new_rows = None
+            if not rebuild:
+                new_rows = _rows_following(
+                    counted,
+                    [
+                        (at, rows)
+                        for name, at, rows in appended or []
+                        if name == dataset
+                    ],
+                )
+            if new_rows is None:
+                new_rows = self._rows_after(dataset, counted)
+            count_rows(counts, dataset, new_rows)
+        if rebuild or counts != previous:
+            self._write_summary(counts, len(previous))
+        return counts
+
+    def _after_append(self, dataset: Dataset, response: dict, rows: list[list]) -> None:
+        """Fold appended rows into the summary worksheet, with any others pending."""
+        with self._pending_lock:
+            self._pending.append((dataset, _appended_position(response), rows))
+        with self._summary_lock:
+            with self._pending_lock:
+                pending, self._pending = self._pending, []
+            if not pending:
+                return  # Folded in by the writer that held the lock
+            # The raw rows are saved; a failed update is caught up by the next write
+            try:
+                self._update_summary(rebuild=False, appended=pending)
+            except SheetsServiceError as e:
+                logger.warning("Failed to update summary worksheet", error=str(e))
+
+    def rebuild_summary(self) -> ReportCounts:
+        """Regenerate the summary worksheet from every raw row."""
+        with self._summary_lock:
+            counts = self._update_summary(rebuild=True)
+        logger.info(
+            "Summary worksheet rebuilt",
+            spreadsheet_id=self.spreadsheet_id,
+            rows=len(counts),
+        )
+        return counts
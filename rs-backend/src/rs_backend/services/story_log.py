@@ -0,0 +1,360 @@
+"""Append-only story log with a fixed-width offset index, read through mmap.
+
+Stories are free text of any length, and CSV or a Sheets column can only be
+read back whole. The log keeps each story's bytes back to back in one file
+and a record of where each one starts in a second, so story ``n`` is found
+with a single index lookup and the newest page with a handful, without
+parsing anything before it. Both files are memory-mapped and content is
+handed out as ``memoryview`` slices of the mapping, so serving a story copies
+nothing until it reaches the socket.
+
+File layout::
+
+    stories.log    magic (8) | record | record | ...
+                   record: datetime_submitted utf-8 (epoch seconds) | content utf-8
+    stories.idx    magic (8) | reserved (8) | entry | entry | ...
+                   entry (16 bytes): record offset (u64) | timestamp length (u16)
+                                     | padding (2) | content length (u32)
+    stories.state  JSON {"source": ..., "position": ..., "stories": ...}
+
+Appends write the record before its index entry, under an ``flock`` shared by
+every worker, so an index entry never points at bytes that are not there.
+Opening the log drops anything a crash left half-written.
+
+The log is kept in step with the story storage by read position: the state
+file records which storage the log was seeded from, how far into its stories
+dataset the log has read, and how many stories the log held at that point.
+StoryLogService catches up past that position when it opens the log and
+after each story write, so stories added by ``rs-backend migrate``, another
+tool or a manual edit reach the log too. A log seeded from different storage
+is emptied and reseeded.
+"""
+
+import fcntl
+import json
+import mmap
+import os
+import struct
+import threading
+import weakref
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+from loguru import logger
+
+import rs_backend.logger  # noqa: F401  # Import to configure logger
+from rs_backend.schemas.enums import Dataset, Organization
+from rs_backend.schemas.missionary_experience import MissionaryExperienceReport
+from rs_backend.schemas.story import Story
+from rs_backend.schemas.survey import MinisteringReport
+from rs_backend.services.base import ReadPosition, SurveyDataService
+from rs_backend.timing import span
+
+LOG_MAGIC = b"RSSTLOG1"
+INDEX_MAGIC = b"RSSTIDX1"
+INDEX_HEADER_SIZE = 16
+
+_ENTRY = struct.Struct("<QHxxI")
+
+
+def _close_fds(*fds: int) -> None:
+    for fd in fds:
+        os.close(fd)
+
+
+class StoryLog:
+    """Stories in an append-only file, indexed by number, safe across processes."""
+
+    def __init__(self, directory: Path) -> None:
+        """Open (creating if needed) the log and index files in ``directory``."""
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.log_path = self.directory / "stories.log"
+        self.index_path = self.directory / "stories.idx"
+        self.state_path = self.directory / "stories.state"
+        # flock() is per open file description, so threads of one process
+        # also need a regular lock to exclude each other.
+        self._thread_lock = threading.Lock()
+        self._log_fd = os.open(self.log_path, os.O_RDWR | os.O_CREAT, 0o644)
+        self._index_fd = os.open(self.index_path, os.O_RDWR | os.O_CREAT, 0o644)
+        # Closed on close(), or once the log is garbage collected (e.g. an unloaded ward)
+        self._close_files = weakref.finalize(
+            self, _close_fds, self._log_fd, self._index_fd
+        )
+        self._log_mm: mmap.mmap | None = None
+        self._index_mm: mmap.mmap | None = None
+        with self._locked(fcntl.LOCK_EX):
+            self._recover()
+
+    def close(self) -> None:
+        """Close the files; mappings still referenced by served content stay valid."""
+        for mm in (self._log_mm, self._index_mm):
+            try:
+                if mm is not None:
+                    mm.close()
+            except BufferError:
+                pass  # A memoryview of it is still in use; it is unmapped once released
+        self._close_files()
+
+    @contextmanager
+    def _locked(self, operation: int) -> Iterator[None]:
+        with self._thread_lock:
+            fcntl.flock(self._index_fd, operation)
+            try:
+                yield
+            finally:
+                fcntl.flock(self._index_fd, fcntl.LOCK_UN)
+
+    def _recover(self) -> None:
+        """Write headers to new files and drop records a crash left incomplete."""
+        if os.fstat(self._log_fd).st_size < len(LOG_MAGIC):
+            os.ftruncate(self._log_fd, 0)
+            os.pwrite(self._log_fd, LOG_MAGIC, 0)
+        if os.fstat(self._index_fd).st_size < INDEX_HEADER_SIZE:
+            os.ftruncate(self._index_fd, 0)
+            os.pwrite(
+                self._index_fd,
+                INDEX_MAGIC + bytes(INDEX_HEADER_SIZE - len(INDEX_MAGIC)),
+                0,
+            )
+
+        index_size = os.fstat(self._index_fd).st_size
+        count = (index_size - INDEX_HEADER_SIZE) // _ENTRY.size
+        log_size = os.fstat(self._log_fd).st_size
+        log_end = len(LOG_MAGIC)
+        while count:
+            entry = os.pread(
+                self._index_fd,
+                _ENTRY.size,
+                INDEX_HEADER_SIZE + (count - 1) * _ENTRY.size,
+            )
+            offset, timestamp_length, content_length = _ENTRY.unpack(entry)
+            log_end = offset + timestamp_length + content_length
+            if log_end <= log_size:
+                break
+            count -= 1
+            log_end = len(LOG_MAGIC)
+        if index_size != INDEX_HEADER_SIZE + count * _ENTRY.size or log_size != log_end:
+            logger.warning(
+                "Dropping incomplete story log records", path=str(self.directory)
+            )
+            os.ftruncate(self._index_fd, INDEX_HEADER_SIZE + count * _ENTRY.size)
+            os.ftruncate(self._log_fd, log_end)
+
+    def _maps(self) -> tuple[mmap.mmap, mmap.mmap]:
+        """Return mappings covering both files, remapping any that have grown."""
+        index_size = os.fstat(self._index_fd).st_size
+        if self._index_mm is None or len(self._index_mm) < index_size:
+            self._index_mm = mmap.mmap(
+                self._index_fd, index_size, access=mmap.ACCESS_READ
+            )
+        log_size = os.fstat(self._log_fd).st_size
+        if self._log_mm is None or len(self._log_mm) < log_size:
+            self._log_mm = mmap.mmap(self._log_fd, log_size, access=mmap.ACCESS_READ)
+        return self._index_mm, self._log_mm
+
+    def __len__(self) -> int:
+        return (os.fstat(self._index_fd).st_size - INDEX_HEADER_SIZE) // _ENTRY.size
+
+    @property
+    def seeded(self) -> bool:
+        """Whether the log has been filled from the existing story storage."""
+        return self.state_path.exists()
+
+    def catch_up(
+        self,
+        source: str,
+        read_since: Callable[[ReadPosition], tuple[list[list[str]], ReadPosition]],
+    ) -> bool:
+        """Append the stories stored past the recorded read position.
+
+        ``read_since(position)`` returns the raw story rows stored after
+        ``position`` and the position after them. It runs under the exclusive
+        lock, so no two workers append the same rows. Stories a crash appended
+        after the state was last saved are not appended twice. If the log was
+        never seeded, or was seeded from storage other than ``source``, it is
+        emptied and filled from the start. Returns True if this call
+        (re)seeded it.
+        """
+        with self._locked(fcntl.LOCK_EX):
+            state = self._read_state()
+            reseed = state.get("source") != source
+            if reseed:
+                os.ftruncate(self._index_fd, INDEX_HEADER_SIZE)
+                os.ftruncate(self._log_fd, len(LOG_MAGIC))
+                state = {"position": 0, "stories": 0}
+            rows, position = read_since(state["position"])
+            stories = [(row[0], row[1]) for row in rows if len(row) >= 2]
+            self._append(stories[max(len(self) - state["stories"], 0) :])
+            self._write_state(
+                {"source": source, "position": position, "stories": len(self)}
+            )
+            return reseed
+
+    def _read_state(self) -> dict:
+        try:
+            return json.loads(self.state_path.read_bytes())
+        except FileNotFoundError:
+            return {}
+
+    def _write_state(self, state: dict) -> None:
+        # Replaced whole, so a crash leaves either the old state or the new one
+        partial = self.state_path.with_suffix(".state.tmp")
+        partial.write_text(json.dumps(state), encoding="utf-8")
+        os.replace(partial, self.state_path)
+
+    def append(self, datetime_submitted: int, content: str) -> int:
+        """Append one story and return its number."""
+        return self.extend([(datetime_submitted, content)])
+
+    def extend(self, stories: Iterable[tuple[int | str, str]]) -> int:
+        """Append (datetime_submitted, content) pairs; return the number of the last one."""
+        with self._locked(fcntl.LOCK_EX):
+            return self._append(stories)
+
+    def _append(self, stories: Iterable[tuple[int | str, str]]) -> int:
+        offset = os.fstat(self._log_fd).st_size
+        records = bytearray()
+        entries = bytearray()
+        for datetime_submitted, content in stories:
+            timestamp_bytes = str(datetime_submitted).encode()
+            content_bytes = content.encode()
+            entries += _ENTRY.pack(
+                offset + len(records), len(timestamp_bytes), len(content_bytes)
+            )
+            records += timestamp_bytes
+            records += content_bytes
+        # Record bytes first: readers only see a story once its entry exists
+        os.pwrite(self._log_fd, records, offset)
+        os.pwrite(self._index_fd, entries, os.fstat(self._index_fd).st_size)
+        return len(self) - 1
+
+    def _view(self) -> tuple[int, mmap.mmap, memoryview]:
+        """Return the story count with mappings that cover at least that many."""
+        count = len(self)
+        index_mm, log_mm = self._maps()
+        return count, index_mm, memoryview(log_mm)
+
+    @staticmethod
+    def _story(index_mm: mmap.mmap, log: memoryview, number: int) -> Story:
+        offset, timestamp_length, content_length = _ENTRY.unpack_from(
+            index_mm, INDEX_HEADER_SIZE + number * _ENTRY.size
+        )
+        content_start = offset + timestamp_length
+        return Story(
+            datetime_submitted=str(log[offset:content_start], "utf-8"),
+            content=str(log[content_start : content_start + content_length], "utf-8"),
+        )
+
+    def content(self, number: int) -> memoryview:
+        """Return story ``number``'s utf-8 content as a view into the mapped log."""
+        count, index_mm, log = self._view()
+        if not 0 <= number < count:
+            raise IndexError(f"No story number {number}")
+        offset, timestamp_length, content_length = _ENTRY.unpack_from(
+            index_mm, INDEX_HEADER_SIZE + number * _ENTRY.size
+        )
+        content_start = offset + timestamp_length
+        return log[content_start : content_start + content_length]
+
+    def story(self, number: int) -> Story:
+        """Return story ``number``."""
+        count, index_mm, log = self._view()
+        if not 0 <= number < count:
+            raise IndexError(f"No story number {number}")
+        return self._story(index_mm, log, number)
+
+    def page(self, limit: int, before: int | None = None) -> list[tuple[int, Story]]:
+        """Return up to ``limit`` (number, story) pairs, newest first, numbered below ``before``."""
+        count, index_mm, log = self._view()
+        end = count if before is None else max(min(before, count), 0)
+        numbers = range(end - 1, max(end - limit, 0) - 1, -1)
+        return [(number, self._story(index_mm, log, number)) for number in numbers]
+
+    def __iter__(self) -> Iterator[Story]:
+        count, index_mm, log = self._view()
+        for number in range(count):
+            yield self._story(index_mm, log, number)
+
+
+class StoryLogService(SurveyDataService):
+    """Wrap another SurveyDataService and serve stories from a StoryLog.
+
+    Story writes go to the wrapped service first; the log then appends every
+    story stored since it last read, so story reads never touch the wrapped
+    storage. Everything else passes through.
+    """
+
+    def __init__(self, inner: SurveyDataService, log: StoryLog, source: str) -> None:
+        """Wrap ``inner``, seeding ``log`` with its stories or catching it up.
+
+        ``source`` identifies the storage (e.g. ``sheets:<id>``); a log seeded
+        from different storage is emptied and reseeded.
+        """
+        self.inner = inner
+        self.log = log
+        self.source = source
+        if self._catch_up():
+            logger.info("Seeded story log", path=str(log.directory), stories=len(log))
+
+    def _catch_up(self) -> bool:
+        """Append the stories stored since the log last read them."""
+        return self.log.catch_up(
+            self.source,
+            lambda position: self.inner.read_rows_since(Dataset.STORIES, position),
+        )
+
+    def save_ministering_event(
+        self,
+        datetime_submitted: int,
+        organization: Organization,
+    ) -> None:
+        """Save a ministering event via the wrapped service."""
+        self.inner.save_ministering_event(datetime_submitted, organization)
+
+    def get_ministering_reports(self) -> MinisteringReport:
+        """Get ministering reports from the wrapped service."""
+        return self.inner.get_ministering_reports()
+
+    def save_missionary_experience_answer(
+        self,
+        datetime_submitted: int,
+        organization: Organization,
+        question_id: int,
+        question_text: str,
+    ) -> None:
+        """Save a missionary-experience answer via the wrapped service."""
+        self.inner.save_missionary_experience_answer(
+            datetime_submitted, organization, question_id, question_text
+        )
+
+    def get_missionary_experience_report(self) -> MissionaryExperienceReport:
+        """Get the missionary-experience report from the wrapped service."""
+        return self.inner.get_missionary_experience_report()
+
+    def save_story(self, datetime_submitted: int, content: str) -> None:
+        """Save via the wrapped service, then append the new stories to the log."""
+        self.inner.save_story(datetime_submitted, content)
+        self._catch_up()
+
+    def get_stories(self) -> list[Story]:
+        """Read every story from the log."""
+        with span("story_log"):
+            return list(self.log)
+
+    def iter_dataset_rows(self, dataset: Dataset) -> Iterator[dict[str, str]]:
+        """Stream dataset rows from the wrapped service."""
+        return self.inner.iter_dataset_rows(dataset)
+
+    def read_rows_since(
+        self, dataset: Dataset, position: ReadPosition
+    ) -> tuple[list[list[str]], ReadPosition]:
+        """Read new rows from the wrapped service."""
+        return self.inner.read_rows_since(dataset, position)
+
+    def append_dataset_rows(self, dataset: Dataset, rows: list[list[str]]) -> None:
+        """Append via the wrapped service, then log any new stories."""
+        self.inner.append_dataset_rows(dataset, rows)
+        if dataset == Dataset.STORIES:
+            self._catch_up()
@@ -0,0 +1,157 @@
+"""Read-only analytics over the legacy ``surveys.csv`` (0.1.0 Come Follow Me survey).
+
+The file is loaded once into compact columns: ``array('H')`` codes for the
+organization and week of each row, and one byte per row for each yes/no
+answer. Group-bys are then a single ``Counter(zip(group_codes, answers))``
+per question, which runs in C rather than a per-row Python loop, and the
+finished report is cached until the file changes.
+"""
+
+import csv
+import time
+from array import array
+from collections import Counter
+from dataclasses import dataclass
+from datetime import date, timedelta
+from functools import lru_cache
+from pathlib import Path
+
+from loguru import logger
+
+import rs_backend.logger  # noqa: F401  # Import to configure logger
+from rs_backend.metrics import CACHE_ENTRIES, record_cache_lookup
+from rs_backend.schemas.survey_history import SurveyHistoryReport, YesRate
+
+LEGACY_QUESTIONS = ("q_did_you_set_a_cfm_goal", "q_did_you_make_progress_this_week")
+
+# Answer codes stored in the per-question byte columns
+NO, YES, MISSING = 0, 1, 2
+_ANSWER_CODES = {"no": NO, "yes": YES}
+
+
+@dataclass(frozen=True)
+class SurveyColumns:
+    """Column-oriented, dictionary-encoded view of surveys.csv."""
+
+    organizations: tuple[str, ...]
+    weeks: tuple[str, ...]
+    org_codes: array
+    week_codes: array
+    answers: dict[str, bytes]
+
+    def __len__(self) -> int:
+        return len(self.org_codes)
+
+
+def _week_start(datetime_submitted: str) -> str:
+    """Return the Monday (YYYY-MM-DD) of the week a timestamp falls in."""
+    try:
+        day = date.fromisoformat(datetime_submitted[:10])
+    except ValueError:
+        return ""
+    return (day - timedelta(days=day.weekday())).isoformat()
+
+
+def load_survey_columns(path: Path) -> SurveyColumns:
+    """Read surveys.csv once into dictionary-encoded columns."""
+    org_index: dict[str, int] = {}
+    week_index: dict[str, int] = {}
+    org_codes = array("H")
+    week_codes = array("H")
+    answers = {question: bytearray() for question in LEGACY_QUESTIONS}
+
+    with open(path, "r", newline="") as f:
+        for row in csv.DictReader(f):
+            org = (row.get("organization") or "").strip().lower()
+            week = _week_start(row.get("datetime_submitted") or "")
+            org_codes.append(org_index.setdefault(org, len(org_index)))
+            week_codes.append(week_index.setdefault(week, len(week_index)))
+            for question in LEGACY_QUESTIONS:
+                answer = (row.get(question) or "").strip().lower()
+                answers[question].append(_ANSWER_CODES.get(answer, MISSING))
+
+    return SurveyColumns(
+        organizations=tuple(org_index),
+        weeks=tuple(week_index),
+        org_codes=org_codes,
+        week_codes=week_codes,
+        answers={question: bytes(column) for question, column in answers.items()},
+    )
+
+
+def _yes_rate(yes: int, no: int) -> YesRate:
+    responses = yes + no
+    return YesRate(
+        responses=responses,
+        yes=yes,
+        yes_rate=round(yes / responses, 4) if responses else 0.0,
+    )
+
+
+def _rates_by_group(
+    group_codes: array,
+    labels: tuple[str, ...],
+    answers: bytes,
+) -> dict[str, YesRate]:
+    """Yes-rate per group label from one pass of Counter over (group, answer)."""
+    tally = Counter(zip(group_codes, answers))
+    return {
+        label: _yes_rate(tally[(code, YES)], tally[(code, NO)])
+        for code, label in enumerate(labels)
+        if tally[(code, YES)] + tally[(code, NO)]
+    }
+
+
+def build_report(columns: SurveyColumns) -> SurveyHistoryReport:
+    """Compute overall, per-organization and per-week yes-rates."""
+    overall: dict[str, YesRate] = {}
+    by_organization: dict[str, dict[str, YesRate]] = {}
+    by_week: dict[str, dict[str, YesRate]] = {}
+    for question, column in columns.answers.items():
+        overall[question] = _yes_rate(column.count(YES), column.count(NO))
+        by_organization[question] = _rates_by_group(
+            columns.org_codes, columns.organizations, column
+        )
+        by_week[question] = dict(
+            sorted(_rates_by_group(columns.week_codes, columns.weeks, column).items())
+        )
+
+    return SurveyHistoryReport(
+        total_responses=len(columns),
+        overall=overall,
+        by_organization=by_organization,
+        by_week=by_week,
+    )
+
+
+@lru_cache(maxsize=4)
+def _cached_report(path: Path, mtime_ns: int, size: int) -> SurveyHistoryReport:
+    started = time.perf_counter()
+    report = build_report(load_survey_columns(path))
+    logger.info(
+        "Loaded survey history",
+        path=str(path),
+        rows=report.total_responses,
+        elapsed_ms=round((time.perf_counter() - started) * 1000, 2),
+    )
+    return report
+
+
+CACHE_ENTRIES.set_function(
+    lambda: _cached_report.cache_info().currsize, "survey_history"
+)
+
+
+def get_survey_history_report(path: Path) -> SurveyHistoryReport:
+    """Return the (cached) report for ``path``; recomputed only if the file changes."""
+    if not path.exists():
+        return SurveyHistoryReport(
+            total_responses=0, overall={}, by_organization={}, by_week={}
+        )
+    stat = path.stat()
+    misses = _cached_report.cache_info().misses
+    report = _cached_report(path, stat.st_mtime_ns, stat.st_size)
+    record_cache_lookup(
+        "survey_history", hit=_cached_report.cache_info().misses == misses
+    )
+    return report
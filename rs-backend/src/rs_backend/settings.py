@@ -1,17 +1,45 @@
+import hmac
 from pathlib import Path
+from typing import Literal
 
-from pydantic import Field, SecretStr
+from pydantic import BaseModel, Field, SecretStr, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 # Get the directory where this file is located
 THIS_DIR = Path(__file__).parent
 
 
+class TenantConfig(BaseModel):
+    """Storage for one ward: a CSV data directory or a Google Sheets spreadsheet."""
+
+    csv_data_dir: Path | None = None
+    google_sheets_spreadsheet_id: str | None = None
+
+    @model_validator(mode="after")
+    def _one_backend(self) -> "TenantConfig":
+        if (self.csv_data_dir is None) == (self.google_sheets_spreadsheet_id is None):
+            raise ValueError(
+                "Set exactly one of csv_data_dir or google_sheets_spreadsheet_id"
+            )
+        return self
+
+
 class Settings(BaseSettings):
     """Application settings loaded from environment variables."""
 
     app_name: str = "RS Backend"
-    use_csv_service: bool = True  # Use CSVService for local dev, False for SheetsService
+    use_csv_service: bool = (
+        True  # Use CSVService for local dev, False for SheetsService
+    )
+
+    # Logging: "pretty" (colorized, synchronous) for dev, "json" (queued JSON lines) for prod
+    log_format: Literal["pretty", "json"] = "pretty"
+    access_log_sample_rate: float = Field(
+        default=1.0,
+        ge=0.0,
+        le=1.0,
+        description="Fraction of successful requests whose access log lines are written",
+    )
 
     # CSV service settings
     csv_data_dir: Path = Field(
@@ -19,15 +47,182 @@ class Settings(BaseSettings):
         description="Directory for CSV data files",
     )
 
+    # Append-only story log (optional); stories are then read from it by number
+    story_log_dir: Path | None = Field(
+        default=None,
+        description=(
+            "Directory for the mmap'd story log and offset index. Wards get a "
+            "subdirectory each. Story reads and paging are served from it when set."
+        ),
+    )
+
+    # Warm-start report snapshot (optional); reports then read only new rows
+    report_snapshot_path: Path | None = Field(
+        default=None,
+        description=(
+            "JSON file holding report counts and how far into each dataset they "
+            "reach. Loaded at startup, saved periodically and at shutdown."
+        ),
+    )
+    report_snapshot_interval_seconds: float = Field(
+        default=300.0,
+        gt=0,
+        description="How often the report snapshot is saved while running",
+    )
+
+    # Background precompute of report and story-list views
+    precompute_enabled: bool = Field(
+        default=False,
+        description=(
+            "Serve reports and the story list from views refreshed in the background. "
+            "Idle refreshes reread all stories and reports, using Sheets quota per worker"
+        ),
+    )
+    precompute_active_interval_seconds: float = Field(
+        default=1.0,
+        ge=0,
+        description="Delay between a write and the refresh it triggers",
+    )
+    precompute_idle_interval_seconds: float = Field(
+        default=30.0,
+        gt=0,
+        description="Refresh interval when there are no writes (catches other workers' rows)",
+    )
+    precompute_max_staleness_seconds: float = Field(
+        default=120.0,
+        gt=0,
+        description="Views older than this (refreshes failing) are not served",
+    )
+
+    # Legacy 0.1.0 survey answers, served read-only by /history/cfm-survey
+    survey_history_file: Path = Field(
+        default_factory=lambda: THIS_DIR / "data" / "surveys.csv",
+        description="CSV of legacy Come Follow Me yes/no survey answers",
+    )
+
     # Static files directory
     static_dir: Path = Field(
         default_factory=lambda: THIS_DIR / "static",
         description="Directory for static frontend files",
     )
 
+    # Shared report counters (optional, for multi-worker deployments)
+    shared_counters_path: Path | None = Field(
+        default=None,
+        description=(
+            "mmap'd counter file shared by all workers, e.g. /dev/shm/rs-backend-counters. "
+            "Reports are served from it instead of scanning storage when set."
+        ),
+    )
+
+    # Idempotency-Key replay cache for retried submissions
+    idempotency_max_keys: int = Field(
+        default=4096,
+        description="Most recent Idempotency-Key responses kept for replay",
+    )
+    idempotency_ttl_seconds: float = Field(
+        default=24 * 60 * 60,
+        description="How long a stored Idempotency-Key response can be replayed",
+    )
+
+    # Admission control: concurrent requests per route class before queueing. Their sum
+    # should stay below the threadpool size (40) that runs the blocking service calls.
+    admission_writes_concurrency: int = Field(default=16, ge=1)
+    admission_reports_concurrency: int = Field(default=8, ge=1)
+    admission_stories_concurrency: int = Field(default=8, ge=1)
+    admission_queue_size: int = Field(
+        default=32,
+        ge=0,
+        description="Requests per route class that may wait for a slot; the rest get a 503",
+    )
+    admission_queue_timeout_seconds: float = Field(
+        default=2.0,
+        gt=0,
+        description="How long a queued request waits for a slot before it gets a 503",
+    )
+    admission_retry_after_seconds: int = Field(
+        default=5,
+        ge=0,
+        description="Retry-After sent with 503 responses from admission control",
+    )
+
+    # Per-client rate limits for submissions, keyed by X-Device-Token or client IP
+    rate_limits: dict[str, str] = Field(
+        default={
+            "/ministering/": "30/minute",
+            "/missionary-experience/": "30/minute",
+            "/stories/": "10/minute",
+            "/ingest/batch": "10/minute",
+        },
+        description="POST path -> allowed rate, e.g. '10/minute'; unlisted paths are unlimited",
+    )
+    rate_limit_max_clients: int = Field(
+        default=10_000,
+        ge=1,
+        description="(route, client) pairs tracked; the least recently seen are forgotten",
+    )
+    rate_limit_device_ip_factor: int = Field(
+        default=10,
+        ge=1,
+        description=(
+            "Requests carrying X-Device-Token also share a per-IP limit of this many "
+            "times the per-client rate, so rotating tokens cannot bypass limiting"
+        ),
+    )
+    rate_limit_trust_forwarded_for: bool = Field(
+        default=False,
+        description="Key anonymous clients by X-Forwarded-For (only behind a trusted proxy)",
+    )
+
+    # Multi-ward tenancy: requests under /w/{slug}/ or carrying the tenant header
+    # use that ward's storage; all other requests use the settings above
+    tenants: dict[str, TenantConfig] = Field(
+        default_factory=dict,
+        description="Ward slug -> its CSV data dir or spreadsheet, as JSON",
+    )
+    tenant_header: str = "X-Ward"
+    tenant_max_active: int = Field(
+        default=32,
+        ge=1,
+        description="Wards whose services and caches stay loaded; the least recently used go",
+    )
+    tenant_idle_seconds: float = Field(
+        default=60 * 60,
+        gt=0,
+        description="Unused wards are unloaded after this long",
+    )
+
+    # Admin-only diagnostics (profiling); disabled unless a token is configured
+    admin_token: SecretStr | None = None
+    profiling_enabled: bool = False
+    profiling_interval_ms: float = Field(
+        default=1.0,
+        gt=0,
+        description="Stack sampling interval while a request is profiled",
+    )
+    profiling_output_dir: Path = Field(
+        default_factory=lambda: Path("/tmp/rs-backend-profiles"),
+        description="Directory where collapsed-stack profiles are written",
+    )
+
     # Google Sheets settings (optional, only needed if use_csv_service=False)
     google_sheets_credentials_path: SecretStr | None = None
     google_sheets_spreadsheet_id: str | None = None
+    google_sheets_api_endpoint: str | None = Field(
+        default=None,
+        description=(
+            "Alternative Sheets API server, e.g. the local fake started by "
+            "`rs-backend fake-sheets`; credentials are optional when set"
+        ),
+    )
+
+    def admin_token_matches(self, token: str | None) -> bool:
+        """Check a client-supplied token against ``admin_token`` in constant time."""
+        if token is None or self.admin_token is None:
+            return False
+        return hmac.compare_digest(
+            token.encode(), self.admin_token.get_secret_value().encode()
+        )
 
     model_config = SettingsConfigDict(
         env_file=".env",
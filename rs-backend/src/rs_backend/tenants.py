@@ -0,0 +1,190 @@
+"""Multi-ward tenancy: one deployment serving several wards' storage.
+
+A request names its ward with a ``/w/{slug}`` path prefix, which is stripped
+before routing so every endpoint works unchanged beneath it, or with the
+tenant header (``X-Ward`` by default). Requests naming no ward use the
+deployment's own storage as before.
+
+Each ward's data service is created on first use and kept in a bounded LRU
+together with its caches (the story search index and, when enabled, the
+mapped story log). Wards unused for a while,
+or pushed out by more recently used ones, are unloaded and rebuilt when next
+needed. All Sheets-backed wards share one pool of API clients, so loading
+another ward opens no new connections.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from fastapi import Request
+from fastapi.responses import JSONResponse
+from loguru import logger
+
+from rs_backend.metrics import instrument_service
+from rs_backend.search import StoryIndex
+from rs_backend.services.base import SurveyDataService
+from rs_backend.services.csv_service import CSVService
+from rs_backend.services.sheets_service import SheetsClientPool, SheetsService
+from rs_backend.services.story_log import StoryLog, StoryLogService
+from rs_backend.settings import Settings
+
+TENANT_PATH_PREFIX = "/w/"
+
+
+class UnknownTenantError(KeyError):
+    """Raised when a ward slug is not configured."""
+
+
+@dataclass
+class Tenant:
+    """A loaded ward: its data service and per-ward caches."""
+
+    slug: str
+    service: SurveyDataService
+    story_index: StoryIndex | None = None
+    story_log: StoryLog | None = None
+    last_used: float = 0.0
+
+
+class TenantRegistry:
+    """Lazily created per-ward services, held in an LRU with idle expiry."""
+
+    def __init__(self, settings: Settings) -> None:
+        self.settings = settings
+        self._active: OrderedDict[str, Tenant] = OrderedDict()
+        self._lock = threading.Lock()
+        self._client_pool: SheetsClientPool | None = None
+
+    def __len__(self) -> int:
+        return len(self._active)
+
+    def __contains__(self, slug: str) -> bool:
+        return slug in self.settings.tenants
+
+    @property
+    def client_pool(self) -> SheetsClientPool:
+        """Sheets API clients shared by every Sheets-backed ward."""
+        if self._client_pool is None:
+            credentials_path = self.settings.google_sheets_credentials_path
+            self._client_pool = SheetsClientPool.from_path(
+                credentials_path.get_secret_value()
+                if credentials_path is not None
+                else None,
+                self.settings.google_sheets_api_endpoint,
+            )
+        return self._client_pool
+
+    def get(self, slug: str) -> Tenant:
+        """Return the loaded ward, loading it (and unloading others) if needed."""
+        now = time.monotonic()
+        with self._lock:
+            self._evict_idle(now)
+            tenant = self._active.get(slug)
+            if tenant is None:
+                tenant = self._active[slug] = self._load(slug)
+                logger.info("Ward loaded", ward=slug, active=len(self._active))
+                while len(self._active) > self.settings.tenant_max_active:
+                    self._unload(*self._active.popitem(last=False), reason="lru")
+            else:
+                self._active.move_to_end(slug)
+            tenant.last_used = now
+            return tenant
+
+    def _evict_idle(self, now: float) -> None:
+        while self._active:
+            slug, oldest = next(iter(self._active.items()))
+            if now - oldest.last_used <= self.settings.tenant_idle_seconds:
+                return
+            del self._active[slug]
+            self._unload(slug, oldest, reason="idle")
+
+    def _unload(self, slug: str, tenant: Tenant, reason: str) -> None:
+        # The story log is not closed here: a request that already holds the
+        # ward may still be writing to it. Its files close once the last
+        # reference to the log goes (see StoryLog's finalizer).
+        logger.info("Ward unloaded", ward=slug, reason=reason)
+
+    def _load(self, slug: str) -> Tenant:
+        service = self._build_service(slug)
+        if self.settings.story_log_dir is None:
+            return Tenant(slug, service)
+        config = self.settings.tenants[slug]
+        source = (
+            f"csv:{config.csv_data_dir.resolve()}"
+            if config.csv_data_dir is not None
+            else f"sheets:{config.google_sheets_spreadsheet_id}"
+        )
+        log = StoryLog(self.settings.story_log_dir / slug)
+        service = StoryLogService(inner=service, log=log, source=source)
+        instrument_service(
+            service, backend="story_log", methods=SurveyDataService.__abstractmethods__
+        )
+        return Tenant(slug, service, story_log=log)
+
+    def _build_service(self, slug: str) -> SurveyDataService:
+        config = self.settings.tenants.get(slug)
+        if config is None:
+            raise UnknownTenantError(slug)
+        if config.csv_data_dir is not None:
+            CSVService.init(data_dir=config.csv_data_dir)
+            service: SurveyDataService = CSVService(data_dir=config.csv_data_dir)
+            backend = "csv"
+        else:
+            service = SheetsService(
+                spreadsheet_id=config.google_sheets_spreadsheet_id,
+                client_pool=self.client_pool,
+            )
+            backend = "sheets"
+        instrument_service(
+            service, backend=backend, methods=SurveyDataService.__abstractmethods__
+        )
+        return service
+
+
+def current_tenant(request: Request) -> Tenant | None:
+    """Return the ward named by the request, or None for the deployment's own storage."""
+    slug: str | None = getattr(request.state, "tenant", None)
+    if slug is None:
+        return None
+    registry: TenantRegistry = request.app.state.tenant_registry
+    return registry.get(slug)
+
+
+def get_service(request: Request) -> SurveyDataService:
+    """Return the data service for the request's ward."""
+    tenant = current_tenant(request)
+    return (
+        tenant.service if tenant is not None else request.app.state.survey_data_service
+    )
+
+
+def ward_state(request: Request):
+    """Return the holder of the request's per-ward state: the ward, or the app state.
+
+    Both carry ``story_index`` and ``story_log`` attributes (None when unused).
+    """
+    return current_tenant(request) or request.app.state
+
+
+async def tenant_middleware(request: Request, call_next):
+    """Resolve the ward from the path prefix or header, stripping the prefix."""
+    path = request.scope["path"]
+    if path.startswith(TENANT_PATH_PREFIX):
+        slug, _, rest = path[len(TENANT_PATH_PREFIX) :].partition("/")
+        request.scope["path"] = "/" + rest
+        request.scope["raw_path"] = ("/" + rest).encode()
+    else:
+        settings: Settings = request.app.state.settings
+        slug = request.headers.get(settings.tenant_header)
+    if slug is None:
+        return await call_next(request)
+
+    registry: TenantRegistry = request.app.state.tenant_registry
+    if slug not in registry:
+        return JSONResponse(
+            status_code=404, content={"detail": f"Unknown ward: {slug}"}
+        )
+    request.state.tenant = slug
+    return await call_next(request)
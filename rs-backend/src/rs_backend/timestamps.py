@@ -0,0 +1,51 @@
+"""Submission times as integer epoch seconds.
+
+Submissions are timestamped with ``now_epoch()`` and kept as integers through
+storage and in memory, so sorting and date-range filters are integer
+comparisons. They are formatted as ``YYYY-MM-DD HH:MM:SS UTC`` only at the
+edges people read: API responses, exports and the Google Sheet.
+
+Rows written before this change hold the formatted string; ``to_epoch``
+accepts either form, so old and new rows can sit side by side.
+"""
+
+import time
+from datetime import UTC, date, datetime
+
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S UTC"
+
+
+def now_epoch() -> int:
+    """Return the current time in whole epoch seconds."""
+    return int(time.time())
+
+
+def to_epoch(value: float | str) -> int:
+    """Return epoch seconds from a stored timestamp: an integer or a formatted string.
+
+    Raises ValueError if a string is neither.
+    """
+    if isinstance(value, (int, float)):
+        return int(value)
+    value = value.strip()
+    if value.isdigit():
+        return int(value)
+    # "YYYY-MM-DD HH:MM:SS UTC"; fromisoformat is far cheaper than strptime
+    return int(datetime.fromisoformat(value[:19]).replace(tzinfo=UTC).timestamp())
+
+
+def from_datetime(moment: datetime) -> int:
+    """Return epoch seconds of an aware (or naive UTC) datetime."""
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=UTC)
+    return int(moment.timestamp())
+
+
+def day_start_epoch(day: date) -> int:
+    """Return epoch seconds at 00:00:00 UTC of ``day``."""
+    return from_datetime(datetime(day.year, day.month, day.day))
+
+
+def format_timestamp(epoch: int) -> str:
+    """Format epoch seconds as ``YYYY-MM-DD HH:MM:SS UTC``."""
+    return datetime.fromtimestamp(epoch, UTC).strftime(TIMESTAMP_FORMAT)
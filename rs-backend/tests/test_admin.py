@@ -0,0 +1,87 @@
+import tracemalloc
+
+import pytest
+from fastapi.testclient import TestClient
+from pydantic import SecretStr
+
+ADMIN_HEADERS = {"X-Admin-Token": "s3cret"}
+
+
+@pytest.fixture
+def admin_client(client: TestClient) -> TestClient:
+    """Client whose app has an admin token configured; stops tracing afterwards."""
+    client.app.state.settings.admin_token = SecretStr("s3cret")
+    yield client
+    if tracemalloc.is_tracing():
+        tracemalloc.stop()
+
+
+def test_admin_requires_token(client: TestClient) -> None:
+    """Test that admin endpoints are closed without a configured, matching token."""
+    assert client.get("/admin/memory", headers=ADMIN_HEADERS).status_code == 403
+
+    client.app.state.settings.admin_token = SecretStr("s3cret")
+    assert client.get("/admin/memory").status_code == 403
+    assert (
+        client.get("/admin/memory", headers={"X-Admin-Token": "nope"}).status_code
+        == 403
+    )
+    assert client.get("/admin/memory", headers=ADMIN_HEADERS).status_code == 200
+
+
+def test_memory_status_reports_cache_sizes(admin_client: TestClient) -> None:
+    """Test that the status includes in-process cache entry counts."""
+    admin_client.post(
+        "/stories/", json={"content": "Cached story"}, headers={"Idempotency-Key": "k1"}
+    )
+    admin_client.get("/stories/search", params={"q": "cached"})
+
+    status = admin_client.get("/admin/memory", headers=ADMIN_HEADERS).json()
+    assert status["tracing"] is False
+    assert status["max_rss_bytes"] > 0
+    assert status["cache_entries"]["idempotency"] == 1
+    assert status["cache_entries"]["story_index"] == 1
+
+
+def test_snapshot_requires_tracing(admin_client: TestClient) -> None:
+    """Test that snapshots can only be taken while tracing."""
+    response = admin_client.post("/admin/memory/snapshots", headers=ADMIN_HEADERS)
+    assert response.status_code == 409
+
+
+def test_snapshot_top_and_diff(admin_client: TestClient) -> None:
+    """Test starting tracing, taking two snapshots and diffing them."""
+    response = admin_client.post(
+        "/admin/memory/start", params={"frames": 4}, headers=ADMIN_HEADERS
+    )
+    assert response.json()["tracing"] is True
+
+    base = admin_client.post("/admin/memory/snapshots", headers=ADMIN_HEADERS).json()
+    retained = [bytearray(1024) for _ in range(200)]
+    current = admin_client.post("/admin/memory/snapshots", headers=ADMIN_HEADERS).json()
+
+    top = admin_client.get(
+        f"/admin/memory/snapshots/{current['snapshot_id']}",
+        params={"limit": 5},
+        headers=ADMIN_HEADERS,
+    ).json()
+    assert 0 < len(top) <= 5
+    assert top[0]["size_bytes"] >= top[-1]["size_bytes"]
+
+    diff = admin_client.get(
+        "/admin/memory/diff",
+        params={"base": base["snapshot_id"], "current": current["snapshot_id"]},
+        headers=ADMIN_HEADERS,
+    ).json()
+    assert any(
+        "test_admin.py" in site["location"] and site["size_diff_bytes"] >= 200 * 1024
+        for site in diff
+    )
+    del retained
+
+    response = admin_client.get("/admin/memory/snapshots/999", headers=ADMIN_HEADERS)
+    assert response.status_code == 404
+
+    status = admin_client.post("/admin/memory/stop", headers=ADMIN_HEADERS).json()
+    assert status["tracing"] is False
+    assert status["snapshots"] == []
@@ -0,0 +1,61 @@
+import asyncio
+
+from fastapi.testclient import TestClient
+
+from rs_backend.admission import AdmissionLimiter, route_class
+
+
+def test_route_classes() -> None:
+    """Test that submissions, reports and story reads are limited separately."""
+    assert route_class("POST", "/stories/") == "writes"
+    assert route_class("GET", "/stories/") == "stories"
+    assert route_class("GET", "/missionary-experience/reports") == "reports"
+    assert route_class("GET", "/metrics") is None
+
+
+def test_limiter_queues_then_sheds() -> None:
+    """Test admission, FIFO hand-off, queue overflow and queue timeout."""
+
+    async def scenario() -> list:
+        limiter = AdmissionLimiter(
+            max_concurrent=1, max_queue=1, queue_timeout_seconds=0.05
+        )
+        outcomes = [await limiter.acquire()]  # admitted at once
+
+        queued = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        assert limiter.queue_depth == 1
+        outcomes.append(await limiter.acquire())  # queue full
+
+        limiter.release()  # hands the slot to the queued request
+        outcomes.append(await queued)
+        assert limiter.in_flight == 1
+
+        outcomes.append(await limiter.acquire())  # waits, then times out
+        assert limiter.queue_depth == 0
+        limiter.release()
+        assert limiter.in_flight == 0
+        return outcomes
+
+    assert asyncio.run(scenario()) == [None, "queue_full", None, "queue_timeout"]
+
+
+def test_saturated_route_class_gets_503(client: TestClient) -> None:
+    """Test that a saturated class is shed with Retry-After while others still work."""
+    limiters = client.app.state.admission_limiters
+    limiters["reports"] = AdmissionLimiter(
+        max_concurrent=1, max_queue=0, queue_timeout_seconds=1
+    )
+    limiters["reports"].in_flight = 1  # pretend a slow report holds the only slot
+
+    response = client.get("/ministering/reports")
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "5"
+
+    assert client.get("/stories/").status_code == 200
+
+    metrics = client.get("/metrics").text
+    assert (
+        'rs_admission_shed_total{route_class="reports",reason="queue_full"}' in metrics
+    )
+    assert 'rs_admission_queue_depth{route_class="writes"} 0' in metrics
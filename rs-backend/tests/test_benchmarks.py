@@ -0,0 +1,56 @@
+import json
+from pathlib import Path
+
+from rs_backend.benchmarks import METHODS, run_benchmarks
+from rs_backend.cli import main
+from rs_backend.schemas.enums import Dataset
+from rs_backend.services.csv_service import CSVService
+
+
+def test_run_benchmarks_seeds_each_size(temp_data_dir: Path) -> None:
+    """Test that sizes are seeded incrementally and every method is timed at each."""
+    CSVService.init(data_dir=temp_data_dir)
+    service = CSVService(data_dir=temp_data_dir)
+
+    results = run_benchmarks(
+        service,
+        row_counts=[40, 20],
+        iterations=3,
+        max_seconds=5.0,
+        methods=["get_stories", "get_ministering_reports"],
+    )
+
+    assert [(result.rows, result.method) for result in results] == [
+        (20, "get_stories"),
+        (20, "get_ministering_reports"),
+        (40, "get_stories"),
+        (40, "get_ministering_reports"),
+    ]
+    assert all(result.iterations == 3 for result in results)
+    assert all(result.p50_ms <= result.p99_ms <= result.max_ms for result in results)
+    assert sum(1 for _ in service.iter_dataset_rows(Dataset.STORIES)) == 40
+
+
+def test_bench_command_writes_results(temp_data_dir: Path) -> None:
+    """Test that `rs-backend bench` benchmarks every method and writes JSON results."""
+    output = temp_data_dir / "bench.json"
+
+    exit_code = main(
+        [
+            "bench",
+            "--backend",
+            f"csv:{temp_data_dir / 'bench'}",
+            "--rows",
+            "10",
+            "--iterations",
+            "2",
+            "--output",
+            str(output),
+        ]
+    )
+    assert exit_code == 0
+
+    results = json.loads(output.read_text())
+    assert results["backend"] == f"csv:{temp_data_dir / 'bench'}"
+    assert [result["method"] for result in results["results"]] == list(METHODS)
+    assert all(result["peak_alloc_bytes"] >= 0 for result in results["results"])
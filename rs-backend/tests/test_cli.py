@@ -0,0 +1,134 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from rs_backend.cli import main
+from rs_backend.schemas.enums import Dataset, Organization
+from rs_backend.services.csv_service import CSVService
+
+
+def _seed_source(data_dir: Path) -> CSVService:
+    CSVService.init(data_dir=data_dir)
+    source = CSVService(data_dir=data_dir)
+    for i in range(5):
+        source.save_ministering_event(
+            f"2026-01-04 17:0{i}:00 UTC", Organization.RELIEF_SOCIETY
+        )
+    source.save_story("2026-01-04 18:00:00 UTC", "A story,\nwith a newline")
+    return source
+
+
+def test_migrate_copies_every_dataset(temp_data_dir: Path) -> None:
+    """Test that migrate copies all rows from one CSV backend to another."""
+    source = _seed_source(temp_data_dir / "source")
+    checkpoint = temp_data_dir / "checkpoint.json"
+
+    exit_code = main(
+        [
+            "migrate",
+            "--source",
+            f"csv:{temp_data_dir / 'source'}",
+            "--target",
+            f"csv:{temp_data_dir / 'target'}",
+            "--chunk-size",
+            "2",
+            "--checkpoint",
+            str(checkpoint),
+        ]
+    )
+    assert exit_code == 0
+
+    target = CSVService(data_dir=temp_data_dir / "target")
+    assert target.get_ministering_reports() == source.get_ministering_reports()
+    assert target.get_stories() == source.get_stories()
+    assert json.loads(checkpoint.read_text())["copied"] == {
+        "ministering_events": 5,
+        "missionary_experiences": 0,
+        "stories": 1,
+    }
+
+
+def test_migrate_resumes_from_checkpoint(temp_data_dir: Path) -> None:
+    """Test that an interrupted migration skips rows already copied."""
+    _seed_source(temp_data_dir / "source")
+    source_spec = f"csv:{temp_data_dir / 'source'}"
+    target_spec = f"csv:{temp_data_dir / 'target'}"
+    checkpoint = temp_data_dir / "checkpoint.json"
+
+    # Simulate a run that copied the first 3 ministering events before dying
+    CSVService.init(data_dir=temp_data_dir / "target")
+    target = CSVService(data_dir=temp_data_dir / "target")
+    target.append_dataset_rows(
+        Dataset.MINISTERING_EVENTS,
+        [[f"2026-01-04 17:0{i}:00 UTC", "relief society"] for i in range(3)],
+    )
+    checkpoint.write_text(
+        json.dumps(
+            {
+                "source": source_spec,
+                "target": target_spec,
+                "copied": {"ministering_events": 3},
+            }
+        )
+    )
+
+    main(
+        [
+            "migrate",
+            "--source",
+            source_spec,
+            "--target",
+            target_spec,
+            "--checkpoint",
+            str(checkpoint),
+        ]
+    )
+
+    assert target.get_ministering_reports().total_events == 5
+
+
+def test_migrate_resume_settles_the_interrupted_chunk(temp_data_dir: Path) -> None:
+    """Test that a chunk appended before the crash is not appended again on resume."""
+    _seed_source(temp_data_dir / "source")
+    source_spec = f"csv:{temp_data_dir / 'source'}"
+    target_spec = f"csv:{temp_data_dir / 'target'}"
+    checkpoint = temp_data_dir / "checkpoint.json"
+    args = ["migrate", "--source", source_spec, "--target", target_spec]
+    args += ["--checkpoint", str(checkpoint)]
+
+    # Simulate a run that died after appending 3 events but before recording them
+    CSVService.init(data_dir=temp_data_dir / "target")
+    target = CSVService(data_dir=temp_data_dir / "target")
+    target.append_dataset_rows(
+        Dataset.MINISTERING_EVENTS,
+        [[f"2026-01-04 17:0{i}:00 UTC", "relief society"] for i in range(3)],
+    )
+    pending = {"dataset": "ministering_events", "target_rows": 0, "rows": 3}
+    checkpoint.write_text(
+        json.dumps(
+            {
+                "source": source_spec,
+                "target": target_spec,
+                "copied": {},
+                "pending": pending,
+            }
+        )
+    )
+    assert main(args) == 0
+    assert target.get_ministering_reports().total_events == 5
+    assert json.loads(checkpoint.read_text())["pending"] is None
+
+    # A chunk that only partly reached the target stops the run
+    checkpoint.write_text(
+        json.dumps(
+            {
+                "source": source_spec,
+                "target": target_spec,
+                "copied": {},
+                "pending": {**pending, "target_rows": 4},
+            }
+        )
+    )
+    with pytest.raises(SystemExit, match="left 1 rows in the target"):
+        main(args)
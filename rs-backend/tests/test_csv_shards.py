@@ -0,0 +1,112 @@
+import csv
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from rs_backend.schemas.enums import Dataset, Organization
+from rs_backend.services.csv_service import CSVService
+
+
+def _rows(path: Path) -> list[list[str]]:
+    with open(path, newline="") as f:
+        return list(csv.reader(f))
+
+
+def test_writes_go_to_per_organization_shards(temp_data_dir: Path) -> None:
+    """Test that each organization's rows land in their own file with a header."""
+    CSVService.init(data_dir=temp_data_dir)
+    service = CSVService(data_dir=temp_data_dir)
+    service.save_ministering_event(
+        "2026-01-05 17:00:00 UTC", Organization.RELIEF_SOCIETY
+    )
+    service.append_dataset_rows(
+        Dataset.MINISTERING_EVENTS,
+        [
+            ["2026-01-06 17:00:00 UTC", "elders quorum"],
+            ["2026-01-07 17:00:00 UTC", "primary"],
+        ],
+    )
+
+    assert _rows(temp_data_dir / "ministering_events.relief_society.csv") == [
+        ["datetime_submitted", "organization"],
+        ["2026-01-05 17:00:00 UTC", "relief society"],
+    ]
+    assert _rows(temp_data_dir / "ministering_events.elders_quorum.csv")[1:] == [
+        ["2026-01-06 17:00:00 UTC", "elders quorum"]
+    ]
+    # Unknown organizations stay in the original file
+    assert _rows(temp_data_dir / "ministering_events.csv")[1:] == [
+        ["2026-01-07 17:00:00 UTC", "primary"]
+    ]
+
+
+def test_reads_merge_original_file_and_shards(temp_data_dir: Path) -> None:
+    """Test that reports and row streams cover pre-sharding rows and every shard."""
+    CSVService.init(data_dir=temp_data_dir)
+    with open(temp_data_dir / "missionary_experiences.csv", "a", newline="") as f:
+        csv.writer(f).writerow(
+            ["2026-01-06 17:00:00 UTC", "relief society", "3", "reach out"]
+        )
+    service = CSVService(data_dir=temp_data_dir)
+    service.save_missionary_experience_answer(
+        "2026-01-05 17:00:00 UTC", Organization.ELDERS_QUORUM, 3, "reach out"
+    )
+    service.save_missionary_experience_answer(
+        "2026-01-07 17:00:00 UTC", Organization.RELIEF_SOCIETY, 4, "invite"
+    )
+
+    report = service.get_missionary_experience_report()
+    assert report.total_answers == 3
+    assert report.counts_by_org == {"relief society": 2, "elders quorum": 1}
+    assert report.counts_by_question == {3: 2, 4: 1}
+    assert [
+        row["datetime_submitted"][:10]
+        for row in service.iter_dataset_rows(Dataset.MISSIONARY_EXPERIENCES)
+    ] == ["2026-01-05", "2026-01-06", "2026-01-07"]
+
+    rows, position = service.read_rows_since(Dataset.MISSIONARY_EXPERIENCES, 0)
+    assert len(rows) == 3
+    service.save_missionary_experience_answer(
+        "2026-01-08 17:00:00 UTC", Organization.ELDERS_QUORUM, 5, "teach"
+    )
+    rows, _ = service.read_rows_since(Dataset.MISSIONARY_EXPERIENCES, position)
+    assert rows == [["2026-01-08 17:00:00 UTC", "elders quorum", "5", "teach"]]
+
+
+def test_row_stream_tolerates_malformed_timestamps(temp_data_dir: Path) -> None:
+    """Test that a shard row with an unparseable time is streamed, not fatal to the merge."""
+    CSVService.init(data_dir=temp_data_dir)
+    service = CSVService(data_dir=temp_data_dir)
+    service.save_ministering_event(
+        "2026-01-05 17:00:00 UTC", Organization.ELDERS_QUORUM
+    )
+    service.save_ministering_event(
+        "2026-01-07 17:00:00 UTC", Organization.RELIEF_SOCIETY
+    )
+    shard = service._shard_file(Dataset.MINISTERING_EVENTS, Organization.ELDERS_QUORUM)
+    with open(shard, "a", newline="") as f:
+        csv.writer(f).writerow(["last tuesday", "elders quorum"])
+
+    rows = list(service.iter_dataset_rows(Dataset.MINISTERING_EVENTS))
+    assert [row["datetime_submitted"][:10] for row in rows] == [
+        "2026-01-05",
+        "last tuesd",
+        "2026-01-07",
+    ]
+
+
+def test_concurrent_writers_lose_no_rows(temp_data_dir: Path) -> None:
+    """Test that parallel appends from separate service instances are all kept."""
+    CSVService.init(data_dir=temp_data_dir)
+
+    def write(i: int) -> None:
+        organization = list(Organization)[i % len(Organization)]
+        CSVService(data_dir=temp_data_dir).save_ministering_event(
+            "2026-01-05 17:00:00 UTC", organization
+        )
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(write, range(200)))
+
+    report = CSVService(data_dir=temp_data_dir).get_ministering_reports()
+    assert report.total_events == 200
+    assert sum(report.counts_by_org.values()) == 200
@@ -0,0 +1,79 @@
+import csv
+import io
+import json
+from typing import Any
+
+from fastapi.testclient import TestClient
+
+from rs_backend.schemas.enums import Organization
+from rs_backend.services.base import SurveyDataService
+
+
+def test_export_stories_csv(client: TestClient) -> None:
+    """Test exporting stories as CSV."""
+    client.post("/stories/", json={"content": "First story"})
+    client.post("/stories/", json={"content": "Story with, a comma\nand a newline"})
+
+    response = client.get("/export/stories")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    assert 'filename="stories.csv"' in response.headers["content-disposition"]
+
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert [row["content"] for row in rows] == [
+        "First story",
+        "Story with, a comma\nand a newline",
+    ]
+
+
+def test_export_empty_dataset_csv_has_header(client: TestClient) -> None:
+    """Test that exporting an empty dataset still returns the header row."""
+    response = client.get("/export/ministering_events")
+    assert response.status_code == 200
+    assert response.text.strip() == "datetime_submitted,organization"
+
+
+def test_export_ndjson(client: TestClient) -> None:
+    """Test exporting missionary experiences as NDJSON."""
+    client.post(
+        "/missionary-experience/",
+        json={
+            "organization": "relief society",
+            "answers": [{"question_id": 1}, {"question_id": 2}],
+        },
+    )
+
+    response = client.get("/export/missionary_experiences", params={"format": "ndjson"})
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    rows: list[dict[str, Any]] = [
+        json.loads(line) for line in response.text.splitlines()
+    ]
+    assert [row["question_id"] for row in rows] == ["1", "2"]
+    assert all(row["organization"] == "relief society" for row in rows)
+
+
+def test_export_date_filters(client: TestClient) -> None:
+    """Test that since/until filter rows by submission date (inclusive)."""
+    service: SurveyDataService = client.app.state.survey_data_service
+    for day in ("2026-01-03", "2026-01-10", "2026-01-17"):
+        service.save_ministering_event(
+            f"{day} 18:00:00 UTC", Organization.ELDERS_QUORUM
+        )
+
+    response = client.get(
+        "/export/ministering_events",
+        params={"format": "ndjson", "since": "2026-01-10", "until": "2026-01-17"},
+    )
+    assert response.status_code == 200
+    days = [
+        json.loads(line)["datetime_submitted"][:10]
+        for line in response.text.splitlines()
+    ]
+    assert days == ["2026-01-10", "2026-01-17"]
+
+
+def test_export_unknown_dataset(client: TestClient) -> None:
+    """Test that unknown datasets are rejected."""
+    response = client.get("/export/surveys")
+    assert response.status_code == 422
@@ -0,0 +1,90 @@
+import httpx
+import pytest
+
+from rs_backend.fake_sheets import FakeSheetsConfig, parse_a1_range, serve_fake_sheets
+from rs_backend.schemas.enums import Dataset, Organization
+from rs_backend.services.errors import SheetsServiceError
+from rs_backend.services.sheets_service import SheetsService
+
+
+def _service(endpoint: str) -> SheetsService:
+    SheetsService.init(spreadsheet_id="fake", api_endpoint=endpoint)
+    return SheetsService(spreadsheet_id="fake", api_endpoint=endpoint)
+
+
+def test_parse_a1_range() -> None:
+    """Test the A1 range forms SheetsService sends."""
+    whole = parse_a1_range("stories!A:B")
+    assert (whole.sheet, whole.start_row, whole.end_row) == ("stories", 1, None)
+    assert (whole.start_column, whole.end_column) == (0, 1)
+
+    page = parse_a1_range("stories!A1002:D2001")
+    assert (page.start_row, page.end_row, page.end_column) == (1002, 2001, 3)
+
+
+def test_sheets_service_round_trip() -> None:
+    """Test that SheetsService reads back what it writes through the fake."""
+    with serve_fake_sheets() as endpoint:
+        service = _service(endpoint)
+        service.save_ministering_event(
+            "2026-01-04 17:00:00 UTC", Organization.RELIEF_SOCIETY
+        )
+        service.save_missionary_experience_answer(
+            "2026-01-04 17:01:00 UTC", Organization.ELDERS_QUORUM, 3, "reach out"
+        )
+        service.save_story("2026-01-04 17:02:00 UTC", "A story, with: punctuation")
+        service.append_dataset_rows(
+            Dataset.STORIES,
+            [["2026-01-05 09:00:00 UTC", f"story {i}"] for i in range(1500)],
+        )
+
+        assert service.get_ministering_reports().counts_by_org == {"relief society": 1}
+        report = service.get_missionary_experience_report()
+        assert report.counts_by_question == {3: 1}
+        assert service.get_stories()[0].content == "A story, with: punctuation"
+        # Paged in EXPORT_PAGE_SIZE ranges
+        assert sum(1 for _ in service.iter_dataset_rows(Dataset.STORIES)) == 1501
+
+        stats = httpx.get(f"{endpoint}_fake/stats").json()
+        assert stats["requests"]["spreadsheets.values.append"] == 4
+
+
+def test_export_pages_past_blank_rows() -> None:
+    """Test that cleared rows, even a whole page of them, do not end an export early."""
+    with serve_fake_sheets() as endpoint:
+        service = _service(endpoint)
+        service.append_dataset_rows(
+            Dataset.STORIES,
+            [["2026-01-05 09:00:00 UTC", f"story {i}"] for i in range(2500)],
+        )
+        # Clear rows 900-2100: across the first page boundary and all of the second page
+        httpx.put(
+            f"{endpoint}v4/spreadsheets/fake/values/stories!A900:B2100",
+            json={"values": [["", ""]] * 1201},
+        )
+
+        contents = [
+            row["content"] for row in service.iter_dataset_rows(Dataset.STORIES)
+        ]
+        assert len(contents) == 898 + 401
+        assert contents[-1] == "story 2499"
+
+
+def test_write_quota_returns_429() -> None:
+    """Test that writes beyond the per-minute quota fail like Sheets quota errors."""
+    with serve_fake_sheets(FakeSheetsConfig(write_quota_per_minute=2)) as endpoint:
+        service = _service(endpoint)
+        service.save_story("2026-01-04 17:00:00 UTC", "one")
+        service.save_story("2026-01-04 17:00:01 UTC", "two")
+        with pytest.raises(SheetsServiceError, match="429"):
+            service.save_story("2026-01-04 17:00:02 UTC", "three")
+        # Reads have their own quota
+        assert len(service.get_stories()) == 2
+
+
+def test_error_injection() -> None:
+    """Test that injected 5xx responses surface as service errors."""
+    with serve_fake_sheets(FakeSheetsConfig(error_rate=1.0, seed=1)) as endpoint:
+        with pytest.raises(SheetsServiceError):
+            _service(endpoint)
+        assert httpx.get(f"{endpoint}_fake/stats").json()["injected_errors"] == 1
@@ -0,0 +1,78 @@
+import time
+from typing import Any
+
+from fastapi.testclient import TestClient
+
+from rs_backend.idempotency import IdempotencyCache, StoredResponse
+
+
+def test_retried_story_is_saved_once(client: TestClient) -> None:
+    """Test that a retry with the same Idempotency-Key replays the first response."""
+    headers = {"Idempotency-Key": "story-123"}
+    first = client.post("/stories/", json={"content": "Retried story"}, headers=headers)
+    retry = client.post("/stories/", json={"content": "Retried story"}, headers=headers)
+
+    assert first.status_code == retry.status_code == 200
+    assert retry.json() == first.json()
+    assert retry.headers["Idempotent-Replayed"] == "true"
+    assert "Idempotent-Replayed" not in first.headers
+
+    stories: list[dict[str, Any]] = client.get("/stories/").json()
+    assert [s["content"] for s in stories].count("Retried story") == 1
+
+
+def test_key_reused_with_different_body_is_rejected(client: TestClient) -> None:
+    """Test that a key seen with another payload gets 422 instead of a replay."""
+    headers = {"Idempotency-Key": "story-456"}
+    client.post("/stories/", json={"content": "First story"}, headers=headers)
+    reused = client.post("/stories/", json={"content": "Other story"}, headers=headers)
+
+    assert reused.status_code == 422
+    assert "Idempotent-Replayed" not in reused.headers
+    contents = [s["content"] for s in client.get("/stories/").json()]
+    assert contents == ["First story"]
+
+
+def test_distinct_keys_and_no_key_are_not_deduplicated(client: TestClient) -> None:
+    """Test that different keys, or no key, each reach the backend."""
+    payload = {"organization": "relief society"}
+    client.post("/ministering/", json=payload, headers={"Idempotency-Key": "a"})
+    client.post("/ministering/", json=payload, headers={"Idempotency-Key": "b"})
+    client.post("/ministering/", json=payload)
+    client.post("/ministering/", json=payload)
+
+    report: dict[str, Any] = client.get("/ministering/reports").json()
+    assert report["total_events"] == 4
+
+
+def test_failed_request_is_not_replayed(client: TestClient) -> None:
+    """Test that an error response is not stored, so a corrected retry goes through."""
+    headers = {"Idempotency-Key": "answers-1"}
+    failed = client.post(
+        "/missionary-experience/",
+        json={"organization": "relief society", "answers": []},
+        headers=headers,
+    )
+    assert failed.status_code == 400
+
+    retry = client.post(
+        "/missionary-experience/",
+        json={"organization": "relief society", "answers": [{"question_id": 1}]},
+        headers=headers,
+    )
+    assert retry.status_code == 200
+    assert retry.json() == {"saved": 1}
+
+
+def test_cache_evicts_lru_and_expired_entries() -> None:
+    """Test the cache's size bound and TTL."""
+    cache = IdempotencyCache(max_entries=2, ttl_seconds=60)
+    now = time.monotonic()
+    for key in ("a", "b", "c"):
+        cache.put(key, StoredResponse(200, {}, key.encode(), now))
+    assert cache.get("a") is None
+    assert cache.get("b") is not None
+    assert len(cache) == 2
+
+    cache.put("old", StoredResponse(200, {}, b"", now - 120))
+    assert cache.get("old") is None
@@ -0,0 +1,127 @@
+from typing import Any
+
+from fastapi.testclient import TestClient
+
+
+def test_ingest_batch_mixed_items(client: TestClient) -> None:
+    """Test that a mixed batch lands in every dataset with client timestamps."""
+    response = client.post(
+        "/ingest/batch",
+        json={
+            "items": [
+                {
+                    "type": "story",
+                    "client_timestamp": "2026-01-04T17:05:00Z",
+                    "content": "Offline story",
+                },
+                {
+                    "type": "ministering_event",
+                    "client_timestamp": "2026-01-04T17:01:00Z",
+                    "organization": "relief society",
+                },
+                {
+                    "type": "ministering_event",
+                    "client_timestamp": "2026-01-04T10:00:00-07:00",
+                    "organization": "elders quorum",
+                },
+                {
+                    "type": "missionary_experience",
+                    "client_timestamp": "2026-01-04T17:02:00",
+                    "organization": "young womens",
+                    "answers": [
+                        {"question_id": 2},
+                        {"question_id": 15, "other_text": "Shared a hymn"},
+                    ],
+                },
+            ]
+        },
+    )
+    assert response.status_code == 200
+    assert response.json() == {
+        "saved": {"ministering_events": 2, "missionary_experiences": 2, "stories": 1}
+    }
+
+    ministering: dict[str, Any] = client.get("/ministering/reports").json()
+    assert ministering["counts_by_org"] == {"relief society": 1, "elders quorum": 1}
+
+    stories: list[dict[str, Any]] = client.get("/stories/").json()
+    assert stories == [
+        {"datetime_submitted": "2026-01-04 17:05:00 UTC", "content": "Offline story"}
+    ]
+
+    export = client.get(
+        "/export/missionary_experiences", params={"format": "ndjson"}
+    ).text
+    assert "Shared a hymn" in export
+    assert "2026-01-04 17:02:00 UTC" in export
+
+    # Rows are appended in client-timestamp order (17:00 UTC before 17:01 UTC)
+    export = client.get("/export/ministering_events").text.splitlines()
+    assert export[1:] == [
+        "2026-01-04 17:00:00 UTC,elders quorum",
+        "2026-01-04 17:01:00 UTC,relief society",
+    ]
+
+
+def test_ingest_batch_is_all_or_nothing(client: TestClient) -> None:
+    """Test that one invalid item rejects the whole batch."""
+    response = client.post(
+        "/ingest/batch",
+        json={
+            "items": [
+                {
+                    "type": "ministering_event",
+                    "client_timestamp": "2026-01-04T17:01:00Z",
+                    "organization": "relief society",
+                },
+                {
+                    "type": "missionary_experience",
+                    "client_timestamp": "2026-01-04T17:02:00Z",
+                    "organization": "relief society",
+                    "answers": [{"question_id": 99}],
+                },
+                {
+                    "type": "missionary_experience",
+                    "client_timestamp": "2026-01-04T17:03:00Z",
+                    "organization": "relief society",
+                    "answers": [],
+                },
+            ]
+        },
+    )
+    assert response.status_code == 400
+    assert response.json()["detail"] == [
+        "items[1]: unknown question_id: 99",
+        "items[2]: at least one answer must be selected.",
+    ]
+    assert client.get("/ministering/reports").json()["total_events"] == 0
+
+
+def test_ingest_batch_clamps_future_timestamps(client: TestClient) -> None:
+    """Test that a device clock running ahead can't post-date submissions."""
+    response = client.post(
+        "/ingest/batch",
+        json={
+            "items": [
+                {
+                    "type": "story",
+                    "client_timestamp": "2999-01-01T00:00:00Z",
+                    "content": "From the future",
+                }
+            ]
+        },
+    )
+    assert response.status_code == 200
+    stories: list[dict[str, Any]] = client.get("/stories/").json()
+    assert not stories[0]["datetime_submitted"].startswith("2999")
+
+
+def test_ingest_batch_rejects_unknown_item_type(client: TestClient) -> None:
+    """Test that items are validated against the discriminated union."""
+    response = client.post(
+        "/ingest/batch",
+        json={
+            "items": [{"type": "survey", "client_timestamp": "2026-01-04T17:01:00Z"}]
+        },
+    )
+    assert response.status_code == 422
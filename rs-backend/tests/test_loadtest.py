@@ -0,0 +1,62 @@
+import json
+import random
+from pathlib import Path
+
+from rs_backend.cli import main
+from rs_backend.loadtest import BurstProfile, Sample, summarize
+
+
+def test_burst_profile_peaks_after_rise() -> None:
+    """Test that arrivals concentrate around the peak of the burst."""
+    profile = BurstProfile(
+        duration_s=100, peak_rps=50, base_rps=0, rise_s=10, decay_s=10
+    )
+    arrivals = profile.arrival_times(random.Random(0))
+
+    early = sum(1 for t in arrivals if 5 <= t < 25)
+    late = sum(1 for t in arrivals if 80 <= t < 100)
+    assert early > 10 * max(late, 1)
+    assert arrivals == sorted(arrivals)
+
+
+def test_summarize_finds_saturation_point() -> None:
+    """Test that the first window breaching the latency SLO is reported."""
+    profile = BurstProfile(duration_s=30)
+    samples = [Sample(offset, "story_post", 200, 0.05) for offset in (1, 2, 3)]
+    samples += [Sample(10 + i / 10, "story_post", 200, 2.0) for i in range(50)]
+    samples += [Sample(21, "report_read", None, 0.0, "client_overload")]
+
+    summary = summarize(samples, profile, window_s=10, slo_p95_ms=1000)
+    assert summary["saturation"] == {
+        "start_s": 10,
+        "offered_rps": 5.0,
+        "reason": "p95_latency",
+    }
+    assert summary["max_sustained_rps"] == 0.3
+    assert summary["error_kinds"] == {"client_overload": 1}
+    assert summary["per_operation"]["story_post"]["errors"] == 0
+
+
+def test_loadtest_command_against_in_process_app(temp_data_dir: Path) -> None:
+    """Test a short burst against the app served in-process on the CSV backend."""
+    output = temp_data_dir / "loadtest.json"
+
+    exit_code = main(
+        [
+            "loadtest",
+            "--duration",
+            "2",
+            "--peak-rps",
+            "20",
+            "--window",
+            "1",
+            "--output",
+            str(output),
+        ]
+    )
+    assert exit_code == 0
+
+    summary = json.loads(output.read_text())
+    assert summary["overall"]["requests"] > 0
+    assert summary["overall"]["errors"] == 0
+    assert len(summary["windows"]) == 2
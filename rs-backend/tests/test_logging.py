@@ -0,0 +1,53 @@
+import json
+import logging
+
+import pytest
+from fastapi.testclient import TestClient
+from loguru import logger
+
+from rs_backend.logger import setup_logging
+
+
+def test_json_logging_writes_json_lines(capfd: pytest.CaptureFixture[str]) -> None:
+    """Test that JSON mode emits one parseable JSON object per record."""
+    setup_logging("json")
+    try:
+        logging.getLogger("rs_backend.tests").warning("from stdlib")
+        logger.bind(request_id="abc").info("from loguru")
+        logger.complete()
+        output = capfd.readouterr().out
+    finally:
+        setup_logging()
+
+    records = [json.loads(line)["record"] for line in output.splitlines()]
+    messages = {record["message"]: record for record in records}
+    assert messages["from stdlib"]["level"]["name"] == "WARNING"
+    assert messages["from loguru"]["extra"]["request_id"] == "abc"
+
+
+def test_request_id_header(client: TestClient) -> None:
+    """Test that request IDs are generated, or propagated from the client."""
+    first = client.get("/ministering/reports").headers["X-Request-ID"]
+    second = client.get("/ministering/reports").headers["X-Request-ID"]
+    assert first != second
+
+    response = client.get("/ministering/reports", headers={"X-Request-ID": "client-42"})
+    assert response.headers["X-Request-ID"] == "client-42"
+
+    for unsafe in ("forged\nINFO admin logged in", "x" * 129, "a b"):
+        response = client.get("/ministering/reports", headers={"X-Request-ID": unsafe})
+        assert response.headers["X-Request-ID"] != unsafe
+        assert response.headers["X-Request-ID"].startswith(first.split("-")[0])
+
+
+def test_access_log_sampling(client: TestClient) -> None:
+    """Test that a zero sample rate drops access lines for successful requests."""
+    client.app.state.settings.access_log_sample_rate = 0.0
+    messages: list[str] = []
+    sink_id = logger.add(lambda message: messages.append(message.record["message"]))
+    try:
+        client.get("/ministering/reports")
+    finally:
+        logger.remove(sink_id)
+
+    assert not any(m.startswith("Request") for m in messages)
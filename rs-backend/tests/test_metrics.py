@@ -0,0 +1,107 @@
+import shutil
+import threading
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+from rs_backend.metrics import (
+    SERVICE_CALL_DURATION,
+    SERVICE_CALL_ERRORS,
+    Counter,
+    Histogram,
+    instrument_service,
+)
+from rs_backend.schemas.enums import Dataset
+from rs_backend.services.base import SurveyDataService
+from rs_backend.services.csv_service import CSVService
+
+
+def test_metrics_endpoint_reports_route_latency(client: TestClient) -> None:
+    """Test that /metrics exposes a latency histogram per route template."""
+    client.post("/stories/", json={"content": "Counted story"})
+    client.get("/stories/")
+
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    body = response.text
+    assert "# TYPE rs_http_request_duration_seconds histogram" in body
+    assert (
+        'rs_http_request_duration_seconds_count{method="POST",route="/stories/",status="200"}'
+        in body
+    )
+    assert 'route="/stories/",status="200",le="+Inf"}' in body
+
+
+def test_idempotency_cache_hit_ratio(client: TestClient) -> None:
+    """Test that cache lookups show up as hit/miss counters and a ratio gauge."""
+    headers = {"Idempotency-Key": "metrics-test"}
+    client.post("/stories/", json={"content": "Once"}, headers=headers)
+    client.post("/stories/", json={"content": "Once"}, headers=headers)
+
+    body = client.get("/metrics").text
+    assert 'rs_cache_requests_total{cache="idempotency",result="hit"}' in body
+    assert 'rs_cache_hit_ratio{cache="idempotency"}' in body
+
+
+def test_instrumented_service_records_calls_and_errors(temp_data_dir: Path) -> None:
+    """Test per-method latency and error counting on a wrapped service."""
+    service = CSVService(data_dir=temp_data_dir)
+    instrument_service(service, "csv-test", SurveyDataService.__abstractmethods__)
+
+    service.get_stories()
+    list(service.iter_dataset_rows(Dataset.STORIES))
+    shutil.rmtree(temp_data_dir)
+    with pytest.raises(FileNotFoundError):
+        service.save_story("2026-01-04 17:00:00 UTC", "Lost story")
+
+    rendered = "\n".join(SERVICE_CALL_DURATION.render())
+    assert 'backend="csv-test",method="get_stories"' in rendered
+    assert 'backend="csv-test",method="iter_dataset_rows"' in rendered
+    assert (
+        SERVICE_CALL_ERRORS.values()[("csv-test", "save_story", "FileNotFoundError")]
+        == 1
+    )
+
+
+def test_counter_and_histogram_merge_thread_shards() -> None:
+    """Test that values recorded from several threads are summed at render."""
+    counter = Counter("test_total", "Test counter.", ("kind",))
+    histogram = Histogram("test_seconds", "Test histogram.", buckets=(0.1, 1.0))
+
+    def record() -> None:
+        for _ in range(100):
+            counter.inc("a")
+            histogram.observe(0.5)
+
+    threads = [threading.Thread(target=record) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert counter.values() == {("a",): 400.0}
+    lines = histogram.render()
+    assert 'test_seconds_bucket{le="0.1"} 0' in lines
+    assert 'test_seconds_bucket{le="1"} 400' in lines
+    assert "test_seconds_count 400" in lines
+
+
+def test_exited_threads_shards_are_folded_into_a_retired_total() -> None:
+    """Test that thread churn keeps totals but does not grow the shard list."""
+    counter = Counter("test_churn_total", "Test counter.")
+    histogram = Histogram("test_churn_seconds", "Test histogram.", buckets=(1.0,))
+    counter.inc()  # this thread stays alive
+
+    for _ in range(20):
+        thread = threading.Thread(
+            target=lambda: (counter.inc(), histogram.observe(0.5))
+        )
+        thread.start()
+        thread.join()
+
+    assert len(counter._shards) == 1
+    assert histogram._shards == []
+    assert counter.values() == {(): 21.0}
+    assert "test_churn_seconds_count 20" in histogram.render()
@@ -0,0 +1,139 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+from rs_backend.main import create_app
+from rs_backend.metrics import PRECOMPUTE_REFRESH_ERRORS
+from rs_backend.precompute import PrecomputeScheduler
+from rs_backend.schemas.enums import Organization
+from rs_backend.services.csv_service import CSVService
+from rs_backend.settings import Settings
+
+
+def test_scheduler_refreshes_soon_after_writes_and_when_idle(
+    temp_data_dir: Path,
+) -> None:
+    """Test the adaptive cadence: quick after a write, slow otherwise."""
+    CSVService.init(data_dir=temp_data_dir)
+    service = CSVService(data_dir=temp_data_dir)
+
+    async def scenario() -> None:
+        scheduler = PrecomputeScheduler(
+            service, active_interval_seconds=0.01, idle_interval_seconds=0.2
+        )
+        await scheduler.refresh()
+        assert scheduler.views.ministering.total_events == 0
+        task = asyncio.create_task(scheduler.run())
+
+        service.save_ministering_event(
+            "2026-01-05 17:00:00 UTC", Organization.RELIEF_SOCIETY
+        )
+        scheduler.note_write()
+        await asyncio.sleep(0.1)
+        assert scheduler.views.ministering.total_events == 1
+
+        # Written behind the scheduler's back: only the idle refresh sees it
+        service.save_ministering_event(
+            "2026-01-06 17:00:00 UTC", Organization.RELIEF_SOCIETY
+        )
+        await asyncio.sleep(0.05)
+        assert scheduler.views.ministering.total_events == 1
+        await asyncio.sleep(0.3)
+        assert scheduler.views.ministering.total_events == 2
+        task.cancel()
+
+    asyncio.run(scenario())
+
+
+def test_failed_refresh_keeps_previous_views(temp_data_dir: Path) -> None:
+    """Test that a backend error leaves the last good views in place."""
+    CSVService.init(data_dir=temp_data_dir)
+    service = CSVService(data_dir=temp_data_dir)
+    scheduler = PrecomputeScheduler(
+        service, active_interval_seconds=0, idle_interval_seconds=1
+    )
+    asyncio.run(scheduler.refresh())
+    views = scheduler.views
+
+    def broken() -> None:
+        raise RuntimeError("backend down")
+
+    service.get_stories = broken
+    errors_before = PRECOMPUTE_REFRESH_ERRORS.values().get((), 0)
+    asyncio.run(scheduler.refresh())
+    assert scheduler.views is views
+    assert PRECOMPUTE_REFRESH_ERRORS.values()[()] == errors_before + 1
+
+
+def test_handlers_serve_precomputed_views(client: TestClient) -> None:
+    """Test that reports and the story list come from the views without touching storage."""
+    client.post("/ministering/", json={"organization": "relief society"})
+    client.post("/stories/", json={"content": "older"})
+    app = client.app
+    scheduler = PrecomputeScheduler(
+        app.state.survey_data_service,
+        active_interval_seconds=0,
+        idle_interval_seconds=60,
+    )
+    asyncio.run(scheduler.refresh())
+    app.state.precompute = scheduler
+
+    def unavailable() -> None:
+        raise AssertionError("storage read on the request path")
+
+    service = app.state.survey_data_service
+    service.get_ministering_reports = unavailable
+    service.get_missionary_experience_report = unavailable
+    service.get_stories = unavailable
+
+    assert client.get("/ministering/reports").json()["total_events"] == 1
+    assert client.get("/missionary-experience/reports").json()["total_answers"] == 0
+    assert [story["content"] for story in client.get("/stories/").json()] == ["older"]
+
+
+def test_writers_read_their_writes_while_others_get_the_published_views(
+    temp_data_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test read-your-writes for the writer only, and bounded staleness for everyone."""
+    monkeypatch.setenv("RS_SURVEY__CSV_DATA_DIR", str(temp_data_dir))
+    monkeypatch.setenv("RS_SURVEY__PRECOMPUTE_ENABLED", "true")
+    monkeypatch.setenv("RS_SURVEY__PRECOMPUTE_ACTIVE_INTERVAL_SECONDS", "60")
+    writer = {"X-Device-Token": "writer"}
+    reader = {"X-Device-Token": "reader"}
+
+    with TestClient(create_app()) as client:
+        scheduler = client.app.state.precompute
+        client.post(
+            "/ministering/", json={"organization": "relief society"}, headers=writer
+        )
+        client.post("/stories/", json={"content": "just now"}, headers=writer)
+
+        # The writer sees its own writes before the refresh...
+        report = client.get("/ministering/reports", headers=writer).json()
+        assert report["total_events"] == 1
+        stories = client.get("/stories/", headers=writer).json()
+        assert [story["content"] for story in stories] == ["just now"]
+        # ...while other readers keep getting the published views
+        assert (
+            client.get("/ministering/reports", headers=reader).json()["total_events"]
+            == 0
+        )
+        assert client.get("/stories/", headers=reader).json() == []
+
+        client.portal.call(scheduler.refresh)
+        assert scheduler.views_for("device:writer").ministering.total_events == 1
+        assert (
+            client.get("/ministering/reports", headers=reader).json()["total_events"]
+            == 1
+        )
+
+        # Views older than the staleness bound are not served to anyone
+        scheduler.max_staleness_seconds = 0
+        assert scheduler.views_for("device:reader") is None
+
+
+def test_precompute_is_off_by_default() -> None:
+    """Test that background refreshes (and their storage reads) are opt-in."""
+    assert Settings().precompute_enabled is False
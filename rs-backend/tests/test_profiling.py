@@ -0,0 +1,94 @@
+import threading
+import time
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+from pydantic import SecretStr
+
+from rs_backend.metrics import instrument_service
+
+
+def _enable_profiling(client: TestClient, output_dir: Path) -> None:
+    settings = client.app.state.settings
+    settings.profiling_enabled = True
+    settings.admin_token = SecretStr("s3cret")
+    settings.profiling_output_dir = output_dir
+
+
+def test_profiled_request_writes_collapsed_stacks(
+    client: TestClient, temp_data_dir: Path
+) -> None:
+    """Test that a request with a valid token is profiled and still answered."""
+    _enable_profiling(client, temp_data_dir / "profiles")
+    client.post("/stories/", json={"content": "Profiled story"})
+
+    response = client.get("/stories/", headers={"X-Profile-Token": "s3cret"})
+    assert response.status_code == 200
+    assert response.json()[0]["content"] == "Profiled story"
+
+    profile_file = temp_data_dir / "profiles" / response.headers["X-Profile-File"]
+    assert profile_file.exists()
+    for line in profile_file.read_text().splitlines():
+        stack, count = line.rsplit(" ", 1)
+        assert int(count) > 0
+        assert ";" in stack
+
+
+def test_profile_can_be_returned(client: TestClient, temp_data_dir: Path) -> None:
+    """Test that X-Profile-Return swaps the response body for the profile."""
+    _enable_profiling(client, temp_data_dir / "profiles")
+
+    response = client.get(
+        "/ministering/reports",
+        headers={"X-Profile-Token": "s3cret", "X-Profile-Return": "1"},
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert response.headers["X-Profiled-Status"] == "200"
+
+
+def test_profiling_requires_setting_and_token(
+    client: TestClient, temp_data_dir: Path
+) -> None:
+    """Test that profiling stays off without the setting or with a wrong token."""
+    response = client.get("/ministering/reports", headers={"X-Profile-Token": "s3cret"})
+    assert "X-Profile-File" not in response.headers
+
+    _enable_profiling(client, temp_data_dir / "profiles")
+    response = client.get("/ministering/reports", headers={"X-Profile-Token": "wrong"})
+    assert "X-Profile-File" not in response.headers
+
+
+def test_profile_samples_only_the_request_threads(
+    client: TestClient, temp_data_dir: Path
+) -> None:
+    """Test that storage calls handed to a worker are sampled and unrelated threads are not."""
+    _enable_profiling(client, temp_data_dir / "profiles")
+    client.app.state.settings.profiling_interval_ms = 1
+    service = client.app.state.survey_data_service
+
+    def slow_get_stories():
+        time.sleep(0.1)
+        return []
+
+    service.get_stories = slow_get_stories
+    instrument_service(service, backend="csv", methods=frozenset({"get_stories"}))
+
+    stop = threading.Event()
+
+    def unrelated_busy_work() -> None:
+        while not stop.is_set():
+            sum(range(1000))
+
+    busy = threading.Thread(target=unrelated_busy_work, name="unrelated")
+    busy.start()
+    try:
+        response = client.get(
+            "/stories/", headers={"X-Profile-Token": "s3cret", "X-Profile-Return": "1"}
+        )
+    finally:
+        stop.set()
+        busy.join()
+
+    assert "slow_get_stories" in response.text
+    assert "unrelated" not in response.text
@@ -0,0 +1,93 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from rs_backend.rate_limit import SlidingWindowRateLimiter, parse_rate
+
+
+def test_parse_rate() -> None:
+    """Test rate specs and rejection of malformed ones."""
+    assert parse_rate("20/minute") == (20, 60.0)
+    assert parse_rate("5/second") == (5, 1.0)
+    with pytest.raises(ValueError):
+        parse_rate("20 per minute")
+
+
+def test_sliding_window_weights_previous_window() -> None:
+    """Test that the previous window's count decays as the window slides."""
+    limiter = SlidingWindowRateLimiter(max_keys=10)
+    for _ in range(4):
+        assert (
+            limiter.hit("/stories/", "a", limit=4, window_seconds=60, now=30.0) is None
+        )
+    # Current window is full: wait for it to end
+    assert limiter.hit(
+        "/stories/", "a", limit=4, window_seconds=60, now=45.0
+    ) == pytest.approx(15)
+
+    # 15s into the next window, 3 of the 4 previous hits still count
+    assert limiter.hit("/stories/", "a", limit=4, window_seconds=60, now=75.0) is None
+    retry_after = limiter.hit("/stories/", "a", limit=4, window_seconds=60, now=75.0)
+    assert retry_after == pytest.approx(15)
+
+    # Other clients and routes are counted separately
+    assert limiter.hit("/stories/", "b", limit=4, window_seconds=60, now=75.0) is None
+    assert (
+        limiter.hit("/ministering/", "a", limit=4, window_seconds=60, now=75.0) is None
+    )
+
+
+def test_limiter_memory_is_bounded() -> None:
+    """Test that the least recently seen clients are evicted."""
+    limiter = SlidingWindowRateLimiter(max_keys=2)
+    limiter.hit("/stories/", "a", limit=1, window_seconds=60, now=0.0)
+    limiter.hit("/stories/", "b", limit=1, window_seconds=60, now=0.0)
+    limiter.hit("/stories/", "c", limit=1, window_seconds=60, now=0.0)
+    assert len(limiter) == 2
+    # "a" was forgotten, so it starts afresh
+    assert limiter.hit("/stories/", "a", limit=1, window_seconds=60, now=0.0) is None
+
+
+def test_over_limit_submission_gets_429(client: TestClient) -> None:
+    """Test that a client over its limit is rejected while other clients still submit."""
+    client.app.state.rate_limits["/stories/"] = (2, 60.0)
+    device = {"X-Device-Token": "phone-1"}
+    for _ in range(2):
+        assert (
+            client.post("/stories/", json={"content": "hi"}, headers=device).status_code
+            == 200
+        )
+
+    response = client.post("/stories/", json={"content": "hi"}, headers=device)
+    assert response.status_code == 429
+    assert int(response.headers["Retry-After"]) >= 1
+
+    other = {"X-Device-Token": "phone-2"}
+    assert (
+        client.post("/stories/", json={"content": "hi"}, headers=other).status_code
+        == 200
+    )
+    # Reads are never limited
+    assert client.get("/stories/", headers=device).status_code == 200
+
+    metrics = client.get("/metrics").text
+    assert 'rs_rate_limited_total{route="/stories/"} 1' in metrics
+    # Two devices plus the per-IP backstop for device tokens
+    assert 'rs_cache_entries{cache="rate_limiter"} 3' in metrics
+
+
+def test_rotating_device_tokens_hit_the_per_ip_backstop(client: TestClient) -> None:
+    """Test that a new random token per request still gets 429 from the same IP."""
+    client.app.state.rate_limits["/stories/"] = (2, 60.0)
+    client.app.state.settings.rate_limit_device_ip_factor = 3
+
+    statuses = [
+        client.post(
+            "/stories/",
+            json={"content": "hi"},
+            headers={"X-Device-Token": f"rotated-{i}"},
+        ).status_code
+        for i in range(8)
+    ]
+    assert statuses == [200] * 6 + [429] * 2
+    # Rejected requests leave no per-token entries behind
+    assert len(client.app.state.rate_limiter) == 7
@@ -0,0 +1,173 @@
+import json
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+from rs_backend.main import create_app
+from rs_backend.schemas.enums import Dataset, Organization
+from rs_backend.services.base import SurveyDataService
+from rs_backend.services.csv_service import CSVService
+from rs_backend.services.report_snapshot import ReportSnapshotService
+
+
+def _csv_service(data_dir: Path) -> CSVService:
+    CSVService.init(data_dir=data_dir)
+    return CSVService(data_dir=data_dir)
+
+
+def test_csv_reads_rows_since_byte_offset(temp_data_dir: Path) -> None:
+    """Test that CSV positions are byte offsets and match the full-scan default."""
+    inner = _csv_service(temp_data_dir)
+    inner.save_ministering_event("2026-01-05 17:00:00 UTC", Organization.ELDERS_QUORUM)
+    rows, position = inner.read_rows_since(Dataset.MINISTERING_EVENTS, 0)
+    assert rows == [["2026-01-05 17:00:00 UTC", "elders quorum"]]
+
+    inner.save_ministering_event("2026-01-06 17:00:00 UTC", Organization.RELIEF_SOCIETY)
+    rows, position = inner.read_rows_since(Dataset.MINISTERING_EVENTS, position)
+    assert rows == [["2026-01-06 17:00:00 UTC", "relief society"]]
+    assert inner.read_rows_since(Dataset.MINISTERING_EVENTS, position) == ([], position)
+
+    # The base implementation counts rows instead of bytes
+    rows, position = SurveyDataService.read_rows_since(
+        inner, Dataset.MINISTERING_EVENTS, 1
+    )
+    assert (rows, position) == ([["2026-01-06 17:00:00 UTC", "relief society"]], 2)
+
+
+def test_csv_reads_whole_records_with_embedded_newlines(temp_data_dir: Path) -> None:
+    """Test that a quoted newline does not split a record, and a partial one waits."""
+    inner = _csv_service(temp_data_dir)
+    dataset = Dataset.MISSIONARY_EXPERIENCES
+    inner.save_missionary_experience_answer(
+        "2026-01-05 17:00:00 UTC", Organization.ELDERS_QUORUM, 3, "reach\nout"
+    )
+    rows, position = inner.read_rows_since(dataset, 0)
+    assert rows == [["2026-01-05 17:00:00 UTC", "elders quorum", "3", "reach\nout"]]
+
+    shard = inner._shard_file(dataset, Organization.ELDERS_QUORUM)
+    with open(shard, "a", newline="") as f:
+        f.write('2026-01-06 17:00:00 UTC,elders quorum,4,"first line\n')
+    assert inner.read_rows_since(dataset, position) == ([], position)
+    with open(shard, "a", newline="") as f:
+        f.write('second line"\r\n')
+    rows, position = inner.read_rows_since(dataset, position)
+    assert rows == [
+        ["2026-01-06 17:00:00 UTC", "elders quorum", "4", "first line\nsecond line"]
+    ]
+    assert position[shard.name] == shard.stat().st_size
+
+
+def test_reports_match_full_scan_and_pick_up_other_writers(temp_data_dir: Path) -> None:
+    """Test that incremental reports equal the CSV reports, including rows written elsewhere."""
+    inner = _csv_service(temp_data_dir)
+    service = ReportSnapshotService(
+        inner, temp_data_dir / "snapshot.json", source="csv:test"
+    )
+    service.save_ministering_event(
+        "2026-01-05 17:00:00 UTC", Organization.ELDERS_QUORUM
+    )
+    service.save_missionary_experience_answer(
+        "2026-01-05 17:00:00 UTC", Organization.ELDERS_QUORUM, 3, "reach out"
+    )
+    # Another worker appends straight to storage
+    inner.save_ministering_event("2026-01-06 17:00:00 UTC", Organization.RELIEF_SOCIETY)
+
+    assert service.get_ministering_reports() == inner.get_ministering_reports()
+    assert (
+        service.get_missionary_experience_report()
+        == inner.get_missionary_experience_report()
+    )
+    assert service.get_ministering_reports().total_events == 2
+
+
+def test_snapshot_warm_starts_and_reads_only_new_rows(temp_data_dir: Path) -> None:
+    """Test that a restart loads the snapshot and counts only rows added after it."""
+    inner = _csv_service(temp_data_dir)
+    path = temp_data_dir / "snapshot.json"
+    service = ReportSnapshotService(inner, path, source="csv:test")
+    for _ in range(3):
+        service.save_ministering_event(
+            "2026-01-05 17:00:00 UTC", Organization.ELDERS_QUORUM
+        )
+    service.get_ministering_reports()
+    service.save()
+    saved = json.loads(path.read_text())
+    assert saved["positions"]["ministering_events"]
+
+    inner.save_ministering_event("2026-01-06 17:00:00 UTC", Organization.ELDERS_QUORUM)
+    reads: list[int] = []
+    read_rows_since = inner.read_rows_since
+
+    def tracking_read(dataset: Dataset, position: int) -> tuple[list[list[str]], int]:
+        rows, new_position = read_rows_since(dataset, position)
+        reads.append(len(rows))
+        return rows, new_position
+
+    inner.read_rows_since = tracking_read
+    restarted = ReportSnapshotService(inner, path, source="csv:test")
+    assert reads == [1, 0]
+    assert restarted.get_ministering_reports().counts_by_org == {"elders quorum": 4}
+
+
+def test_snapshot_from_other_storage_is_ignored(temp_data_dir: Path) -> None:
+    """Test that counts saved for different storage are not reused."""
+    inner = _csv_service(temp_data_dir)
+    path = temp_data_dir / "snapshot.json"
+    service = ReportSnapshotService(inner, path, source="csv:test")
+    service.save_ministering_event(
+        "2026-01-05 17:00:00 UTC", Organization.ELDERS_QUORUM
+    )
+    service.get_ministering_reports()
+    service.save()
+
+    other = _csv_service(temp_data_dir / "other")
+    assert ReportSnapshotService(
+        other, path, source="csv:other"
+    ).get_ministering_reports() == (other.get_ministering_reports())
+
+
+def test_shutdown_snapshot_counts_writes_through_the_app(
+    temp_data_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that the snapshot saved at shutdown covers writes no report has read yet."""
+    path = temp_data_dir / "snapshot.json"
+    monkeypatch.setenv("RS_SURVEY__CSV_DATA_DIR", str(temp_data_dir / "data"))
+    monkeypatch.setenv("RS_SURVEY__STORY_LOG_DIR", str(temp_data_dir / "stories"))
+    monkeypatch.setenv("RS_SURVEY__REPORT_SNAPSHOT_PATH", str(path))
+    monkeypatch.setenv("RS_SURVEY__PRECOMPUTE_ENABLED", "false")
+
+    with TestClient(create_app()) as client:
+        for org in ("relief society", "relief society", "elders quorum"):
+            assert (
+                client.post("/ministering/", json={"organization": org}).status_code
+                == 200
+            )
+
+    saved = json.loads(path.read_text())
+    assert saved["positions"]["ministering_events"]
+    counts = {
+        (dataset, dimension, key): count
+        for dataset, dimension, key, count in saved["counts"]
+    }
+    assert counts[("ministering_events", "total", "")] == 3
+    assert counts[("ministering_events", "org", "relief society")] == 2
+
+
+def test_snapshot_is_skipped_under_shared_counters(
+    temp_data_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that shared counters, which answer every report, replace the snapshot."""
+    path = temp_data_dir / "snapshot.json"
+    monkeypatch.setenv("RS_SURVEY__CSV_DATA_DIR", str(temp_data_dir / "data"))
+    monkeypatch.setenv("RS_SURVEY__REPORT_SNAPSHOT_PATH", str(path))
+    monkeypatch.setenv(
+        "RS_SURVEY__SHARED_COUNTERS_PATH", str(temp_data_dir / "counters")
+    )
+    monkeypatch.setenv("RS_SURVEY__PRECOMPUTE_ENABLED", "false")
+
+    with TestClient(create_app()) as client:
+        client.post("/ministering/", json={"organization": "elders quorum"})
+        assert client.get("/ministering/reports").json()["total_events"] == 1
+
+    assert not path.exists()
@@ -0,0 +1,54 @@
+import gzip
+import json
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+
+from rs_backend.precompute import compute_views
+from rs_backend.questions import QUESTIONS
+from rs_backend.schemas.enums import Organization
+from rs_backend.services.csv_service import CSVService
+
+
+def test_questions_served_pre_encoded_with_gzip(client: TestClient) -> None:
+    """Test that the static question list is gzipped only for clients that accept it."""
+    plain = client.get(
+        "/missionary-experience/questions", headers={"Accept-Encoding": "identity"}
+    )
+    assert "content-encoding" not in plain.headers
+    assert plain.json() == [question.model_dump() for question in QUESTIONS]
+
+    compressed = client.get(
+        "/missionary-experience/questions", headers={"Accept-Encoding": "br, gzip"}
+    )
+    assert compressed.headers["content-encoding"] == "gzip"
+    assert compressed.headers["vary"] == "Accept-Encoding"
+    assert compressed.content == plain.content
+
+    refused = client.get(
+        "/missionary-experience/questions", headers={"Accept-Encoding": "gzip;q=0"}
+    )
+    assert "content-encoding" not in refused.headers
+
+
+def test_unchanged_views_reuse_encoded_bytes(temp_data_dir: Path) -> None:
+    """Test that responses are only re-encoded for views whose data changed."""
+    CSVService.init(data_dir=temp_data_dir)
+    service = CSVService(data_dir=temp_data_dir)
+    service.save_story("2026-01-05 17:00:00 UTC", "a story " * 100)
+    first = compute_views(service)
+    assert (
+        gzip.decompress(first.responses["stories"].gzipped)
+        == first.responses["stories"].body
+    )
+
+    service.save_ministering_event(
+        "2026-01-06 17:00:00 UTC", Organization.ELDERS_QUORUM
+    )
+    second = compute_views(service, first)
+    assert second.responses["stories"] is first.responses["stories"]
+    assert (
+        second.responses["missionary_experience"]
+        is first.responses["missionary_experience"]
+    )
+    assert json.loads(second.responses["ministering"].body)["total_events"] == 1
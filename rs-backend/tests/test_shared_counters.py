@@ -0,0 +1,121 @@
+from pathlib import Path
+
+from rs_backend.schemas.enums import Dataset, Organization
+from rs_backend.services.csv_service import CSVService
+from rs_backend.services.shared_counters import SharedCounters, SharedCounterService
+
+
+def test_counters_are_shared_between_mappings(temp_data_dir: Path) -> None:
+    """Test that two mappings of the same file (two workers) see each other's writes."""
+    path = temp_data_dir / "counters"
+    worker_a = SharedCounters(path)
+    worker_b = SharedCounters(path)
+
+    worker_a.increment({"ministering_events:total": 2})
+    worker_b.increment({"ministering_events:total": 1, "stories:total": 5})
+
+    assert worker_a.snapshot("ministering_events:") == {"ministering_events:total": 3}
+    assert worker_b.snapshot() == {"ministering_events:total": 3, "stories:total": 5}
+
+    worker_a.close()
+    worker_b.close()
+
+
+def test_catch_up_seeds_once_then_counts_from_recorded_positions(
+    temp_data_dir: Path,
+) -> None:
+    """Test that workers share read positions, and other storage reseeds the counters."""
+    path = temp_data_dir / "counters"
+    worker_a = SharedCounters(path)
+    worker_b = SharedCounters(path)
+    seen: list[dict] = []
+
+    def count_since(positions: dict) -> tuple[dict[str, int], dict]:
+        seen.append(positions)
+        return {"ministering_events:total": 4}, {"ministering_events": 4}
+
+    assert worker_a.catch_up("csv:a", count_since) is True
+    assert worker_b.catch_up("csv:a", count_since) is False
+    assert seen == [{}, {"ministering_events": 4}]
+    assert worker_b.snapshot() == {"ministering_events:total": 8}
+
+    assert worker_b.catch_up("csv:b", count_since) is True
+    assert seen[-1] == {}
+    assert worker_a.snapshot() == {"ministering_events:total": 4}
+
+    worker_a.close()
+    worker_b.close()
+
+
+def test_shared_counter_service_matches_storage_scan(temp_data_dir: Path) -> None:
+    """Test that reports from the counters match a full scan of the CSV files."""
+    csv_service = CSVService(data_dir=temp_data_dir)
+    # Existing rows are picked up by seeding
+    csv_service.save_ministering_event(
+        "2026-01-04 17:00:00 UTC", Organization.RELIEF_SOCIETY
+    )
+
+    path = temp_data_dir / "counters"
+    worker_a = SharedCounterService(
+        csv_service, SharedCounters(path), source="csv:test"
+    )
+    worker_b = SharedCounterService(
+        csv_service, SharedCounters(path), source="csv:test"
+    )
+
+    worker_a.save_ministering_event(
+        "2026-01-04 17:01:00 UTC", Organization.ELDERS_QUORUM
+    )
+    worker_b.save_ministering_event(
+        "2026-01-04 17:02:00 UTC", Organization.RELIEF_SOCIETY
+    )
+    worker_a.save_missionary_experience_answer(
+        "2026-01-04 17:03:00 UTC", Organization.YOUNG_WOMENS, 2, "give someone a ride"
+    )
+    worker_b.save_missionary_experience_answer(
+        "2026-01-04 17:04:00 UTC", Organization.YOUNG_WOMENS, 3, "reach out"
+    )
+
+    assert worker_b.get_ministering_reports() == csv_service.get_ministering_reports()
+    assert (
+        worker_a.get_missionary_experience_report()
+        == csv_service.get_missionary_experience_report()
+    )
+    report = worker_a.get_missionary_experience_report()
+    assert report.total_answers == 2
+    assert report.counts_by_org == {"young womens": 2}
+    assert report.counts_by_question == {2: 1, 3: 1}
+
+    worker_a.counters.close()
+    worker_b.counters.close()
+
+
+def test_counters_pick_up_rows_written_around_them(temp_data_dir: Path) -> None:
+    """Test that rows stored without the counters are counted once, on the next catch-up."""
+    csv_service = CSVService(data_dir=temp_data_dir)
+    path = temp_data_dir / "counters"
+    worker = SharedCounterService(csv_service, SharedCounters(path), source="csv:test")
+
+    # e.g. rs-backend migrate, or another tool appending to the CSV files
+    csv_service.append_dataset_rows(
+        Dataset.MINISTERING_EVENTS,
+        [
+            ["2026-01-04 17:00:00 UTC", "primary"],
+            ["2026-01-04 17:01:00 UTC", "primary"],
+        ],
+    )
+    worker.save_ministering_event("2026-01-04 17:02:00 UTC", Organization.ELDERS_QUORUM)
+    assert worker.get_ministering_reports() == csv_service.get_ministering_reports()
+    assert worker.get_ministering_reports().total_events == 3
+    worker.counters.close()
+
+    # A restart catches up rows written while no worker was running
+    csv_service.save_ministering_event(
+        "2026-01-05 17:00:00 UTC", Organization.YOUNG_MENS
+    )
+    restarted = SharedCounterService(
+        csv_service, SharedCounters(path), source="csv:test"
+    )
+    assert restarted.get_ministering_reports() == csv_service.get_ministering_reports()
+    assert restarted.get_ministering_reports().total_events == 4
+    restarted.counters.close()
@@ -2,6 +2,9 @@ from typing import Any
 
 from fastapi.testclient import TestClient
 
+from rs_backend.schemas.story import Story
+from rs_backend.search import StoryIndex
+
 
 def test_post_story(client: TestClient) -> None:
     """Test posting a story."""
@@ -17,7 +20,7 @@ def test_post_story(client: TestClient) -> None:
     # Verify datetime format: YYYY-MM-DD HH:MM:SS UTC
     assert " UTC" in data["datetime_submitted"]
     assert len(data["datetime_submitted"]) == 23  # Format: "YYYY-MM-DD HH:MM:SS UTC"
-    
+
     # Verify the story was actually saved by checking get_stories
     get_response = client.get("/stories/")
     assert get_response.status_code == 200
@@ -44,20 +47,20 @@ def test_get_stories(client: TestClient) -> None:
     client.post("/stories/", json={"content": "First story"})
     client.post("/stories/", json={"content": "Second story"})
     client.post("/stories/", json={"content": "Third story"})
-    
+
     # Get all stories
     response = client.get("/stories/")
     assert response.status_code == 200
     data: list[dict[str, Any]] = response.json()
     assert isinstance(data, list)
     assert len(data) >= 3
-    
+
     # Verify all stories are returned
     contents = [story["content"] for story in data]
     assert "First story" in contents
     assert "Second story" in contents
     assert "Third story" in contents
-    
+
     # Verify structure
     for story in data:
         assert "datetime_submitted" in story
@@ -68,7 +71,7 @@ def test_get_stories_structure(client: TestClient) -> None:
     """Test that stories have the correct structure."""
     # Post a story to ensure we have data
     client.post("/stories/", json={"content": "Test story for structure"})
-    
+
     response = client.get("/stories/")
     assert response.status_code == 200
     data: list[dict[str, Any]] = response.json()
@@ -90,16 +93,16 @@ def test_post_multiple_stories_and_retrieve(client: TestClient) -> None:
         "Story two",
         "Story three",
     ]
-    
+
     for content in story_contents:
         response = client.post("/stories/", json={"content": content})
         assert response.status_code == 200
-    
+
     # Retrieve all stories
     response = client.get("/stories/")
     assert response.status_code == 200
     stories: list[dict[str, Any]] = response.json()
-    
+
     # Verify all stories are present
     retrieved_contents = [s["content"] for s in stories]
     for content in story_contents:
@@ -111,15 +114,77 @@ def test_stories_persist_across_requests(client: TestClient) -> None:
     # Post a story
     post_response = client.post("/stories/", json={"content": "Persistent story"})
     assert post_response.status_code == 200
-    
+
     # Get stories in first request
     get_response1 = client.get("/stories/")
     assert get_response1.status_code == 200
     stories1: list[dict[str, Any]] = get_response1.json()
     assert any(s["content"] == "Persistent story" for s in stories1)
-    
+
     # Get stories in second request (should still be there)
     get_response2 = client.get("/stories/")
     assert get_response2.status_code == 200
     stories2: list[dict[str, Any]] = get_response2.json()
     assert any(s["content"] == "Persistent story" for s in stories2)
+
+
+def test_search_stories(client: TestClient) -> None:
+    """Test full-text search with prefix matching and AND semantics."""
+    client.post("/stories/", json={"content": "We prayed for the missionaries."})
+    client.post("/stories/", json={"content": "My neighbor came to church with us."})
+    client.post("/stories/", json={"content": "Prayer helped me invite my neighbor."})
+
+    response = client.get("/stories/search", params={"q": "pray"})
+    assert response.status_code == 200
+    contents = [s["content"] for s in response.json()]
+    assert sorted(contents) == [
+        "Prayer helped me invite my neighbor.",
+        "We prayed for the missionaries.",
+    ]
+
+    response = client.get("/stories/search", params={"q": "neigh pray"})
+    assert [s["content"] for s in response.json()] == [
+        "Prayer helped me invite my neighbor."
+    ]
+
+    response = client.get("/stories/search", params={"q": "temple"})
+    assert response.json() == []
+
+
+def test_search_stories_ranks_exact_matches_first(client: TestClient) -> None:
+    """Test that an exact token outranks a prefix expansion."""
+    client.post("/stories/", json={"content": "A ride home after the activity."})
+    client.post("/stories/", json={"content": "We gave a friend a ride."})
+
+    response = client.get("/stories/search", params={"q": "ride"})
+    contents = [s["content"] for s in response.json()]
+    assert len(contents) == 2
+
+    client.post("/stories/", json={"content": "Rides to church every week."})
+    response = client.get("/stories/search", params={"q": "ride", "limit": 3})
+    contents = [s["content"] for s in response.json()]
+    assert contents[-1] == "Rides to church every week."
+
+
+def test_search_stories_requires_query(client: TestClient) -> None:
+    """Test that an empty query is rejected."""
+    response = client.get("/stories/search", params={"q": ""})
+    assert response.status_code == 422
+
+
+def test_story_index_prefix_search_after_build_and_add() -> None:
+    """Test that the batch-built and incrementally extended vocabulary stay sorted."""
+    index = StoryIndex(
+        [
+            Story(datetime_submitted=1767632400, content="We prayed together"),
+            Story(datetime_submitted=1767632401, content="A zebra and a prayer"),
+        ]
+    )
+    index.add(Story(datetime_submitted=1767632402, content="Prayerful pondering"))
+    assert index._vocabulary == sorted(index._vocabulary)
+    assert [story.content for story in index.search("pray")] == [
+        "Prayerful pondering",
+        "A zebra and a prayer",
+        "We prayed together",
+    ]
+    assert index.search("zzz") == []
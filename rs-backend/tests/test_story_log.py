@@ -0,0 +1,138 @@
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+
+from rs_backend.schemas.enums import Dataset
+from rs_backend.services.csv_service import CSVService
+from rs_backend.services.story_log import StoryLog, StoryLogService
+
+
+def test_log_reads_by_number_and_page(temp_data_dir: Path) -> None:
+    """Test random access, newest-first paging and zero-copy content views."""
+    log = StoryLog(temp_data_dir / "log")
+    for i in range(5):
+        assert log.append(f"2025-01-0{i + 1} 10:00:00 UTC", f"story {i} ✨") == i
+
+    assert len(log) == 5
+    assert log.story(2).content == "story 2 ✨"
+    content = log.content(4)
+    assert isinstance(content, memoryview)
+    assert bytes(content).decode() == "story 4 ✨"
+
+    assert [number for number, _ in log.page(2)] == [4, 3]
+    assert [number for number, _ in log.page(2, before=1)] == [0]
+    assert [story.content for story in log][:2] == ["story 0 ✨", "story 1 ✨"]
+    del content
+    log.close()
+
+
+def test_log_survives_reopen_and_drops_torn_records(temp_data_dir: Path) -> None:
+    """Test that a reopened log keeps complete records and drops a torn tail."""
+    directory = temp_data_dir / "log"
+    log = StoryLog(directory)
+    log.extend(
+        [("2025-01-01 10:00:00 UTC", "first"), ("2025-01-02 10:00:00 UTC", "second")]
+    )
+    log.close()
+
+    # Simulate a crash after the record bytes were written but the entry only partly
+    with open(directory / "stories.log", "ab") as f:
+        f.write(b"2025-01-03 10:00:00 UTCthird")
+    with open(directory / "stories.idx", "ab") as f:
+        f.write(b"\x00" * 5)
+
+    reopened = StoryLog(directory)
+    assert len(reopened) == 2
+    assert reopened.append("2025-01-04 10:00:00 UTC", "fourth") == 2
+    assert [story.content for story in reopened] == ["first", "second", "fourth"]
+    reopened.close()
+
+
+def test_service_seeds_once_and_logs_writes(temp_data_dir: Path) -> None:
+    """Test that the wrapped storage is copied in once and later writes go to both."""
+    CSVService.init(data_dir=temp_data_dir)
+    inner = CSVService(data_dir=temp_data_dir)
+    inner.save_story("2025-01-01 10:00:00 UTC", "existing")
+
+    service = StoryLogService(inner, StoryLog(temp_data_dir / "log"), "csv:test")
+    service.save_story("2025-01-02 10:00:00 UTC", "posted")
+    service.append_dataset_rows(
+        Dataset.STORIES, [["2025-01-03 10:00:00 UTC", "batched"]]
+    )
+    assert [story.content for story in service.get_stories()] == [
+        "existing",
+        "posted",
+        "batched",
+    ]
+    assert len(inner.get_stories()) == 3
+
+    # A second worker opening the same log does not seed it again
+    again = StoryLogService(inner, StoryLog(temp_data_dir / "log"), "csv:test")
+    assert len(again.get_stories()) == 3
+
+
+def test_service_catches_up_on_stories_stored_around_it(temp_data_dir: Path) -> None:
+    """Test that stories stored without the log reach it, each exactly once."""
+    CSVService.init(data_dir=temp_data_dir)
+    inner = CSVService(data_dir=temp_data_dir)
+    inner.save_story("2025-01-01 10:00:00 UTC", "existing")
+    service = StoryLogService(inner, StoryLog(temp_data_dir / "log"), "csv:test")
+
+    # e.g. `rs-backend migrate` or another tool writing to the storage directly
+    inner.save_story("2025-01-02 10:00:00 UTC", "migrated")
+    service.save_story("2025-01-03 10:00:00 UTC", "posted")
+    assert [story.content for story in service.get_stories()] == [
+        "existing",
+        "migrated",
+        "posted",
+    ]
+
+    inner.save_story("2025-01-04 10:00:00 UTC", "while stopped")
+    reopened = StoryLogService(inner, StoryLog(temp_data_dir / "log"), "csv:test")
+    assert [story.content for story in reopened.get_stories()][2:] == [
+        "posted",
+        "while stopped",
+    ]
+
+    # A crash after appending but before saving the state appends nothing twice
+    log = reopened.log
+    state = log._read_state()
+    inner.save_story("2025-01-05 10:00:00 UTC", "crashed")
+    log.append("2025-01-05 10:00:00 UTC", "crashed")
+    log._write_state(state)
+    assert not reopened._catch_up()
+    assert len(log) == 5
+
+    # A log built from other storage is emptied and reseeded
+    other = StoryLogService(inner, StoryLog(temp_data_dir / "log"), "csv:other")
+    assert [story.content for story in other.get_stories()] == [
+        "existing",
+        "migrated",
+        "posted",
+        "while stopped",
+        "crashed",
+    ]
+
+
+def test_page_and_content_endpoints(client: TestClient, temp_data_dir: Path) -> None:
+    """Test story paging and content by number, from the log and without one."""
+    for content in ("one", "two", "three"):
+        client.post("/stories/", json={"content": content})
+
+    page = client.get("/stories/page", params={"limit": 2}).json()
+    assert [story["content"] for story in page["stories"]] == ["three", "two"]
+    assert page["next_before"] == 1
+    assert client.get("/stories/0/content").text == "one"
+    assert client.get("/stories/9/content").status_code == 404
+
+    app = client.app
+    app.state.story_log = StoryLog(temp_data_dir / "log")
+    app.state.survey_data_service = StoryLogService(
+        app.state.survey_data_service, app.state.story_log, "csv:test"
+    )
+    client.post("/stories/", json={"content": "four"})
+    page = client.get("/stories/page", params={"limit": 2, "before": 3}).json()
+    assert [story["number"] for story in page["stories"]] == [2, 1]
+    response = client.get("/stories/3/content")
+    assert response.text == "four"
+    assert response.headers["content-type"] == "text/plain; charset=utf-8"
@@ -0,0 +1,110 @@
+import httpx
+import pytest
+
+from rs_backend.cli import main
+from rs_backend.fake_sheets import serve_fake_sheets
+from rs_backend.metrics import SHEETS_API_CALLS
+from rs_backend.schemas.enums import Dataset, Organization
+from rs_backend.services.sheets_service import SheetsService
+
+
+def _service(endpoint: str) -> SheetsService:
+    SheetsService.init(spreadsheet_id="fake", api_endpoint=endpoint)
+    return SheetsService(spreadsheet_id="fake", api_endpoint=endpoint)
+
+
+def _calls_made(before: dict) -> dict[str, int]:
+    return {
+        verb: count - before.get((verb,), 0)
+        for (verb,), count in SHEETS_API_CALLS.values().items()
+        if count != before.get((verb,), 0)
+    }
+
+
+def _summary_rows(endpoint: str) -> list[list[str]]:
+    response = httpx.get(f"{endpoint}v4/spreadsheets/fake/values/summary!A2:D")
+    return response.json().get("values", [])
+
+
+def test_writes_maintain_summary_worksheet() -> None:
+    """Test that every write updates per-org, per-question and per-week counts."""
+    with serve_fake_sheets() as endpoint:
+        service = _service(endpoint)
+        service.save_ministering_event(
+            "2026-01-05 17:00:00 UTC", Organization.RELIEF_SOCIETY
+        )
+        service.append_dataset_rows(
+            Dataset.MISSIONARY_EXPERIENCES,
+            [
+                ["2026-01-05 17:01:00 UTC", "elders quorum", "3", "reach out"],
+                ["2026-01-12 17:01:00 UTC", "elders quorum", "4", "invite"],
+            ],
+        )
+
+        rows = _summary_rows(endpoint)
+        assert ["ministering_events", "org", "relief society", "1"] in rows
+        assert ["missionary_experiences", "question", "4", "1"] in rows
+        assert ["missionary_experiences", "week", "2026-W02", "1"] in rows
+        assert ["missionary_experiences", "week", "2026-W03", "1"] in rows
+
+        # A report reads the summary range and nothing else
+        before = SHEETS_API_CALLS.values()
+        report = service.get_missionary_experience_report()
+        assert report.total_answers == 2
+        assert report.counts_by_question == {3: 1, 4: 1}
+        assert _calls_made(before) == {"spreadsheets.values.get": 1}
+        before = SHEETS_API_CALLS.values()
+        assert service.get_ministering_reports().total_events == 1
+        assert _calls_made(before) == {"spreadsheets.values.get": 1}
+
+
+def test_save_updates_summary_from_the_rows_it_appended() -> None:
+    """Test that a write reads no raw rows when its rows follow the summary's mark."""
+    with serve_fake_sheets() as endpoint:
+        service = _service(endpoint)
+        service.save_ministering_event(
+            "2026-01-05 17:00:00 UTC", Organization.RELIEF_SOCIETY
+        )
+
+        before = SHEETS_API_CALLS.values()
+        service.save_ministering_event(
+            "2026-01-06 17:00:00 UTC", Organization.ELDERS_QUORUM
+        )
+        # The append, then reading and writing the summary
+        assert _calls_made(before) == {
+            "spreadsheets.values.append": 1,
+            "spreadsheets.values.get": 1,
+            "spreadsheets.values.update": 1,
+        }
+        rows = _summary_rows(endpoint)
+        assert ["ministering_events", "rows", "", "2"] in rows
+        assert ["ministering_events", "org", "elders quorum", "1"] in rows
+
+
+def test_writes_count_rows_the_summary_missed(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that rows appended behind the summary's back are counted and rebuilt."""
+    with serve_fake_sheets() as endpoint:
+        service = _service(endpoint)
+        service.save_ministering_event(
+            "2026-01-05 17:00:00 UTC", Organization.RELIEF_SOCIETY
+        )
+
+        # Another writer appends raw rows without touching the summary
+        httpx.post(
+            f"{endpoint}v4/spreadsheets/fake/values/ministering_events!A:A:append",
+            json={"values": [["2026-01-06 17:00:00 UTC", "primary"]] * 3},
+        )
+        assert service.get_ministering_reports().total_events == 1
+
+        # The next write finds a gap after the summary's mark and reads it
+        service.save_ministering_event(
+            "2026-01-07 17:00:00 UTC", Organization.RELIEF_SOCIETY
+        )
+        report = service.get_ministering_reports()
+        assert report.total_events == 5
+        assert report.counts_by_org == {"relief society": 2, "primary": 3}
+
+        monkeypatch.setenv("RS_SURVEY__GOOGLE_SHEETS_API_ENDPOINT", endpoint)
+        assert main(["rebuild-summary", "--spreadsheet", "fake"]) == 0
+        assert ["ministering_events", "total", "", "5"] in _summary_rows(endpoint)
+        assert service.get_ministering_reports() == report
@@ -0,0 +1,55 @@
+from pathlib import Path
+from typing import Any
+
+from fastapi.testclient import TestClient
+
+LEGACY_CSV = """datetime_submitted,q_did_you_set_a_cfm_goal,q_did_you_make_progress_this_week,organization
+2026-01-05 01:10:13 UTC,no,yes,relief society
+2026-01-10 01:10:35 UTC,yes,yes,young womens
+2026-01-12 01:13:53 UTC,no,no,young mens
+2026-01-13 01:14:09 UTC,yes,,Young Mens
+"""
+
+
+def test_cfm_survey_history(client: TestClient, temp_data_dir: Path) -> None:
+    """Test yes-rates overall, by organization and by week."""
+    surveys_file = temp_data_dir / "surveys.csv"
+    surveys_file.write_text(LEGACY_CSV)
+    client.app.state.settings.survey_history_file = surveys_file
+
+    response = client.get("/history/cfm-survey")
+    assert response.status_code == 200
+    data: dict[str, Any] = response.json()
+
+    assert data["total_responses"] == 4
+    goal = "q_did_you_set_a_cfm_goal"
+    progress = "q_did_you_make_progress_this_week"
+    assert data["overall"][goal] == {"responses": 4, "yes": 2, "yes_rate": 0.5}
+    # The blank answer is excluded from the progress denominator
+    assert data["overall"][progress] == {"responses": 3, "yes": 2, "yes_rate": 0.6667}
+
+    assert data["by_organization"][goal]["young mens"] == {
+        "responses": 2,
+        "yes": 1,
+        "yes_rate": 0.5,
+    }
+    assert data["by_organization"][goal]["relief society"]["yes"] == 0
+
+    # Weeks are keyed by their Monday
+    assert list(data["by_week"][goal]) == ["2026-01-05", "2026-01-12"]
+    assert data["by_week"][goal]["2026-01-05"] == {
+        "responses": 2,
+        "yes": 1,
+        "yes_rate": 0.5,
+    }
+
+
+def test_cfm_survey_history_missing_file(
+    client: TestClient, temp_data_dir: Path
+) -> None:
+    """Test that a missing legacy file yields an empty report."""
+    client.app.state.settings.survey_history_file = temp_data_dir / "missing.csv"
+
+    response = client.get("/history/cfm-survey")
+    assert response.status_code == 200
+    assert response.json()["total_responses"] == 0
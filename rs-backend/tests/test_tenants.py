@@ -0,0 +1,103 @@
+import gc
+import time
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+from rs_backend.settings import Settings, TenantConfig
+from rs_backend.tenants import TenantRegistry
+
+
+def _settings(root: Path, **overrides) -> Settings:
+    tenants = {
+        slug: TenantConfig(csv_data_dir=root / slug)
+        for slug in ("oak-ward", "elm-ward", "ash-ward")
+    }
+    return Settings().model_copy(update={"tenants": tenants, **overrides})
+
+
+@pytest.fixture
+def ward_client(client: TestClient, temp_data_dir: Path) -> TestClient:
+    settings = _settings(temp_data_dir)
+    client.app.state.settings = settings
+    client.app.state.tenant_registry = TenantRegistry(settings)
+    return client
+
+
+def test_tenant_config_needs_one_backend() -> None:
+    """Test that a ward must name exactly one storage backend."""
+    with pytest.raises(ValueError):
+        TenantConfig()
+    with pytest.raises(ValueError):
+        TenantConfig(csv_data_dir=Path("x"), google_sheets_spreadsheet_id="abc")
+
+
+def test_wards_are_isolated(ward_client: TestClient) -> None:
+    """Test that path prefix and header route to separate ward storage."""
+    assert (
+        ward_client.post("/w/oak-ward/stories/", json={"content": "oak"}).status_code
+        == 200
+    )
+    response = ward_client.post(
+        "/stories/", json={"content": "elm"}, headers={"X-Ward": "elm-ward"}
+    )
+    assert response.status_code == 200
+
+    assert [s["content"] for s in ward_client.get("/w/oak-ward/stories/").json()] == [
+        "oak"
+    ]
+    assert [s["content"] for s in ward_client.get("/w/elm-ward/stories/").json()] == [
+        "elm"
+    ]
+    assert ward_client.get("/stories/").json() == []
+
+    search = ward_client.get("/w/elm-ward/stories/search", params={"q": "elm"}).json()
+    assert [s["content"] for s in search] == ["elm"]
+
+
+def test_unknown_ward_is_404(ward_client: TestClient) -> None:
+    """Test that an unconfigured ward slug is rejected."""
+    response = ward_client.get("/w/pine-ward/stories/")
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Unknown ward: pine-ward"
+
+
+def test_registry_evicts_least_recently_used(temp_data_dir: Path) -> None:
+    """Test that loaded wards are bounded and reloaded on demand."""
+    registry = TenantRegistry(_settings(temp_data_dir, tenant_max_active=2))
+    oak = registry.get("oak-ward")
+    registry.get("elm-ward")
+    assert registry.get("oak-ward") is oak  # now most recently used
+    registry.get("ash-ward")
+
+    assert len(registry) == 2
+    assert registry.get("oak-ward") is oak
+    assert registry.get("elm-ward") is not None  # reloaded after eviction
+    assert len(registry) == 2
+
+
+def test_unloaded_ward_closes_its_story_log_once_unused(temp_data_dir: Path) -> None:
+    """Test that unloading leaves a ward's story log open while it is still in use."""
+    registry = TenantRegistry(
+        _settings(
+            temp_data_dir, tenant_max_active=1, story_log_dir=temp_data_dir / "logs"
+        )
+    )
+    in_flight = registry.get("oak-ward")
+    oak_files = in_flight.story_log._close_files
+    elm_files = registry.get("elm-ward").story_log._close_files
+
+    # A request that loaded oak before it was unloaded can still write to it
+    assert oak_files.alive
+    in_flight.service.save_story(1767632400, "still writing")
+    assert [s.content for s in in_flight.service.get_stories()] == ["still writing"]
+    del in_flight
+    gc.collect()
+    assert not oak_files.alive  # closed once the last user let go
+
+    registry.settings.tenant_idle_seconds = 0
+    time.sleep(0.01)
+    registry.get("ash-ward")
+    gc.collect()
+    assert not elm_files.alive  # unloaded as idle, with no users left
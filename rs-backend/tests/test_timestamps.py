@@ -0,0 +1,51 @@
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+
+from rs_backend.schemas.story import Story
+from rs_backend.services.aggregates import iso_week
+from rs_backend.timestamps import format_timestamp, to_epoch
+
+JAN_5 = 1767632400  # 2026-01-05 17:00:00 UTC
+
+
+def test_stored_timestamps_accept_both_forms() -> None:
+    """Test that epoch integers and legacy formatted strings read back the same."""
+    assert (
+        to_epoch(JAN_5)
+        == to_epoch(str(JAN_5))
+        == to_epoch("2026-01-05 17:00:00 UTC")
+        == JAN_5
+    )
+    assert format_timestamp(JAN_5) == "2026-01-05 17:00:00 UTC"
+    assert iso_week(JAN_5) == iso_week("2026-01-05 17:00:00 UTC") == "2026-W02"
+    assert iso_week("not a time") is None
+
+    story = Story(datetime_submitted="2026-01-05 17:00:00 UTC", content="legacy")
+    assert story.datetime_submitted == JAN_5
+    assert story.model_dump_json() == (
+        '{"datetime_submitted":"2026-01-05 17:00:00 UTC","content":"legacy"}'
+    )
+
+
+def test_legacy_and_epoch_rows_sort_and_export_together(
+    client: TestClient, temp_data_dir: Path
+) -> None:
+    """Test that old string rows and new integer rows mix in sorting and date filters."""
+    with open(temp_data_dir / "stories.csv", "a") as f:
+        f.write("2026-01-06 09:00:00 UTC,legacy\n")
+        f.write(f"{JAN_5},older\n")
+    client.post("/stories/", json={"content": "newest"})
+
+    assert [story["content"] for story in client.get("/stories/").json()] == [
+        "newest",
+        "legacy",
+        "older",
+    ]
+    response = client.get(
+        "/export/stories", params={"since": "2026-01-05", "until": "2026-01-05"}
+    )
+    assert response.text.splitlines() == [
+        "datetime_submitted,content",
+        "2026-01-05 17:00:00 UTC,older",
+    ]
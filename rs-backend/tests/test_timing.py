@@ -0,0 +1,44 @@
+from fastapi.testclient import TestClient
+
+from rs_backend.timing import format_server_timing, span
+
+
+def _span_names(header: str) -> list[str]:
+    return [entry.split(";")[0].strip() for entry in header.split(",")]
+
+
+def test_report_has_server_timing_breakdown(client: TestClient) -> None:
+    """Test that report responses break down storage, encoding and total time."""
+    client.post("/ministering/", json={"organization": "relief society"})
+
+    response = client.get("/ministering/reports")
+    assert response.status_code == 200
+    assert response.json() == {
+        "total_events": 1,
+        "counts_by_org": {"relief society": 1},
+    }
+    names = _span_names(response.headers["Server-Timing"])
+    assert names == ["csv_scan", "encode", "total"]
+
+
+def test_stories_server_timing_includes_sort(client: TestClient) -> None:
+    """Test that the stories list reports its sort step."""
+    client.post("/stories/", json={"content": "Timed story"})
+
+    response = client.get("/stories/")
+    assert set(_span_names(response.headers["Server-Timing"])) == {
+        "csv_scan",
+        "sort",
+        "encode",
+        "total",
+    }
+
+
+def test_span_outside_request_is_noop() -> None:
+    """Test that spans do nothing without an active request."""
+    with span("anything"):
+        pass
+    assert (
+        format_server_timing({"sheets": 12.345, "total": 20})
+        == "sheets;dur=12.35, total;dur=20.00"
+    )